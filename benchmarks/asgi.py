@@ -0,0 +1,67 @@
+"""Minimal in-process ASGI client, so benchmarks measure the app and not a client."""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+from starlette.types import ASGIApp
+
+Headers = List[Tuple[bytes, bytes]]
+
+
+async def request(
+    app: ASGIApp,
+    method: str,
+    path: str,
+    params: Optional[Dict[str, Any]] = None,
+    form: Optional[Dict[str, Any]] = None,
+    headers: Optional[Headers] = None,
+) -> Tuple[int, bytes]:
+    body = urlencode(form).encode() if form else b""
+    request_headers: Headers = list(headers or [])
+    if form:
+        request_headers.append((b"content-type", b"application/x-www-form-urlencoded"))
+        request_headers.append((b"content-length", str(len(body)).encode()))
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": urlencode(params or {}).encode(),
+        "root_path": "",
+        "headers": request_headers,
+        "client": ("127.0.0.1", 50000),
+        "server": ("127.0.0.1", 8000),
+    }
+
+    status = 0
+    chunks: List[bytes] = []
+    received = False
+    finished = asyncio.Event()
+
+    async def receive() -> Dict[str, Any]:
+        nonlocal received
+        if not received:
+            received = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        # Like a server, only report a disconnect once the response is done.
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Dict[str, Any]) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                finished.set()
+
+    await app(scope, receive, send)
+
+    return status, b"".join(chunks)
@@ -0,0 +1,253 @@
+"""Drive the ASGI app in-process with concurrent clients and report latencies.
+
+Every endpoint of every simulated device is requested, grouped into endpoint
+classes that are measured one after another::
+
+    python -m benchmarks.asgi_load --concurrency 32 --requests 20000 \\
+        --output results.json
+
+The JSON written with ``--output`` can be compared between runs.
+"""
+
+import argparse
+import asyncio
+import datetime
+import itertools
+import json
+import platform
+import time
+from enum import Enum
+from typing import Any, Dict, List, NamedTuple, Optional, Type, get_type_hints
+
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from starlette.types import ASGIApp
+
+from python_alpaca_server.app import AlpacaServer, Description
+from python_alpaca_server.device import UrlDeviceType
+from python_alpaca_server.request import CommonRequest
+from python_alpaca_server.simulators import DEVICE_CLASSES, simulated_devices
+
+from .asgi import request
+
+COMMON_PARAMS = {"ClientID": 1, "ClientTransactionID": 1}
+
+
+class Endpoint(NamedTuple):
+    method: str
+    path: str
+    params: Dict[str, Any]
+    form: Optional[Dict[str, Any]]
+    status: int
+
+
+def _field_value(value_type: Any) -> Any:
+    if value_type is bool:
+        return "true"
+    if value_type is int:
+        return 0
+    if value_type is float:
+        return 1.5
+    if isinstance(value_type, type) and issubclass(value_type, Enum):
+        return next(iter(value_type)).value
+
+    return "simulated"
+
+
+def _request_values(request_model: Type[CommonRequest]) -> Dict[str, Any]:
+    values = dict(COMMON_PARAMS)
+    for name, value_type in get_type_hints(request_model).items():
+        if name not in CommonRequest.model_fields:
+            values[name] = _field_value(value_type)
+
+    return values
+
+
+def endpoint_classes(app: FastAPI, per_type: int) -> Dict[str, List[Endpoint]]:
+    """Group the device endpoints of ``app`` and the management ones.
+
+    ``app`` must use the per-endpoint routes. Their request models give each
+    endpoint's parameters, which PUTs send in the form body when the route
+    reads it and in the query string otherwise, as the route would.
+    """
+    url_device_types = sorted(UrlDeviceType[c.__name__].value for c in DEVICE_CLASSES)
+    classes: Dict[str, List[Endpoint]] = {
+        "property_get": [],
+        "form_put": [],
+        "management": [
+            Endpoint("GET", "/management/apiversions", COMMON_PARAMS, None, 200),
+            Endpoint("GET", "/management/v1/description", COMMON_PARAMS, None, 200),
+            Endpoint(
+                "GET", "/management/v1/configureddevices", COMMON_PARAMS, None, 200
+            ),
+        ],
+        "errors": [
+            # Unknown device number.
+            Endpoint("GET", "/api/v1/focuser/99/position", COMMON_PARAMS, None, 404),
+            # Unknown method.
+            Endpoint("GET", "/api/v1/focuser/0/unknown", COMMON_PARAMS, None, 404),
+            # Missing parameter.
+            Endpoint("PUT", "/api/v1/focuser/0/move", COMMON_PARAMS, None, 422),
+        ],
+    }
+
+    for route in app.routes:
+        if not isinstance(route, APIRoute) or not route.path.startswith("/api/v1/"):
+            continue
+
+        _, url_device_type, _, url_method = route.path.rsplit("/", 3)
+        if url_device_type == "{device_type}":
+            device_types = url_device_types
+        else:
+            device_types = [url_device_type]
+
+        body_params = route.dependant.body_params
+        (field,) = body_params or route.dependant.query_params
+        values = _request_values(field.field_info.annotation)
+
+        for device_type, number in itertools.product(device_types, range(per_type)):
+            path = f"/api/v1/{device_type}/{number}/{url_method}"
+            if "GET" in route.methods:
+                endpoint = Endpoint("GET", path, values, None, 200)
+                classes["property_get"].append(endpoint)
+            elif body_params:
+                endpoint = Endpoint("PUT", path, {}, values, 200)
+                classes["form_put"].append(endpoint)
+            else:
+                endpoint = Endpoint("PUT", path, values, None, 200)
+                classes["form_put"].append(endpoint)
+
+    return classes
+
+
+def _percentile(latencies: List[float], percentile: float) -> float:
+    index = min(len(latencies) - 1, int(len(latencies) * percentile / 100))
+    return latencies[index]
+
+
+async def run_class(
+    app: ASGIApp, endpoints: List[Endpoint], requests: int, concurrency: int
+) -> Dict[str, Any]:
+    pending = itertools.islice(itertools.cycle(endpoints), requests)
+    latencies: List[float] = []
+    unexpected = 0
+
+    async def client() -> None:
+        nonlocal unexpected
+
+        # All clients share the iterator, so exactly ``requests`` are sent.
+        for endpoint in pending:
+            start = time.perf_counter()
+            status, _ = await request(
+                app,
+                endpoint.method,
+                endpoint.path,
+                params=endpoint.params,
+                form=endpoint.form,
+            )
+            latencies.append(time.perf_counter() - start)
+
+            if status != endpoint.status:
+                unexpected += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+
+    return {
+        "endpoints": len(endpoints),
+        "requests": len(latencies),
+        "unexpected_status": unexpected,
+        "seconds": elapsed,
+        "throughput": len(latencies) / elapsed,
+        "p50_ms": _percentile(latencies, 50) * 1e3,
+        "p95_ms": _percentile(latencies, 95) * 1e3,
+        "p99_ms": _percentile(latencies, 99) * 1e3,
+    }
+
+
+async def run(
+    app: ASGIApp,
+    classes: Dict[str, List[Endpoint]],
+    requests: int,
+    concurrency: int,
+    warmup: int,
+) -> Dict[str, Dict[str, Any]]:
+    results = {}
+
+    for name, endpoints in classes.items():
+        await run_class(app, endpoints, warmup, concurrency)
+        results[name] = await run_class(app, endpoints, requests, concurrency)
+
+    return results
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=5000, help="per class")
+    parser.add_argument("--warmup", type=int, default=500, help="per class")
+    parser.add_argument("--per-type", type=int, default=1, help="devices per type")
+    parser.add_argument("--max-workers", type=int, default=None)
+    parser.add_argument("--single-route", action="store_true")
+    parser.add_argument("--metrics", action="store_true")
+    parser.add_argument("--output", help="write results to this JSON file")
+    args = parser.parse_args(argv)
+
+    description = Description(
+        ServerName="benchmark",
+        Manufacturer="benchmark",
+        ManufacturerVersion="1",
+        Location="here",
+    )
+    server = AlpacaServer(
+        description,
+        simulated_devices(args.per_type),
+        max_workers=args.max_workers,
+        single_route=args.single_route,
+        metrics=args.metrics,
+    )
+    app = server.create_app(8000)
+
+    # Both routing modes read parameters from the same place, so the
+    # per-endpoint routes tell what to send and where.
+    routes = AlpacaServer(description, simulated_devices(1)).create_app(8000)
+
+    try:
+        results = asyncio.run(
+            run(
+                app,
+                endpoint_classes(routes, args.per_type),
+                args.requests,
+                args.concurrency,
+                args.warmup,
+            )
+        )
+    finally:
+        server.dispatcher.shutdown()
+
+    for name, result in results.items():
+        print(
+            f"{name:<14} {result['throughput']:9.0f} req/s"
+            f"  p50 {result['p50_ms']:7.3f} ms"
+            f"  p95 {result['p95_ms']:7.3f} ms"
+            f"  p99 {result['p99_ms']:7.3f} ms"
+            f"  unexpected {result['unexpected_status']}"
+        )
+
+    if args.output:
+        report = {
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "config": vars(args),
+            "results": results,
+        }
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
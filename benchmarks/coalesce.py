@@ -0,0 +1,88 @@
+"""Poll one slow property from many clients with and without coalescing.
+
+Run with ``python -m benchmarks.coalesce``. A simulated focuser takes
+``--query-time`` seconds to read its position, and ``--clients`` dashboards
+poll it continuously. Reports requests served and driver calls made.
+"""
+
+import argparse
+import asyncio
+import time
+from typing import List, Optional, Tuple
+
+from python_alpaca_server.app import AlpacaServer, Description
+from python_alpaca_server.devices.focuser import Focuser
+from python_alpaca_server.request import CommonRequest
+from python_alpaca_server.simulators import simulated_class
+
+from .asgi import request
+
+
+class _Focuser(simulated_class(Focuser)):
+    def __init__(self, unique_id: str, query_time: float):
+        super().__init__(unique_id)
+        self.query_time = query_time
+        self.calls = 0
+
+    def get_position(self, req: CommonRequest) -> int:
+        self.calls += 1
+        time.sleep(self.query_time)
+        return 1000
+
+
+async def _poll(
+    clients: int, duration: float, query_time: float, window: Optional[float]
+) -> Tuple[float, float]:
+    description = Description(
+        ServerName="benchmark",
+        Manufacturer="benchmark",
+        ManufacturerVersion="1",
+        Location="here",
+    )
+    focuser = _Focuser("focuser", query_time)
+    server = AlpacaServer(description, [focuser], coalesce_window_ms=window)
+    app = server.create_app(8000, discovery=False)
+
+    served = 0
+    deadline = time.monotonic() + duration
+
+    async def client() -> None:
+        nonlocal served
+
+        while time.monotonic() < deadline:
+            status, _ = await request(app, "GET", "/api/v1/focuser/0/position")
+            assert status == 200
+            served += 1
+
+    start = time.monotonic()
+    await asyncio.gather(*(client() for _ in range(clients)))
+    elapsed = time.monotonic() - start
+    server.dispatcher.shutdown()
+
+    return served / elapsed, focuser.calls / elapsed
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=3.0)
+    parser.add_argument("--query-time", type=float, default=0.05)
+    parser.add_argument("--window-ms", type=float, default=250.0)
+    args = parser.parse_args(argv)
+
+    for label, window in (
+        ("off", None),
+        ("in flight", 0.0),
+        (f"{args.window_ms:g} ms", args.window_ms),
+    ):
+        requests_per_second, calls_per_second = asyncio.run(
+            _poll(args.clients, args.duration, args.query_time, window)
+        )
+        print(
+            f"{label:>10}: {requests_per_second:8.0f} requests/s,"
+            f" {calls_per_second:5.1f} driver calls/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
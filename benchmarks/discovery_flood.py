@@ -0,0 +1,91 @@
+"""Flood the discovery server and measure how much it delays the event loop.
+
+Run with ``python -m benchmarks.discovery_flood``. A separate process sends
+discovery packets to a server on a local test port as fast as it can. Event
+loop lag is measured the same way a stalled HTTP server would notice it: by
+how late a periodic timer fires.
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import socket
+import time
+from typing import List, Optional
+
+from python_alpaca_server.discovery import DiscoveryServer
+
+
+def _flood(port: int, seconds: float, sources: int) -> None:
+    socks = [socket.socket(socket.AF_INET, socket.SOCK_DGRAM) for _ in range(sources)]
+    for sock in socks:
+        sock.setblocking(False)
+
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        for sock in socks:
+            try:
+                sock.sendto(b"alpacadiscovery1", ("127.0.0.1", port))
+            except BlockingIOError:
+                pass
+
+
+def _percentile(values: List[float], percentile: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * percentile / 100))]
+
+
+async def run(port: int, seconds: float, sources: int, limit: bool) -> None:
+    server = DiscoveryServer(
+        http_port=8000,
+        port=port,
+        ipv6=False,
+    )
+    if not limit:
+        server.limiter = None
+
+    task = asyncio.ensure_future(server.start())
+    await asyncio.sleep(0.1)
+
+    flooder = multiprocessing.get_context("spawn").Process(
+        target=_flood, args=(port, seconds, sources)
+    )
+    flooder.start()
+
+    interval = 0.005
+    lags: List[float] = []
+    cpu = time.process_time()
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start - interval)
+
+    cpu = time.process_time() - cpu
+
+    flooder.join()
+    task.cancel()
+
+    print(
+        f"rate limit {'on ' if limit else 'off'}"
+        f"  responses {server.responses:8d}  dropped {server.dropped:8d}"
+        f"  loop lag p50 {_percentile(lags, 50) * 1e3:6.2f} ms"
+        f"  p99 {_percentile(lags, 99) * 1e3:6.2f} ms"
+        f"  max {max(lags) * 1e3:6.2f} ms"
+        f"  server cpu {cpu / seconds:4.0%}"
+    )
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=42227)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--sources", type=int, default=4, help="sending sockets")
+    args = parser.parse_args(argv)
+
+    for limit in (False, True):
+        asyncio.run(run(args.port, args.seconds, args.sources, limit))
+
+
+if __name__ == "__main__":
+    main()
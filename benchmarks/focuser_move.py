@@ -0,0 +1,132 @@
+"""Move a slow simulated focuser with a blocking PUT and with an operation.
+
+Run with ``python -m benchmarks.focuser_move``. The focuser takes
+``--move-time`` seconds to reach its target. The blocking driver waits inside
+``put_move``, while the other hands the wait to the server with
+``start_operation``. Reports how long the PUT, the ``ismoving`` polls during
+the move and a halt take, and what a poll returns after a failed move.
+"""
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+from typing import Dict, List, Optional
+
+from python_alpaca_server.app import AlpacaServer, Description
+from python_alpaca_server.devices.focuser import Focuser
+from python_alpaca_server.errors import DriverError
+from python_alpaca_server.request import CommonRequest, PutPositionRequest
+from python_alpaca_server.simulators import simulated_class
+
+from .asgi import request
+
+
+class _Focuser(simulated_class(Focuser)):
+    def __init__(self, unique_id: str, move_time: float, operation: bool):
+        super().__init__(unique_id)
+        self.move_time = move_time
+        self.operation = operation
+        self.moving = False
+        self.stopped = threading.Event()
+
+    def _wait(self, req: PutPositionRequest, stop: threading.Event) -> None:
+        # Stands in for polling the controller until it reports it stopped.
+        stop.wait(self.move_time)
+        self.moving = False
+        if req.Position < 0:
+            raise DriverError(req, "focuser stalled")
+
+    def put_move(self, req: PutPositionRequest) -> None:
+        self.moving = True
+        self.stopped.clear()
+
+        if self.operation:
+            # The server cancels the operation on a halt, which the wait
+            # sees without needing the focuser.
+            handle = self.start_operation(lambda: self._wait(req, handle.cancelled))
+        else:
+            self._wait(req, self.stopped)
+
+    def put_halt(self, req: CommonRequest) -> None:
+        self.stopped.set()
+
+    def get_ismoving(self, req: CommonRequest) -> bool:
+        return self.moving
+
+
+async def _move(move_time: float, operation: bool) -> Dict[str, float]:
+    description = Description(
+        ServerName="benchmark",
+        Manufacturer="benchmark",
+        ManufacturerVersion="1",
+        Location="here",
+    )
+    focuser = _Focuser("focuser", move_time, operation)
+    server = AlpacaServer(description, [focuser])
+    app = server.create_app(8000, discovery=False)
+    result: Dict[str, float] = {}
+
+    async def poll() -> List[float]:
+        latencies: List[float] = []
+        moving = True
+        while moving:
+            start = time.perf_counter()
+            status, body = await request(app, "GET", "/api/v1/focuser/0/ismoving")
+            latencies.append(time.perf_counter() - start)
+            moving = status == 200 and json.loads(body)["Value"]
+            await asyncio.sleep(0.01)
+
+        return latencies
+
+    async def move(position: int) -> float:
+        start = time.perf_counter()
+        await request(app, "PUT", "/api/v1/focuser/0/move", {"Position": position})
+        return time.perf_counter() - start
+
+    # A full move, polled until it is done.
+    moving = asyncio.ensure_future(move(1000))
+    await asyncio.sleep(0.005)
+    latencies = await poll()
+    result["put"] = await moving
+    result["poll_max"] = max(latencies)
+    result["polls"] = len(latencies)
+
+    # A move halted a tenth of the way in.
+    moving = asyncio.ensure_future(move(2000))
+    await asyncio.sleep(move_time / 10)
+    start = time.perf_counter()
+    await request(app, "PUT", "/api/v1/focuser/0/halt")
+    await poll()
+    result["halt"] = time.perf_counter() - start
+    await moving
+
+    # A move that fails, which the blocking driver reports from the PUT.
+    await move(-1)
+    await asyncio.sleep(move_time * 1.2)
+    _, body = await request(app, "GET", "/api/v1/focuser/0/ismoving")
+    result["error_number"] = json.loads(body).get("ErrorNumber", 0)
+
+    server.dispatcher.shutdown()
+    return result
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--move-time", type=float, default=1.0)
+    args = parser.parse_args(argv)
+
+    for label, operation in (("blocking", False), ("operation", True)):
+        result = asyncio.run(_move(args.move_time, operation))
+        print(
+            f"{label:>9}: PUT {result['put'] * 1e3:7.1f} ms,"
+            f" {result['polls']:3.0f} polls during the move"
+            f" (slowest {result['poll_max'] * 1e3:7.1f} ms),"
+            f" halted in {result['halt'] * 1e3:7.1f} ms,"
+            f" poll after a failed move: ErrorNumber {result['error_number']:#x}"
+        )
+
+
+if __name__ == "__main__":
+    main()
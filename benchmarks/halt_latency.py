@@ -0,0 +1,108 @@
+"""Time a halt sent to a focuser with a backlog of queued reads.
+
+Run with ``python -m benchmarks.halt_latency``. Each driver call of the
+simulated focuser takes ``--query-time`` seconds. ``--reads`` GETs spread over
+a few properties are queued behind one in progress, then a halt is sent.
+Reports how long the halt took against a FIFO queue's expected wait, and how
+many driver calls served the reads.
+"""
+
+import argparse
+import asyncio
+import time
+from typing import List, Optional, Tuple
+
+from python_alpaca_server.app import AlpacaServer, Description
+from python_alpaca_server.devices.focuser import Focuser
+from python_alpaca_server.request import CommonRequest
+from python_alpaca_server.simulators import simulated_class
+
+from .asgi import request
+
+PROPERTIES = ["position", "temperature", "ismoving", "tempcomp", "maxstep"]
+
+
+class _Focuser(simulated_class(Focuser)):
+    def __init__(self, unique_id: str, query_time: float):
+        super().__init__(unique_id)
+        self.query_time = query_time
+        self.calls = 0
+
+    def _query(self) -> None:
+        self.calls += 1
+        time.sleep(self.query_time)
+
+    def get_position(self, req: CommonRequest) -> int:
+        self._query()
+        return 1000
+
+    def get_temperature(self, req: CommonRequest) -> float:
+        self._query()
+        return 10.0
+
+    def get_ismoving(self, req: CommonRequest) -> bool:
+        self._query()
+        return True
+
+    def get_tempcomp(self, req: CommonRequest) -> bool:
+        self._query()
+        return False
+
+    def get_maxstep(self, req: CommonRequest) -> int:
+        self._query()
+        return 10000
+
+    def put_halt(self, req: CommonRequest) -> None:
+        self._query()
+
+
+async def _halt(reads: int, query_time: float) -> Tuple[float, float, int]:
+    description = Description(
+        ServerName="benchmark",
+        Manufacturer="benchmark",
+        ManufacturerVersion="1",
+        Location="here",
+    )
+    focuser = _Focuser("focuser", query_time)
+    server = AlpacaServer(description, [focuser])
+    app = server.create_app(8000, discovery=False)
+
+    backlog = [
+        asyncio.ensure_future(
+            request(app, "GET", f"/api/v1/focuser/0/{PROPERTIES[i % len(PROPERTIES)]}")
+        )
+        for i in range(reads + 1)
+    ]
+    # Let every read reach the device's queue.
+    await asyncio.sleep(query_time / 2)
+
+    start = time.perf_counter()
+    status, _ = await request(app, "PUT", "/api/v1/focuser/0/halt")
+    halted = time.perf_counter() - start
+    assert status == 200
+
+    start = time.perf_counter()
+    await asyncio.gather(*backlog)
+    drained = halted + time.perf_counter() - start
+
+    server.dispatcher.shutdown()
+    return halted, drained, focuser.calls - 1
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reads", type=int, default=100)
+    parser.add_argument("--query-time", type=float, default=0.01)
+    args = parser.parse_args(argv)
+
+    halted, drained, calls = asyncio.run(_halt(args.reads, args.query_time))
+    print(
+        f"halt behind {args.reads} queued reads: {halted * 1e3:.1f} ms"
+        f" (FIFO would wait about {args.reads * args.query_time * 1e3:.0f} ms),"
+        f" backlog done after {drained * 1e3:.0f} ms"
+        f" with {calls} driver calls for {args.reads + 1} reads"
+    )
+
+
+if __name__ == "__main__":
+    main()
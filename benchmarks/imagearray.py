@@ -0,0 +1,109 @@
+"""Time camera image downloads as ImageBytes and as JSON.
+
+Run with ``python -m benchmarks.imagearray``. A simulated camera returns a
+16-bit frame held in an ``array`` buffer, so NumPy is not needed. JSON is
+timed on a smaller frame since it grows to several bytes per pixel. Both
+report the time to the first body byte and the largest chunk sent.
+"""
+
+import argparse
+import array
+import asyncio
+import time
+from typing import List, Optional, Tuple
+
+from starlette.types import Message, Receive, Scope, Send
+
+from python_alpaca_server.app import AlpacaServer, Description
+from python_alpaca_server.devices.camera import Camera
+from python_alpaca_server.request import CommonRequest
+from python_alpaca_server.simulators import simulated_class
+
+from .asgi import request
+
+
+def _frame(width: int, height: int) -> memoryview:
+    count = width * height
+    pixels = array.array("H", range(1 << 16)) * (count // (1 << 16) + 1)
+    del pixels[count:]
+
+    return memoryview(pixels).cast("B").cast("H", (width, height))
+
+
+class _Camera(simulated_class(Camera)):
+    def __init__(self, unique_id: str, frame: memoryview):
+        super().__init__(unique_id)
+        self.frame = frame
+
+    def get_imagearray(self, req: CommonRequest) -> memoryview:
+        return self.frame
+
+
+async def _download(
+    width: int, height: int, accept: str
+) -> Tuple[float, float, int, int]:
+    description = Description(
+        ServerName="benchmark",
+        Manufacturer="benchmark",
+        ManufacturerVersion="1",
+        Location="here",
+    )
+    server = AlpacaServer(description, [_Camera("camera", _frame(width, height))])
+    app = server.create_app(8000, discovery=False)
+
+    first_byte = 0.0
+    largest_chunk = 0
+
+    async def timed_app(scope: Scope, receive: Receive, send: Send) -> None:
+        async def timed_send(message: Message) -> None:
+            nonlocal first_byte, largest_chunk
+
+            body = message.get("body", b"")
+            if message["type"] == "http.response.body" and body:
+                first_byte = first_byte or time.perf_counter()
+                largest_chunk = max(largest_chunk, len(body))
+
+            await send(message)
+
+        await app(scope, receive, timed_send)
+
+    start = time.perf_counter()
+    status, body = await request(
+        timed_app,
+        "GET",
+        "/api/v1/camera/0/imagearray",
+        {"ClientTransactionID": 1},
+        headers=[(b"accept", accept.encode())],
+    )
+    elapsed = time.perf_counter() - start
+
+    assert status == 200, body[:200]
+    return elapsed, first_byte - start, len(body), largest_chunk
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--width", type=int, default=9576)
+    parser.add_argument("--height", type=int, default=6388)
+    parser.add_argument("--json-width", type=int, default=2048)
+    parser.add_argument("--json-height", type=int, default=2048)
+    args = parser.parse_args(argv)
+
+    for label, width, height, accept in (
+        ("imagebytes", args.width, args.height, "application/imagebytes"),
+        ("json", args.json_width, args.json_height, "application/json"),
+    ):
+        elapsed, first_byte, size, largest_chunk = asyncio.run(
+            _download(width, height, accept)
+        )
+        pixels = width * height
+        print(
+            f"{label:>10}: {width}x{height} in {elapsed * 1e3:.0f} ms,"
+            f" first byte after {first_byte * 1e3:.1f} ms,"
+            f" {size / 1e6:.1f} MB, largest chunk {largest_chunk / 1e3:.0f} kB,"
+            f" {elapsed / pixels * 1e9:.1f} ns/pixel"
+        )
+
+
+if __name__ == "__main__":
+    main()
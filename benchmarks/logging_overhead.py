@@ -0,0 +1,89 @@
+"""Time log calls on the request path with structlog's defaults and configured.
+
+Run with ``python -m benchmarks.logging_overhead``. Reports the time the
+calling thread spends per call for a debug event below the level, an info
+event that is written, and a sampled event, with output going to
+``/dev/null``. Then times GETs through the app, which log ``looking for
+device`` on every request.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import time
+from typing import Callable, List, Optional
+
+import structlog
+
+from python_alpaca_server.app import AlpacaServer, Description
+from python_alpaca_server.log import configure_logging
+from python_alpaca_server.simulators import simulated_devices
+
+from .asgi import request
+
+
+def _per_call(calls: int, log: Callable[[int], None]) -> float:
+    start = time.perf_counter()
+    for i in range(calls):
+        log(i)
+
+    return (time.perf_counter() - start) / calls
+
+
+async def _requests_per_second(requests: int) -> float:
+    description = Description(
+        ServerName="benchmark",
+        Manufacturer="benchmark",
+        ManufacturerVersion="1",
+        Location="here",
+    )
+    server = AlpacaServer(description, simulated_devices())
+    app = server.create_app(8000, discovery=False)
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await request(app, "GET", "/api/v1/focuser/0/position")
+    elapsed = time.perf_counter() - start
+
+    server.dispatcher.shutdown()
+    return requests / elapsed
+
+
+def _run(label: str, calls: int, requests: int) -> None:
+    logger = structlog.get_logger("benchmark")
+
+    debug = _per_call(calls, lambda i: logger.debug("filtered", device_number=i))
+    info = _per_call(calls, lambda i: logger.info("written", device_number=i))
+    sampled = _per_call(
+        calls, lambda i: logger.info("looking for device", device_number=i)
+    )
+    requests_per_second = asyncio.run(_requests_per_second(requests))
+
+    print(
+        f"{label:>10}: debug below level {debug * 1e6:5.2f} us,"
+        f" info {info * 1e6:5.2f} us, sampled {sampled * 1e6:5.2f} us per call,"
+        f" {requests_per_second:6.0f} GETs/s"
+    )
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    with open(os.devnull, "w") as devnull:
+        structlog.configure(
+            logger_factory=structlog.PrintLoggerFactory(devnull),
+            wrapper_class=structlog.make_filtering_bound_logger(logging.NOTSET),
+        )
+        _run("defaults", args.calls, args.requests)
+
+        structlog.reset_defaults()
+        configure_logging("info", stream=devnull)
+        _run("configured", args.calls, args.requests)
+
+
+if __name__ == "__main__":
+    main()
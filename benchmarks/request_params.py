@@ -0,0 +1,73 @@
+"""Compare case-insensitive parameter normalization against the old per-field scan.
+
+Run with ``python -m benchmarks.request_params``.
+"""
+
+import argparse
+import timeit
+from typing import Any, Dict, List, Optional, Type
+
+from pydantic import BaseModel
+
+from python_alpaca_server.request import ActionRequest, CommonRequest, PutIdValueRequest
+
+
+def _scan_per_field(cls: Type[BaseModel], values: Dict[str, Any]):
+    # The implementation CommonRequest used before field names were precomputed.
+    for field in cls.model_fields:
+        in_fields = list(filter(lambda f: f.lower() == field.lower(), values.keys()))
+        for in_field in in_fields:
+            values[field] = values.pop(in_field)
+
+    return values
+
+
+def _bench(name: str, cls: Type[CommonRequest], params: Dict[str, Any], number: int):
+    validator = getattr(cls, "body_params_case_insensitive")
+
+    old = timeit.timeit(lambda: _scan_per_field(cls, dict(params)), number=number)
+    new = timeit.timeit(lambda: validator(dict(params)), number=number)
+    full = timeit.timeit(lambda: cls.model_validate(dict(params)), number=number)
+
+    print(
+        f"{name:<20} scan {old / number * 1e6:6.2f} us"
+        f"  map {new / number * 1e6:6.2f} us"
+        f"  ({old / new:4.1f}x)"
+        f"  full validation {full / number * 1e6:6.2f} us"
+    )
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--number", type=int, default=100_000, help="timed calls per model"
+    )
+    args = parser.parse_args(argv)
+
+    _bench(
+        "CommonRequest",
+        CommonRequest,
+        {"clienttransactionid": "12", "ClientID": "3"},
+        args.number,
+    )
+    _bench(
+        "PutIdValueRequest",
+        PutIdValueRequest,
+        {"clienttransactionid": "12", "clientid": "3", "id": "1", "value": "2.5"},
+        args.number,
+    )
+    _bench(
+        "ActionRequest",
+        ActionRequest,
+        {
+            "ClientTransactionID": "12",
+            "ClientID": "3",
+            "action": "reset",
+            "parameters": "all",
+        },
+        args.number,
+    )
+
+
+if __name__ == "__main__":
+    main()
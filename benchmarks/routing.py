@@ -0,0 +1,104 @@
+"""Compare per-endpoint routes with the single route per device type.
+
+Run with ``python -m benchmarks.routing``.
+"""
+
+import argparse
+import asyncio
+import time
+from typing import List, Optional, Tuple
+
+from starlette.routing import Match
+from starlette.types import ASGIApp
+
+from python_alpaca_server.app import AlpacaServer, Description
+from python_alpaca_server.simulators import simulated_devices
+
+from .asgi import request
+
+ENDPOINTS: List[Tuple[str, str]] = [
+    ("GET", "/api/v1/covercalibrator/0/brightness"),
+    ("GET", "/api/v1/dome/0/azimuth"),
+    ("GET", "/api/v1/dome/0/slewing"),
+    ("GET", "/api/v1/focuser/0/position"),
+    ("GET", "/api/v1/observingconditions/0/windspeed"),
+    ("GET", "/api/v1/rotator/0/position"),
+    ("GET", "/api/v1/switch/0/getswitchvalue"),
+    ("GET", "/api/v1/switch/0/connected"),
+    ("PUT", "/api/v1/dome/0/slewtoazimuth"),
+    ("PUT", "/api/v1/focuser/0/move"),
+]
+
+PARAMS = {"ClientTransactionID": 1, "ClientID": 1, "Id": 0}
+# Both PUTs are device endpoints, which read their parameters from the query.
+PUT_PARAMS = {"ClientTransactionID": 1, "ClientID": 1, "Azimuth": 10, "Position": 10}
+
+
+def _create_app(single_route: bool) -> ASGIApp:
+    description = Description(
+        ServerName="benchmark",
+        Manufacturer="benchmark",
+        ManufacturerVersion="1",
+        Location="here",
+    )
+    server = AlpacaServer(
+        description,
+        simulated_devices(per_type=4),
+        single_route=single_route,
+    )
+
+    return server.create_app(8000)
+
+
+def _match_time(app, number: int) -> float:
+    # Time only the linear route scan Starlette performs for every request.
+    routes = app.router.routes
+    scopes = [
+        {"type": "http", "method": method, "path": path, "root_path": ""}
+        for method, path in ENDPOINTS
+    ]
+
+    start = time.perf_counter()
+    for _ in range(number):
+        for scope in scopes:
+            for route in routes:
+                match, _ = route.matches(scope)
+                if match == Match.FULL:
+                    break
+
+    return (time.perf_counter() - start) / (number * len(scopes))
+
+
+async def _request_time(app: ASGIApp, number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        for method, path in ENDPOINTS:
+            if method == "GET":
+                status, _ = await request(app, method, path, params=PARAMS)
+            else:
+                status, _ = await request(app, method, path, params=PUT_PARAMS)
+
+            assert status == 200, (method, path, status)
+
+    return (time.perf_counter() - start) / (number * len(ENDPOINTS))
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=500, help="requests per endpoint")
+    args = parser.parse_args(argv)
+
+    for name, single_route in (("per-endpoint", False), ("single route", True)):
+        app = _create_app(single_route)
+        match = _match_time(app, args.number * 10)
+        total = asyncio.run(_request_time(app, args.number))
+
+        print(
+            f"{name:<14} routes {len(app.router.routes):4d}"
+            f"  match {match * 1e6:7.2f} us"
+            f"  request {total * 1e6:8.2f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
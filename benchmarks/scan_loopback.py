@@ -0,0 +1,106 @@
+"""Scan a set of local Alpaca servers with the discovery scanner.
+
+Run with ``python -m benchmarks.scan_loopback``. A separate process serves
+``--hosts`` servers, each with its own discovery responder on its own
+loopback address (127.0.0.2, 127.0.0.3, ...) and its own HTTP port. The
+scanner sends a discovery request to every address and reports how long it
+takes to inventory them all.
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import time
+from typing import List, Optional
+
+from python_alpaca_server.app import AlpacaServer, Description
+from python_alpaca_server.discovery import DiscoveryServer
+from python_alpaca_server.scanner import scan
+from python_alpaca_server.simulators import simulated_devices
+
+
+def _address(i: int) -> str:
+    return f"127.0.0.{i + 2}"
+
+
+async def _serve_hosts(hosts: int, http_port: int, discovery_port: int, ready):
+    import uvicorn
+
+    tasks = []
+    for i in range(hosts):
+        description = Description(
+            ServerName=f"host-{i}",
+            Manufacturer="benchmark",
+            ManufacturerVersion="1",
+            Location="here",
+        )
+        server = AlpacaServer(description, simulated_devices())
+        app = server.create_app(http_port + i, discovery=False)
+
+        config = uvicorn.Config(
+            app, host=_address(i), port=http_port + i, log_level="warning"
+        )
+        tasks.append(asyncio.ensure_future(uvicorn.Server(config).serve()))
+
+        discovery = DiscoveryServer(
+            http_port + i, port=discovery_port, address=_address(i), ipv6=False
+        )
+        tasks.append(asyncio.ensure_future(discovery.start()))
+
+    await asyncio.sleep(1.0)
+    ready.set()
+
+    await asyncio.gather(*tasks)
+
+
+def _run_hosts(hosts: int, http_port: int, discovery_port: int, ready):
+    asyncio.run(_serve_hosts(hosts, http_port, discovery_port, ready))
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hosts", type=int, default=40)
+    parser.add_argument("--http-port", type=int, default=18000)
+    parser.add_argument("--discovery-port", type=int, default=42230)
+    parser.add_argument("--timeout", type=float, default=0.2)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    context = multiprocessing.get_context("spawn")
+    ready = context.Event()
+    process = context.Process(
+        target=_run_hosts,
+        args=(args.hosts, args.http_port, args.discovery_port, ready),
+        daemon=True,
+    )
+    process.start()
+    ready.wait()
+
+    addresses = [_address(i) for i in range(args.hosts)]
+
+    try:
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            inventory = asyncio.run(
+                scan(
+                    timeout=args.timeout,
+                    addresses=addresses,
+                    ipv6=False,
+                    port=args.discovery_port,
+                )
+            )
+            elapsed = time.perf_counter() - start
+
+            errors = [i for i in inventory if i.error]
+            devices = sum(len(i.devices) for i in inventory)
+            print(
+                f"{len(inventory)} hosts, {devices} devices, {len(errors)} errors"
+                f" in {elapsed * 1e3:.0f} ms (discovery window"
+                f" {args.timeout * 1e3:.0f} ms)"
+            )
+    finally:
+        process.terminate()
+
+
+if __name__ == "__main__":
+    main()
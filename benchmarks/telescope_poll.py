@@ -0,0 +1,193 @@
+"""Poll a slow simulated mount's position with and without the position cache.
+
+Run with ``python -m benchmarks.telescope_poll``. Each driver call sleeps
+``--query-time`` seconds, like a mount controller behind a serial link,
+while ``--clients`` concurrent pollers read its coordinates. The cache's
+answers are compared with the simulated mount's true position.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import time
+from typing import Dict, List, Optional
+
+from python_alpaca_server.app import AlpacaServer, Description
+from python_alpaca_server.devices.telescope import Telescope
+from python_alpaca_server.request import CommonRequest
+from python_alpaca_server.simulators import simulated_class
+
+from .asgi import request
+
+SIDEREAL_RATIO = 1.00273790935
+LATITUDE = 45.0
+
+ENDPOINTS = ["rightascension", "declination", "altitude", "azimuth", "siderealtime"]
+
+
+class _Mount(simulated_class(Telescope)):
+    """Tracks a fixed target at the sidereal rate."""
+
+    def __init__(self, unique_id: str, query_time: float):
+        super().__init__(unique_id)
+        self.query_time = query_time
+        self.calls = 0
+        self.start = time.monotonic()
+
+    def _query(self) -> None:
+        self.calls += 1
+        time.sleep(self.query_time)
+
+    def truth(self, name: str) -> float:
+        sidereal_time = (
+            6.0 + (time.monotonic() - self.start) * SIDEREAL_RATIO / 3600.0
+        ) % 24.0
+        right_ascension, declination = 5.5, 20.0
+
+        ha = math.radians((sidereal_time - right_ascension) * 15.0)
+        dec, lat = math.radians(declination), math.radians(LATITUDE)
+        altitude = math.degrees(
+            math.asin(
+                math.sin(dec) * math.sin(lat)
+                + math.cos(dec) * math.cos(lat) * math.cos(ha)
+            )
+        )
+        azimuth = math.degrees(
+            math.atan2(
+                -math.cos(dec) * math.sin(ha),
+                math.sin(dec) * math.cos(lat)
+                - math.cos(dec) * math.sin(lat) * math.cos(ha),
+            )
+        )
+
+        return {
+            "get_rightascension": right_ascension,
+            "get_declination": declination,
+            "get_altitude": altitude,
+            "get_azimuth": azimuth % 360.0,
+            "get_siderealtime": sidereal_time,
+        }[name]
+
+    def get_rightascension(self, req: CommonRequest) -> float:
+        self._query()
+        return self.truth("get_rightascension")
+
+    def get_declination(self, req: CommonRequest) -> float:
+        self._query()
+        return self.truth("get_declination")
+
+    def get_altitude(self, req: CommonRequest) -> float:
+        self._query()
+        return self.truth("get_altitude")
+
+    def get_azimuth(self, req: CommonRequest) -> float:
+        self._query()
+        return self.truth("get_azimuth")
+
+    def get_siderealtime(self, req: CommonRequest) -> float:
+        self._query()
+        return self.truth("get_siderealtime")
+
+    def get_sitelatitude(self, req: CommonRequest) -> float:
+        self._query()
+        return LATITUDE
+
+    def get_slewing(self, req: CommonRequest) -> bool:
+        self._query()
+        return False
+
+    def get_tracking(self, req: CommonRequest) -> bool:
+        self._query()
+        return True
+
+    def get_rightascensionrate(self, req: CommonRequest) -> float:
+        return 0.0
+
+    def get_declinationrate(self, req: CommonRequest) -> float:
+        return 0.0
+
+
+async def _poll(
+    clients: int, duration: float, query_time: float, interval: Optional[float]
+) -> Dict[str, float]:
+    description = Description(
+        ServerName="benchmark",
+        Manufacturer="benchmark",
+        ManufacturerVersion="1",
+        Location="here",
+    )
+    mount = _Mount("mount", query_time)
+    server = AlpacaServer(description, [mount], position_interval=interval)
+    app = server.create_app(8000, discovery=False)
+
+    sampling = None
+    if server.positions is not None:
+        sampling = asyncio.ensure_future(
+            server.positions.run(server.devices, server.dispatcher)
+        )
+        # Let the first sample arrive before polling starts.
+        await asyncio.sleep(20 * query_time)
+
+    mount.calls = 0
+    served = 0
+    errors: Dict[str, List[float]] = {endpoint: [] for endpoint in ENDPOINTS}
+    deadline = time.monotonic() + duration
+
+    async def client(offset: int) -> None:
+        nonlocal served
+
+        i = offset
+        while time.monotonic() < deadline:
+            endpoint = ENDPOINTS[i % len(ENDPOINTS)]
+            i += 1
+
+            status, body = await request(app, "GET", f"/api/v1/telescope/0/{endpoint}")
+            value = json.loads(body)["Value"]
+            error = abs(value - mount.truth(f"get_{endpoint}"))
+            if endpoint in ("rightascension", "siderealtime"):
+                error = min(error, 24.0 - error) * 15.0
+            errors[endpoint].append(error * 3600.0)
+            served += 1
+
+    start = time.monotonic()
+    await asyncio.gather(*(client(i) for i in range(clients)))
+    elapsed = time.monotonic() - start
+
+    if sampling is not None:
+        sampling.cancel()
+    server.dispatcher.shutdown()
+
+    result = {
+        "requests_per_second": served / elapsed,
+        "driver_calls_per_second": mount.calls / elapsed,
+    }
+    for endpoint, values in errors.items():
+        values.sort()
+        result[endpoint] = values[int(len(values) * 0.99)] if values else 0.0
+
+    return result
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--query-time", type=float, default=0.02)
+    parser.add_argument("--interval", type=float, default=1.0)
+    args = parser.parse_args(argv)
+
+    for label, interval in (("driver", None), ("cache", args.interval)):
+        result = asyncio.run(
+            _poll(args.clients, args.duration, args.query_time, interval)
+        )
+        print(
+            f"{label:>6}: {result['requests_per_second']:8.0f} requests/s,"
+            f" {result['driver_calls_per_second']:5.1f} driver calls/s,"
+            " p99 error in arcsec: "
+            + ", ".join(f"{e} {result[e]:.2f}" for e in ENDPOINTS)
+        )
+
+
+if __name__ == "__main__":
+    main()
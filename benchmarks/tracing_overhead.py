@@ -0,0 +1,93 @@
+"""Time GETs with request tracing off, collected in memory and written to a file.
+
+Run with ``python -m benchmarks.tracing_overhead``. Requests go through the
+app in-process one at a time, and the mean time per span is printed from
+the traces collected in memory.
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from python_alpaca_server.app import AlpacaServer, Description
+from python_alpaca_server.simulators import simulated_devices
+from python_alpaca_server.tracing import Exporter, FileExporter, MemoryCollector
+
+from .asgi import request
+
+
+async def _requests_per_second(
+    requests: int, exporter: Optional[Exporter], single_route: bool
+) -> float:
+    description = Description(
+        ServerName="benchmark",
+        Manufacturer="benchmark",
+        ManufacturerVersion="1",
+        Location="here",
+    )
+    server = AlpacaServer(
+        description,
+        simulated_devices(),
+        single_route=single_route,
+        trace_exporter=exporter,
+    )
+    app = server.create_app(8000, discovery=False)
+
+    # Warm up the encoders and validators before timing.
+    for _ in range(100):
+        await request(app, "GET", "/api/v1/focuser/0/position")
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await request(app, "GET", "/api/v1/focuser/0/position")
+    elapsed = time.perf_counter() - start
+
+    server.dispatcher.shutdown()
+    return requests / elapsed
+
+
+def _span_means(collector: MemoryCollector) -> Dict[str, float]:
+    durations: Dict[str, List[int]] = defaultdict(list)
+    for span in collector.spans():
+        if "parentSpanId" in span:
+            durations[span["name"]].append(
+                int(span["endTimeUnixNano"]) - int(span["startTimeUnixNano"])
+            )
+
+    return {name: sum(d) / len(d) / 1e3 for name, d in durations.items()}
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--single-route", action="store_true")
+    args = parser.parse_args(argv)
+
+    collector = MemoryCollector(max_traces=args.requests)
+    with tempfile.TemporaryDirectory() as directory:
+        file_exporter = FileExporter(os.path.join(directory, "traces.jsonl"))
+
+        for label, exporter in (
+            ("off", None),
+            ("memory", collector),
+            ("file", file_exporter),
+        ):
+            requests_per_second = asyncio.run(
+                _requests_per_second(args.requests, exporter, args.single_route)
+            )
+            print(f"{label:>6}: {requests_per_second:6.0f} GETs/s")
+
+        file_exporter.close()
+
+    print(
+        "mean span: "
+        + ", ".join(f"{n} {us:.1f} us" for n, us in _span_means(collector).items())
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@ from typing import List
 from .app import AlpacaServer, Description
 from .devices.safetymonitor import SafetyMonitor
 from .errors import NotImplementedError
+from .log import configure_logging
 from .request import ActionRequest, CommandRequest, CommonRequest, PutConnectedRequest
 
 
@@ -68,6 +69,8 @@ if __name__ == "__main__":
 
     port = 8000
 
+    configure_logging("info")
+
     svr = AlpacaServer(get_server_description, [MySafetyMonitor("other")])
     app = svr.create_app(port)
 
@@ -0,0 +1,1158 @@
+import sys
+from typing import List
+
+if sys.version_info >= (3, 9):
+    from typing import Annotated
+else:
+    from typing_extensions import Annotated
+
+import structlog
+from fastapi import APIRouter, Depends, Query, Request
+
+from ..device import DeviceRegistry, UrlDeviceType, device_finder
+from ..devices.camera import Camera, CameraState, SensorType
+from ..dispatch import DeviceDispatcher
+from ..imagearray import image_response
+from ..request import (
+    CommonRequest,
+    PutBinXRequest,
+    PutBinYRequest,
+    PutCoolerOnRequest,
+    PutFastReadoutRequest,
+    PutGainRequest,
+    PutNumXRequest,
+    PutNumYRequest,
+    PutOffsetRequest,
+    PutPulseGuideRequest,
+    PutReadoutModeRequest,
+    PutSetCCDTemperatureRequest,
+    PutStartXRequest,
+    PutStartYRequest,
+    PutSubExposureDurationRequest,
+    StartExposureRequest,
+)
+from ..response import HTTPResponse, Response, common_endpoint_parameters
+
+logger: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)
+
+
+def create_router(registry: DeviceRegistry, dispatcher: DeviceDispatcher):
+    router = APIRouter()
+
+    async def put_abortexposure(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_abortexposure, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def get_bayeroffsetx(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[int].encode(
+            req,
+            await dispatcher.call(device.get_bayeroffsetx, req),
+        )
+
+    async def get_bayeroffsety(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[int].encode(
+            req,
+            await dispatcher.call(device.get_bayeroffsety, req),
+        )
+
+    async def get_binx(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[int].encode(
+            req,
+            await dispatcher.call(device.get_binx, req),
+        )
+
+    async def put_binx(
+        req: Annotated[PutBinXRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_binx, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def get_biny(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[int].encode(
+            req,
+            await dispatcher.call(device.get_biny, req),
+        )
+
+    async def put_biny(
+        req: Annotated[PutBinYRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_biny, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def get_camerastate(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[CameraState].encode(
+            req,
+            await dispatcher.call(device.get_camerastate, req),
+        )
+
+    async def get_cameraxsize(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[int].encode(
+            req,
+            await dispatcher.call(device.get_cameraxsize, req),
+        )
+
+    async def get_cameraysize(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[int].encode(
+            req,
+            await dispatcher.call(device.get_cameraysize, req),
+        )
+
+    async def get_canabortexposure(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
+            req,
+            await dispatcher.call(device.get_canabortexposure, req),
+        )
+
+    async def get_canasymmetricbin(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
+            req,
+            await dispatcher.call(device.get_canasymmetricbin, req),
+        )
+
+    async def get_canfastreadout(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
+            req,
+            await dispatcher.call(device.get_canfastreadout, req),
+        )
+
+    async def get_cangetcoolerpower(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
+            req,
+            await dispatcher.call(device.get_cangetcoolerpower, req),
+        )
+
+    async def get_canpulseguide(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
+            req,
+            await dispatcher.call(device.get_canpulseguide, req),
+        )
+
+    async def get_cansetccdtemperature(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
+            req,
+            await dispatcher.call(device.get_cansetccdtemperature, req),
+        )
+
+    async def get_canstopexposure(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
+            req,
+            await dispatcher.call(device.get_canstopexposure, req),
+        )
+
+    async def get_ccdtemperature(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[float].encode(
+            req,
+            await dispatcher.call(device.get_ccdtemperature, req),
+        )
+
+    async def get_cooleron(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
+            req,
+            await dispatcher.call(device.get_cooleron, req),
+        )
+
+    async def put_cooleron(
+        req: Annotated[PutCoolerOnRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_cooleron, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def get_coolerpower(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[float].encode(
+            req,
+            await dispatcher.call(device.get_coolerpower, req),
+        )
+
+    async def get_electronsperadu(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[float].encode(
+            req,
+            await dispatcher.call(device.get_electronsperadu, req),
+        )
+
+    async def get_exposuremax(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[float].encode(
+            req,
+            await dispatcher.call(device.get_exposuremax, req),
+        )
+
+    async def get_exposuremin(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[float].encode(
+            req,
+            await dispatcher.call(device.get_exposuremin, req),
+        )
+
+    async def get_exposureresolution(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[float].encode(
+            req,
+            await dispatcher.call(device.get_exposureresolution, req),
+        )
+
+    async def get_fastreadout(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
+            req,
+            await dispatcher.call(device.get_fastreadout, req),
+        )
+
+    async def put_fastreadout(
+        req: Annotated[PutFastReadoutRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_fastreadout, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def get_fullwellcapacity(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[float].encode(
+            req,
+            await dispatcher.call(device.get_fullwellcapacity, req),
+        )
+
+    async def get_gain(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[int].encode(
+            req,
+            await dispatcher.call(device.get_gain, req),
+        )
+
+    async def put_gain(
+        req: Annotated[PutGainRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_gain, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def get_gainmax(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[int].encode(
+            req,
+            await dispatcher.call(device.get_gainmax, req),
+        )
+
+    async def get_gainmin(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[int].encode(
+            req,
+            await dispatcher.call(device.get_gainmin, req),
+        )
+
+    async def get_gains(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[List[str]].encode(
+            req,
+            await dispatcher.call(device.get_gains, req),
+        )
+
+    async def get_hasshutter(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
+            req,
+            await dispatcher.call(device.get_hasshutter, req),
+        )
+
+    async def get_heatsinktemperature(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[float].encode(
+            req,
+            await dispatcher.call(device.get_heatsinktemperature, req),
+        )
+
+    async def get_imagearray(
+        request: Request,
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return await image_response(
+            request,
+            req,
+            dispatcher.call(device.get_imagearray, req),
+        )
+
+    async def get_imagearrayvariant(
+        request: Request,
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return await image_response(
+            request,
+            req,
+            dispatcher.call(device.get_imagearrayvariant, req),
+        )
+
+    async def get_imageready(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
+            req,
+            await dispatcher.call(device.get_imageready, req),
+        )
+
+    async def get_ispulseguiding(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
+            req,
+            await dispatcher.call(device.get_ispulseguiding, req),
+        )
+
+    async def get_lastexposureduration(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[float].encode(
+            req,
+            await dispatcher.call(device.get_lastexposureduration, req),
+        )
+
+    async def get_lastexposurestarttime(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[str].encode(
+            req,
+            await dispatcher.call(device.get_lastexposurestarttime, req),
+        )
+
+    async def get_maxadu(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[int].encode(
+            req,
+            await dispatcher.call(device.get_maxadu, req),
+        )
+
+    async def get_maxbinx(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[int].encode(
+            req,
+            await dispatcher.call(device.get_maxbinx, req),
+        )
+
+    async def get_maxbiny(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[int].encode(
+            req,
+            await dispatcher.call(device.get_maxbiny, req),
+        )
+
+    async def get_numx(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[int].encode(
+            req,
+            await dispatcher.call(device.get_numx, req),
+        )
+
+    async def put_numx(
+        req: Annotated[PutNumXRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_numx, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def get_numy(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[int].encode(
+            req,
+            await dispatcher.call(device.get_numy, req),
+        )
+
+    async def put_numy(
+        req: Annotated[PutNumYRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_numy, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def get_offset(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[int].encode(
+            req,
+            await dispatcher.call(device.get_offset, req),
+        )
+
+    async def put_offset(
+        req: Annotated[PutOffsetRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_offset, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def get_offsetmax(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[int].encode(
+            req,
+            await dispatcher.call(device.get_offsetmax, req),
+        )
+
+    async def get_offsetmin(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[int].encode(
+            req,
+            await dispatcher.call(device.get_offsetmin, req),
+        )
+
+    async def get_offsets(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[List[str]].encode(
+            req,
+            await dispatcher.call(device.get_offsets, req),
+        )
+
+    async def get_percentcompleted(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[int].encode(
+            req,
+            await dispatcher.call(device.get_percentcompleted, req),
+        )
+
+    async def get_pixelsizex(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[float].encode(
+            req,
+            await dispatcher.call(device.get_pixelsizex, req),
+        )
+
+    async def get_pixelsizey(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[float].encode(
+            req,
+            await dispatcher.call(device.get_pixelsizey, req),
+        )
+
+    async def put_pulseguide(
+        req: Annotated[PutPulseGuideRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_pulseguide, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def get_readoutmode(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[int].encode(
+            req,
+            await dispatcher.call(device.get_readoutmode, req),
+        )
+
+    async def put_readoutmode(
+        req: Annotated[PutReadoutModeRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_readoutmode, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def get_readoutmodes(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[List[str]].encode(
+            req,
+            await dispatcher.call(device.get_readoutmodes, req),
+        )
+
+    async def get_sensorname(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[str].encode(
+            req,
+            await dispatcher.call(device.get_sensorname, req),
+        )
+
+    async def get_sensortype(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[SensorType].encode(
+            req,
+            await dispatcher.call(device.get_sensortype, req),
+        )
+
+    async def get_setccdtemperature(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[float].encode(
+            req,
+            await dispatcher.call(device.get_setccdtemperature, req),
+        )
+
+    async def put_setccdtemperature(
+        req: Annotated[PutSetCCDTemperatureRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_setccdtemperature, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def put_startexposure(
+        req: Annotated[StartExposureRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_startexposure, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def get_startx(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[int].encode(
+            req,
+            await dispatcher.call(device.get_startx, req),
+        )
+
+    async def put_startx(
+        req: Annotated[PutStartXRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_startx, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def get_starty(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[int].encode(
+            req,
+            await dispatcher.call(device.get_starty, req),
+        )
+
+    async def put_starty(
+        req: Annotated[PutStartYRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_starty, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def put_stopexposure(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_stopexposure, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def get_subexposureduration(
+        req: Annotated[CommonRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        return Response[float].encode(
+            req,
+            await dispatcher.call(device.get_subexposureduration, req),
+        )
+
+    async def put_subexposureduration(
+        req: Annotated[PutSubExposureDurationRequest, Query()],
+        device: Camera = Depends(device_finder(registry, UrlDeviceType.Camera)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_subexposureduration, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    router.put(
+        "/camera/{device_number}/abortexposure",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_abortexposure)
+
+    router.get(
+        "/camera/{device_number}/bayeroffsetx",
+        **common_endpoint_parameters,
+        response_model=Response[int],
+    )(get_bayeroffsetx)
+
+    router.get(
+        "/camera/{device_number}/bayeroffsety",
+        **common_endpoint_parameters,
+        response_model=Response[int],
+    )(get_bayeroffsety)
+
+    router.get(
+        "/camera/{device_number}/binx",
+        **common_endpoint_parameters,
+        response_model=Response[int],
+    )(get_binx)
+
+    router.put(
+        "/camera/{device_number}/binx",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_binx)
+
+    router.get(
+        "/camera/{device_number}/biny",
+        **common_endpoint_parameters,
+        response_model=Response[int],
+    )(get_biny)
+
+    router.put(
+        "/camera/{device_number}/biny",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_biny)
+
+    router.get(
+        "/camera/{device_number}/camerastate",
+        **common_endpoint_parameters,
+        response_model=Response[CameraState],
+    )(get_camerastate)
+
+    router.get(
+        "/camera/{device_number}/cameraxsize",
+        **common_endpoint_parameters,
+        response_model=Response[int],
+    )(get_cameraxsize)
+
+    router.get(
+        "/camera/{device_number}/cameraysize",
+        **common_endpoint_parameters,
+        response_model=Response[int],
+    )(get_cameraysize)
+
+    router.get(
+        "/camera/{device_number}/canabortexposure",
+        **common_endpoint_parameters,
+        response_model=Response[bool],
+    )(get_canabortexposure)
+
+    router.get(
+        "/camera/{device_number}/canasymmetricbin",
+        **common_endpoint_parameters,
+        response_model=Response[bool],
+    )(get_canasymmetricbin)
+
+    router.get(
+        "/camera/{device_number}/canfastreadout",
+        **common_endpoint_parameters,
+        response_model=Response[bool],
+    )(get_canfastreadout)
+
+    router.get(
+        "/camera/{device_number}/cangetcoolerpower",
+        **common_endpoint_parameters,
+        response_model=Response[bool],
+    )(get_cangetcoolerpower)
+
+    router.get(
+        "/camera/{device_number}/canpulseguide",
+        **common_endpoint_parameters,
+        response_model=Response[bool],
+    )(get_canpulseguide)
+
+    router.get(
+        "/camera/{device_number}/cansetccdtemperature",
+        **common_endpoint_parameters,
+        response_model=Response[bool],
+    )(get_cansetccdtemperature)
+
+    router.get(
+        "/camera/{device_number}/canstopexposure",
+        **common_endpoint_parameters,
+        response_model=Response[bool],
+    )(get_canstopexposure)
+
+    router.get(
+        "/camera/{device_number}/ccdtemperature",
+        **common_endpoint_parameters,
+        response_model=Response[float],
+    )(get_ccdtemperature)
+
+    router.get(
+        "/camera/{device_number}/cooleron",
+        **common_endpoint_parameters,
+        response_model=Response[bool],
+    )(get_cooleron)
+
+    router.put(
+        "/camera/{device_number}/cooleron",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_cooleron)
+
+    router.get(
+        "/camera/{device_number}/coolerpower",
+        **common_endpoint_parameters,
+        response_model=Response[float],
+    )(get_coolerpower)
+
+    router.get(
+        "/camera/{device_number}/electronsperadu",
+        **common_endpoint_parameters,
+        response_model=Response[float],
+    )(get_electronsperadu)
+
+    router.get(
+        "/camera/{device_number}/exposuremax",
+        **common_endpoint_parameters,
+        response_model=Response[float],
+    )(get_exposuremax)
+
+    router.get(
+        "/camera/{device_number}/exposuremin",
+        **common_endpoint_parameters,
+        response_model=Response[float],
+    )(get_exposuremin)
+
+    router.get(
+        "/camera/{device_number}/exposureresolution",
+        **common_endpoint_parameters,
+        response_model=Response[float],
+    )(get_exposureresolution)
+
+    router.get(
+        "/camera/{device_number}/fastreadout",
+        **common_endpoint_parameters,
+        response_model=Response[bool],
+    )(get_fastreadout)
+
+    router.put(
+        "/camera/{device_number}/fastreadout",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_fastreadout)
+
+    router.get(
+        "/camera/{device_number}/fullwellcapacity",
+        **common_endpoint_parameters,
+        response_model=Response[float],
+    )(get_fullwellcapacity)
+
+    router.get(
+        "/camera/{device_number}/gain",
+        **common_endpoint_parameters,
+        response_model=Response[int],
+    )(get_gain)
+
+    router.put(
+        "/camera/{device_number}/gain",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_gain)
+
+    router.get(
+        "/camera/{device_number}/gainmax",
+        **common_endpoint_parameters,
+        response_model=Response[int],
+    )(get_gainmax)
+
+    router.get(
+        "/camera/{device_number}/gainmin",
+        **common_endpoint_parameters,
+        response_model=Response[int],
+    )(get_gainmin)
+
+    router.get(
+        "/camera/{device_number}/gains",
+        **common_endpoint_parameters,
+        response_model=Response[List[str]],
+    )(get_gains)
+
+    router.get(
+        "/camera/{device_number}/hasshutter",
+        **common_endpoint_parameters,
+        response_model=Response[bool],
+    )(get_hasshutter)
+
+    router.get(
+        "/camera/{device_number}/heatsinktemperature",
+        **common_endpoint_parameters,
+        response_model=Response[float],
+    )(get_heatsinktemperature)
+
+    router.get(
+        "/camera/{device_number}/imagearray",
+        **common_endpoint_parameters,
+    )(get_imagearray)
+
+    router.get(
+        "/camera/{device_number}/imagearrayvariant",
+        **common_endpoint_parameters,
+    )(get_imagearrayvariant)
+
+    router.get(
+        "/camera/{device_number}/imageready",
+        **common_endpoint_parameters,
+        response_model=Response[bool],
+    )(get_imageready)
+
+    router.get(
+        "/camera/{device_number}/ispulseguiding",
+        **common_endpoint_parameters,
+        response_model=Response[bool],
+    )(get_ispulseguiding)
+
+    router.get(
+        "/camera/{device_number}/lastexposureduration",
+        **common_endpoint_parameters,
+        response_model=Response[float],
+    )(get_lastexposureduration)
+
+    router.get(
+        "/camera/{device_number}/lastexposurestarttime",
+        **common_endpoint_parameters,
+        response_model=Response[str],
+    )(get_lastexposurestarttime)
+
+    router.get(
+        "/camera/{device_number}/maxadu",
+        **common_endpoint_parameters,
+        response_model=Response[int],
+    )(get_maxadu)
+
+    router.get(
+        "/camera/{device_number}/maxbinx",
+        **common_endpoint_parameters,
+        response_model=Response[int],
+    )(get_maxbinx)
+
+    router.get(
+        "/camera/{device_number}/maxbiny",
+        **common_endpoint_parameters,
+        response_model=Response[int],
+    )(get_maxbiny)
+
+    router.get(
+        "/camera/{device_number}/numx",
+        **common_endpoint_parameters,
+        response_model=Response[int],
+    )(get_numx)
+
+    router.put(
+        "/camera/{device_number}/numx",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_numx)
+
+    router.get(
+        "/camera/{device_number}/numy",
+        **common_endpoint_parameters,
+        response_model=Response[int],
+    )(get_numy)
+
+    router.put(
+        "/camera/{device_number}/numy",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_numy)
+
+    router.get(
+        "/camera/{device_number}/offset",
+        **common_endpoint_parameters,
+        response_model=Response[int],
+    )(get_offset)
+
+    router.put(
+        "/camera/{device_number}/offset",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_offset)
+
+    router.get(
+        "/camera/{device_number}/offsetmax",
+        **common_endpoint_parameters,
+        response_model=Response[int],
+    )(get_offsetmax)
+
+    router.get(
+        "/camera/{device_number}/offsetmin",
+        **common_endpoint_parameters,
+        response_model=Response[int],
+    )(get_offsetmin)
+
+    router.get(
+        "/camera/{device_number}/offsets",
+        **common_endpoint_parameters,
+        response_model=Response[List[str]],
+    )(get_offsets)
+
+    router.get(
+        "/camera/{device_number}/percentcompleted",
+        **common_endpoint_parameters,
+        response_model=Response[int],
+    )(get_percentcompleted)
+
+    router.get(
+        "/camera/{device_number}/pixelsizex",
+        **common_endpoint_parameters,
+        response_model=Response[float],
+    )(get_pixelsizex)
+
+    router.get(
+        "/camera/{device_number}/pixelsizey",
+        **common_endpoint_parameters,
+        response_model=Response[float],
+    )(get_pixelsizey)
+
+    router.put(
+        "/camera/{device_number}/pulseguide",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_pulseguide)
+
+    router.get(
+        "/camera/{device_number}/readoutmode",
+        **common_endpoint_parameters,
+        response_model=Response[int],
+    )(get_readoutmode)
+
+    router.put(
+        "/camera/{device_number}/readoutmode",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_readoutmode)
+
+    router.get(
+        "/camera/{device_number}/readoutmodes",
+        **common_endpoint_parameters,
+        response_model=Response[List[str]],
+    )(get_readoutmodes)
+
+    router.get(
+        "/camera/{device_number}/sensorname",
+        **common_endpoint_parameters,
+        response_model=Response[str],
+    )(get_sensorname)
+
+    router.get(
+        "/camera/{device_number}/sensortype",
+        **common_endpoint_parameters,
+        response_model=Response[SensorType],
+    )(get_sensortype)
+
+    router.get(
+        "/camera/{device_number}/setccdtemperature",
+        **common_endpoint_parameters,
+        response_model=Response[float],
+    )(get_setccdtemperature)
+
+    router.put(
+        "/camera/{device_number}/setccdtemperature",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_setccdtemperature)
+
+    router.put(
+        "/camera/{device_number}/startexposure",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_startexposure)
+
+    router.get(
+        "/camera/{device_number}/startx",
+        **common_endpoint_parameters,
+        response_model=Response[int],
+    )(get_startx)
+
+    router.put(
+        "/camera/{device_number}/startx",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_startx)
+
+    router.get(
+        "/camera/{device_number}/starty",
+        **common_endpoint_parameters,
+        response_model=Response[int],
+    )(get_starty)
+
+    router.put(
+        "/camera/{device_number}/starty",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_starty)
+
+    router.put(
+        "/camera/{device_number}/stopexposure",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_stopexposure)
+
+    router.get(
+        "/camera/{device_number}/subexposureduration",
+        **common_endpoint_parameters,
+        response_model=Response[float],
+    )(get_subexposureduration)
+
+    router.put(
+        "/camera/{device_number}/subexposureduration",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_subexposureduration)
+
+    return router
@@ -9,103 +9,114 @@ else:
 import structlog
 from fastapi import APIRouter, Depends, Form, Query
 
-from ..device import Device, common_device_finder
+from ..device import Device, DeviceRegistry, StateValue, common_device_finder
+from ..dispatch import DeviceDispatcher
 from ..errors import NotImplementedError
 from ..request import ActionRequest, CommonRequest, PutConnectedRequest
-from ..response import Response, common_endpoint_parameters
+from ..response import HTTPResponse, Response, common_endpoint_parameters
 
 logger: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)
 
 
-def create_router(devices: List[Device]):
+def create_router(registry: DeviceRegistry, dispatcher: DeviceDispatcher):
     router = APIRouter()
 
     async def put_action(
         req: Annotated[ActionRequest, Form()],
-        device: Device = Depends(common_device_finder(devices)),
+        device: Device = Depends(common_device_finder(registry)),
     ) -> Response[str]:
 
         raise NotImplementedError(req)
 
     async def get_connected(
         req: Annotated[CommonRequest, Query()],
-        device: Device = Depends(common_device_finder(devices)),
-    ) -> Response[bool]:
+        device: Device = Depends(common_device_finder(registry)),
+    ) -> HTTPResponse:
 
-        return Response[bool].from_request(
+        return Response[bool].encode(
             req,
-            device.get_connected(req),
+            await dispatcher.call(device.get_connected, req),
         )
 
     async def put_connected(
         req: Annotated[PutConnectedRequest, Form()],
-        device: Device = Depends(common_device_finder(devices)),
-    ) -> Response[None]:
-        device.put_connected(req)
+        device: Device = Depends(common_device_finder(registry)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_connected, req)
 
-        return Response[None].from_request(
+        return Response[None].encode(
             req,
             None,
         )
 
     async def get_description(
         req: Annotated[CommonRequest, Query()],
-        device: Device = Depends(common_device_finder(devices)),
-    ) -> Response[str]:
+        device: Device = Depends(common_device_finder(registry)),
+    ) -> HTTPResponse:
 
-        return Response[str].from_request(
+        return Response[str].encode(
             req,
-            device.get_description(req),
+            await dispatcher.call(device.get_description, req),
         )
 
     async def get_driverinfo(
         req: Annotated[CommonRequest, Query()],
-        device: Device = Depends(common_device_finder(devices)),
-    ) -> Response[str]:
+        device: Device = Depends(common_device_finder(registry)),
+    ) -> HTTPResponse:
 
-        return Response[str].from_request(
+        return Response[str].encode(
             req,
-            device.get_driverinfo(req),
+            await dispatcher.call(device.get_driverinfo, req),
         )
 
     async def get_driverversion(
         req: Annotated[CommonRequest, Query()],
-        device: Device = Depends(common_device_finder(devices)),
-    ) -> Response[str]:
+        device: Device = Depends(common_device_finder(registry)),
+    ) -> HTTPResponse:
 
-        return Response[str].from_request(
+        return Response[str].encode(
             req,
-            device.get_driverversion(req),
+            await dispatcher.call(device.get_driverversion, req),
         )
 
     async def get_interfaceversion(
         req: Annotated[CommonRequest, Query()],
-        device: Device = Depends(common_device_finder(devices)),
-    ) -> Response[int]:
+        device: Device = Depends(common_device_finder(registry)),
+    ) -> HTTPResponse:
 
-        return Response[int].from_request(
+        return Response[int].encode(
             req,
-            device.get_interfaceversion(req),
+            await dispatcher.call(device.get_interfaceversion, req),
         )
 
     async def get_name(
         req: Annotated[CommonRequest, Query()],
-        device: Device = Depends(common_device_finder(devices)),
-    ) -> Response[str]:
+        device: Device = Depends(common_device_finder(registry)),
+    ) -> HTTPResponse:
 
-        return Response[str].from_request(
+        return Response[str].encode(
             req,
-            device.get_name(req),
+            await dispatcher.call(device.get_name, req),
         )
 
     async def get_supportedactions(
         req: Annotated[CommonRequest, Query()],
-        device: Device = Depends(common_device_finder(devices)),
-    ) -> Response[List[str]]:
+        device: Device = Depends(common_device_finder(registry)),
+    ) -> HTTPResponse:
+
+        return Response[List[str]].encode(
+            req,
+            await dispatcher.call(device.get_supportedactions, req),
+        )
+
+    async def get_devicestate(
+        req: Annotated[CommonRequest, Query()],
+        device: Device = Depends(common_device_finder(registry)),
+    ) -> HTTPResponse:
 
-        return Response[List[str]].from_request(
+        return Response[List[StateValue]].encode(
             req,
-            device.get_supportedactions(req),
+            await dispatcher.call(device.get_devicestate, req),
         )
 
     router.put(
@@ -122,36 +133,49 @@ def create_router(devices: List[Device]):
     router.put(
         "/{device_type}/{device_number}/connected",
         **common_endpoint_parameters,
+        response_model=Response[None],
     )(put_connected)
 
     router.get(
         "/{device_type}/{device_number}/description",
         **common_endpoint_parameters,
+        response_model=Response[str],
     )(get_description)
 
     router.get(
         "/{device_type}/{device_number}/driverinfo",
         **common_endpoint_parameters,
+        response_model=Response[str],
     )(get_driverinfo)
 
     router.get(
         "/{device_type}/{device_number}/driverversion",
         **common_endpoint_parameters,
+        response_model=Response[str],
     )(get_driverversion)
 
     router.get(
         "/{device_type}/{device_number}/interfaceversion",
         **common_endpoint_parameters,
+        response_model=Response[int],
     )(get_interfaceversion)
 
     router.get(
         "/{device_type}/{device_number}/name",
         **common_endpoint_parameters,
+        response_model=Response[str],
     )(get_name)
 
     router.get(
         "/{device_type}/{device_number}/supportedactions",
         **common_endpoint_parameters,
+        response_model=Response[List[str]],
     )(get_supportedactions)
 
+    router.get(
+        "/{device_type}/{device_number}/devicestate",
+        **common_endpoint_parameters,
+        response_model=Response[List[StateValue]],
+    )(get_devicestate)
+
     return router
@@ -1,5 +1,4 @@
 import sys
-from typing import List
 
 if sys.version_info >= (3, 9):
     from typing import Annotated
@@ -9,159 +8,179 @@ else:
 import structlog
 from fastapi import APIRouter, Depends, Query
 
-from ..device import Device, UrlDeviceType, device_finder
+from ..device import DeviceRegistry, UrlDeviceType, device_finder
 from ..devices.covercalibrator import CalibratorState, CoverCalibrator, CoverState
+from ..dispatch import DeviceDispatcher
 from ..request import CommonRequest, PutBrightnessRequest
-from ..response import Response, common_endpoint_parameters
+from ..response import HTTPResponse, Response, common_endpoint_parameters
 
 logger: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)
 
 
-def create_router(devices: List[Device]):
+def create_router(registry: DeviceRegistry, dispatcher: DeviceDispatcher):
     router = APIRouter()
 
     async def get_brightness(
         req: Annotated[CommonRequest, Query()],
         device: CoverCalibrator = Depends(
-            device_finder(devices, UrlDeviceType.CoverCalibrator)
+            device_finder(registry, UrlDeviceType.CoverCalibrator)
         ),
-    ) -> Response[int]:
-        return Response[int].from_request(
+    ) -> HTTPResponse:
+        return Response[int].encode(
             req,
-            device.get_brightness(req),
+            await dispatcher.call(device.get_brightness, req),
         )
 
     async def get_calibratorstate(
         req: Annotated[CommonRequest, Query()],
         device: CoverCalibrator = Depends(
-            device_finder(devices, UrlDeviceType.CoverCalibrator)
+            device_finder(registry, UrlDeviceType.CoverCalibrator)
         ),
-    ) -> Response[CalibratorState]:
-        return Response[CalibratorState].from_request(
+    ) -> HTTPResponse:
+        return Response[CalibratorState].encode(
             req,
-            device.get_calibratorstate(req),
+            await dispatcher.call(device.get_calibratorstate, req),
         )
 
     async def get_coverstate(
         req: Annotated[CommonRequest, Query()],
         device: CoverCalibrator = Depends(
-            device_finder(devices, UrlDeviceType.CoverCalibrator)
+            device_finder(registry, UrlDeviceType.CoverCalibrator)
         ),
-    ) -> Response[CoverState]:
-        return Response[CoverState].from_request(
+    ) -> HTTPResponse:
+        return Response[CoverState].encode(
             req,
-            device.get_coverstate(req),
+            await dispatcher.call(device.get_coverstate, req),
         )
 
     async def get_maxbrightness(
         req: Annotated[CommonRequest, Query()],
         device: CoverCalibrator = Depends(
-            device_finder(devices, UrlDeviceType.CoverCalibrator)
+            device_finder(registry, UrlDeviceType.CoverCalibrator)
         ),
-    ) -> Response[int]:
-        return Response[int].from_request(
+    ) -> HTTPResponse:
+        return Response[int].encode(
             req,
-            device.get_maxbrightness(req),
+            await dispatcher.call(device.get_maxbrightness, req),
         )
 
     async def put_calibratoroff(
         req: Annotated[CommonRequest, Query()],
         device: CoverCalibrator = Depends(
-            device_finder(devices, UrlDeviceType.CoverCalibrator)
+            device_finder(registry, UrlDeviceType.CoverCalibrator)
         ),
-    ) -> Response[None]:
-        return Response[None].from_request(
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_calibratoroff, req)
+
+        return Response[None].encode(
             req,
-            device.put_calibratoroff(req),
+            None,
         )
 
     async def put_calibratoron(
         req: Annotated[PutBrightnessRequest, Query()],
         device: CoverCalibrator = Depends(
-            device_finder(devices, UrlDeviceType.CoverCalibrator)
+            device_finder(registry, UrlDeviceType.CoverCalibrator)
         ),
-    ) -> Response[None]:
-        return Response[None].from_request(
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_calibratoron, req)
+
+        return Response[None].encode(
             req,
-            device.put_calibratoron(req),
+            None,
         )
 
     async def put_closecover(
         req: Annotated[CommonRequest, Query()],
         device: CoverCalibrator = Depends(
-            device_finder(devices, UrlDeviceType.CoverCalibrator)
+            device_finder(registry, UrlDeviceType.CoverCalibrator)
         ),
-    ) -> Response[None]:
-        return Response[None].from_request(
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_closecover, req)
+
+        return Response[None].encode(
             req,
-            device.put_closecover(req),
+            None,
         )
 
     async def put_haltcover(
         req: Annotated[CommonRequest, Query()],
         device: CoverCalibrator = Depends(
-            device_finder(devices, UrlDeviceType.CoverCalibrator)
+            device_finder(registry, UrlDeviceType.CoverCalibrator)
         ),
-    ) -> Response[None]:
-        return Response[None].from_request(
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_haltcover, req)
+
+        return Response[None].encode(
             req,
-            device.put_haltcover(req),
+            None,
         )
 
     async def put_opencover(
         req: Annotated[CommonRequest, Query()],
         device: CoverCalibrator = Depends(
-            device_finder(devices, UrlDeviceType.CoverCalibrator)
+            device_finder(registry, UrlDeviceType.CoverCalibrator)
         ),
-    ) -> Response[None]:
-        return Response[None].from_request(
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_opencover, req)
+
+        return Response[None].encode(
             req,
-            device.put_opencover(req),
+            None,
         )
 
     router.get(
         "/covercalibrator/{device_number}/brightness",
         **common_endpoint_parameters,
+        response_model=Response[int],
     )(get_brightness)
 
     router.get(
         "/covercalibrator/{device_number}/calibratorstate",
         **common_endpoint_parameters,
+        response_model=Response[CalibratorState],
     )(get_calibratorstate)
 
     router.get(
         "/covercalibrator/{device_number}/coverstate",
         **common_endpoint_parameters,
+        response_model=Response[CoverState],
     )(get_coverstate)
 
     router.get(
         "/covercalibrator/{device_number}/maxbrightness",
         **common_endpoint_parameters,
+        response_model=Response[int],
     )(get_maxbrightness)
 
     router.put(
         "/covercalibrator/{device_number}/calibratoroff",
         **common_endpoint_parameters,
+        response_model=Response[None],
     )(put_calibratoroff)
 
     router.put(
         "/covercalibrator/{device_number}/calibratoron",
         **common_endpoint_parameters,
+        response_model=Response[None],
     )(put_calibratoron)
 
     router.put(
         "/covercalibrator/{device_number}/closecover",
         **common_endpoint_parameters,
+        response_model=Response[None],
     )(put_closecover)
 
     router.put(
         "/covercalibrator/{device_number}/haltcover",
         **common_endpoint_parameters,
+        response_model=Response[None],
     )(put_haltcover)
 
     router.put(
         "/covercalibrator/{device_number}/opencover",
         **common_endpoint_parameters,
+        response_model=Response[None],
     )(put_opencover)
 
     return router
@@ -9,79 +9,86 @@ else:
 import structlog
 from fastapi import APIRouter, Depends, Query
 
-from ..device import Device, UrlDeviceType, device_finder
+from ..device import DeviceRegistry, UrlDeviceType, device_finder
 from ..devices.filterwheel import FilterWheel
+from ..dispatch import DeviceDispatcher
 from ..request import CommonRequest, PutPositionRequest
-from ..response import Response, common_endpoint_parameters
+from ..response import HTTPResponse, Response, common_endpoint_parameters
 
 logger: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)
 
 
-def create_router(devices: List[Device]):
+def create_router(registry: DeviceRegistry, dispatcher: DeviceDispatcher):
     router = APIRouter()
 
     async def get_focusoffsets(
         req: Annotated[CommonRequest, Query()],
         device: FilterWheel = Depends(
-            device_finder(devices, UrlDeviceType.FilterWheel)
+            device_finder(registry, UrlDeviceType.FilterWheel)
         ),
-    ) -> Response[List[int]]:
-        return Response[List[int]].from_request(
+    ) -> HTTPResponse:
+        return Response[List[int]].encode(
             req,
-            device.get_focusoffsets(req),
+            await dispatcher.call(device.get_focusoffsets, req),
         )
 
     async def get_names(
         req: Annotated[CommonRequest, Query()],
         device: FilterWheel = Depends(
-            device_finder(devices, UrlDeviceType.FilterWheel)
+            device_finder(registry, UrlDeviceType.FilterWheel)
         ),
-    ) -> Response[List[str]]:
-        return Response[List[str]].from_request(
+    ) -> HTTPResponse:
+        return Response[List[str]].encode(
             req,
-            device.get_names(req),
+            await dispatcher.call(device.get_names, req),
         )
 
     async def get_position(
         req: Annotated[CommonRequest, Query()],
         device: FilterWheel = Depends(
-            device_finder(devices, UrlDeviceType.FilterWheel)
+            device_finder(registry, UrlDeviceType.FilterWheel)
         ),
-    ) -> Response[int]:
-        return Response[int].from_request(
+    ) -> HTTPResponse:
+        return Response[int].encode(
             req,
-            device.get_position(req),
+            await dispatcher.call(device.get_position, req),
         )
 
     async def put_position(
         req: Annotated[PutPositionRequest, Query()],
         device: FilterWheel = Depends(
-            device_finder(devices, UrlDeviceType.FilterWheel)
+            device_finder(registry, UrlDeviceType.FilterWheel)
         ),
-    ) -> Response[None]:
-        return Response[None].from_request(
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_position, req)
+
+        return Response[None].encode(
             req,
-            device.put_position(req),
+            None,
         )
 
     router.get(
         "/filterwheel/{device_number}/focusoffsets",
         **common_endpoint_parameters,
+        response_model=Response[List[int]],
     )(get_focusoffsets)
 
     router.get(
         "/filterwheel/{device_number}/names",
         **common_endpoint_parameters,
+        response_model=Response[List[str]],
     )(get_names)
 
     router.get(
         "/filterwheel/{device_number}/position",
         **common_endpoint_parameters,
+        response_model=Response[int],
     )(get_position)
 
     router.put(
         "/filterwheel/{device_number}/position",
         **common_endpoint_parameters,
+        response_model=Response[None],
     )(put_position)
 
     return router
@@ -1,5 +1,4 @@
 import sys
-from typing import List
 
 if sys.version_info >= (3, 9):
     from typing import Annotated
@@ -9,183 +8,202 @@ else:
 import structlog
 from fastapi import APIRouter, Depends, Query
 
-from ..device import Device, UrlDeviceType, device_finder
+from ..device import DeviceRegistry, UrlDeviceType, device_finder
 from ..devices.focuser import Focuser
+from ..dispatch import DeviceDispatcher
 from ..request import CommonRequest, PutPositionRequest, PutTempCompRequest
-from ..response import Response, common_endpoint_parameters
+from ..response import HTTPResponse, Response, common_endpoint_parameters
 
 logger: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)
 
 
-def create_router(devices: List[Device]):
+def create_router(registry: DeviceRegistry, dispatcher: DeviceDispatcher):
     router = APIRouter()
 
     async def get_absolute(
         req: Annotated[CommonRequest, Query()],
-        device: Focuser = Depends(device_finder(devices, UrlDeviceType.Focuser)),
-    ) -> Response[bool]:
-        return Response[bool].from_request(
+        device: Focuser = Depends(device_finder(registry, UrlDeviceType.Focuser)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
             req,
-            device.get_absolute(req),
+            await dispatcher.call(device.get_absolute, req),
         )
 
     async def get_ismoving(
         req: Annotated[CommonRequest, Query()],
-        device: Focuser = Depends(device_finder(devices, UrlDeviceType.Focuser)),
-    ) -> Response[bool]:
-        return Response[bool].from_request(
+        device: Focuser = Depends(device_finder(registry, UrlDeviceType.Focuser)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
             req,
-            device.get_ismoving(req),
+            await dispatcher.call(device.get_ismoving, req),
         )
 
     async def get_maxincrement(
         req: Annotated[CommonRequest, Query()],
-        device: Focuser = Depends(device_finder(devices, UrlDeviceType.Focuser)),
-    ) -> Response[int]:
-        return Response[int].from_request(
+        device: Focuser = Depends(device_finder(registry, UrlDeviceType.Focuser)),
+    ) -> HTTPResponse:
+        return Response[int].encode(
             req,
-            device.get_maxincrement(req),
+            await dispatcher.call(device.get_maxincrement, req),
         )
 
     async def get_maxstep(
         req: Annotated[CommonRequest, Query()],
-        device: Focuser = Depends(device_finder(devices, UrlDeviceType.Focuser)),
-    ) -> Response[int]:
-        return Response[int].from_request(
+        device: Focuser = Depends(device_finder(registry, UrlDeviceType.Focuser)),
+    ) -> HTTPResponse:
+        return Response[int].encode(
             req,
-            device.get_maxstep(req),
+            await dispatcher.call(device.get_maxstep, req),
         )
 
     async def get_position(
         req: Annotated[CommonRequest, Query()],
-        device: Focuser = Depends(device_finder(devices, UrlDeviceType.Focuser)),
-    ) -> Response[int]:
-        return Response[int].from_request(
+        device: Focuser = Depends(device_finder(registry, UrlDeviceType.Focuser)),
+    ) -> HTTPResponse:
+        return Response[int].encode(
             req,
-            device.get_position(req),
+            await dispatcher.call(device.get_position, req),
         )
 
     async def get_stepsize(
         req: Annotated[CommonRequest, Query()],
-        device: Focuser = Depends(device_finder(devices, UrlDeviceType.Focuser)),
-    ) -> Response[int]:
-        return Response[int].from_request(
+        device: Focuser = Depends(device_finder(registry, UrlDeviceType.Focuser)),
+    ) -> HTTPResponse:
+        return Response[int].encode(
             req,
-            device.get_stepsize(req),
+            await dispatcher.call(device.get_stepsize, req),
         )
 
     async def get_tempcomp(
         req: Annotated[CommonRequest, Query()],
-        device: Focuser = Depends(device_finder(devices, UrlDeviceType.Focuser)),
-    ) -> Response[bool]:
-        return Response[bool].from_request(
+        device: Focuser = Depends(device_finder(registry, UrlDeviceType.Focuser)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
             req,
-            device.get_tempcomp(req),
+            await dispatcher.call(device.get_tempcomp, req),
         )
 
     async def put_tempcomp(
         req: Annotated[PutTempCompRequest, Query()],
-        device: Focuser = Depends(device_finder(devices, UrlDeviceType.Focuser)),
-    ) -> Response[None]:
-        return Response[None].from_request(
+        device: Focuser = Depends(device_finder(registry, UrlDeviceType.Focuser)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_tempcomp, req)
+
+        return Response[None].encode(
             req,
-            device.put_tempcomp(req),
+            None,
         )
 
     async def get_tempcompavailable(
         req: Annotated[CommonRequest, Query()],
-        device: Focuser = Depends(device_finder(devices, UrlDeviceType.Focuser)),
-    ) -> Response[bool]:
-        return Response[bool].from_request(
+        device: Focuser = Depends(device_finder(registry, UrlDeviceType.Focuser)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
             req,
-            device.get_tempcompavailable(req),
+            await dispatcher.call(device.get_tempcompavailable, req),
         )
 
     async def get_temperature(
         req: Annotated[CommonRequest, Query()],
-        device: Focuser = Depends(device_finder(devices, UrlDeviceType.Focuser)),
-    ) -> Response[float]:
-        return Response[float].from_request(
+        device: Focuser = Depends(device_finder(registry, UrlDeviceType.Focuser)),
+    ) -> HTTPResponse:
+        return Response[float].encode(
             req,
-            device.get_temperature(req),
+            await dispatcher.call(device.get_temperature, req),
         )
 
     async def put_halt(
         req: Annotated[CommonRequest, Query()],
-        device: Focuser = Depends(device_finder(devices, UrlDeviceType.Focuser)),
-    ) -> Response[None]:
-        return Response[None].from_request(
+        device: Focuser = Depends(device_finder(registry, UrlDeviceType.Focuser)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_halt, req)
+
+        return Response[None].encode(
             req,
-            device.put_halt(req),
+            None,
         )
 
     async def put_move(
         req: Annotated[PutPositionRequest, Query()],
-        device: Focuser = Depends(device_finder(devices, UrlDeviceType.Focuser)),
-    ) -> Response[None]:
-        return Response[None].from_request(
+        device: Focuser = Depends(device_finder(registry, UrlDeviceType.Focuser)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_move, req)
+
+        return Response[None].encode(
             req,
-            device.put_move(req),
+            None,
         )
 
     router.get(
         "/focuser/{device_number}/absolute",
         **common_endpoint_parameters,
+        response_model=Response[bool],
     )(get_absolute)
 
     router.get(
         "/focuser/{device_number}/ismoving",
         **common_endpoint_parameters,
+        response_model=Response[bool],
     )(get_ismoving)
 
     router.get(
         "/focuser/{device_number}/maxincrement",
         **common_endpoint_parameters,
+        response_model=Response[int],
     )(get_maxincrement)
 
     router.get(
         "/focuser/{device_number}/maxstep",
         **common_endpoint_parameters,
+        response_model=Response[int],
     )(get_maxstep)
 
     router.get(
         "/focuser/{device_number}/position",
         **common_endpoint_parameters,
+        response_model=Response[int],
     )(get_position)
 
     router.get(
         "/focuser/{device_number}/stepsize",
         **common_endpoint_parameters,
+        response_model=Response[int],
     )(get_stepsize)
 
     router.get(
         "/focuser/{device_number}/tempcomp",
         **common_endpoint_parameters,
+        response_model=Response[bool],
     )(get_tempcomp)
 
     router.put(
         "/focuser/{device_number}/tempcomp",
         **common_endpoint_parameters,
+        response_model=Response[None],
     )(put_tempcomp)
 
     router.get(
         "/focuser/{device_number}/tempcompavailable",
         **common_endpoint_parameters,
+        response_model=Response[bool],
     )(get_tempcompavailable)
 
     router.get(
         "/focuser/{device_number}/temperature",
         **common_endpoint_parameters,
+        response_model=Response[float],
     )(get_temperature)
 
     router.put(
         "/focuser/{device_number}/halt",
         **common_endpoint_parameters,
+        response_model=Response[None],
     )(put_halt)
 
     router.put(
         "/focuser/{device_number}/move",
         **common_endpoint_parameters,
+        response_model=Response[None],
     )(put_move)
 
     return router
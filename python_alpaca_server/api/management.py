@@ -1,5 +1,6 @@
+import asyncio
 import sys
-from typing import Callable, List, Union
+from typing import Callable, List, Union, cast
 
 if sys.version_info >= (3, 9):
     from typing import Annotated
@@ -9,8 +10,9 @@ else:
 from fastapi import APIRouter, Query
 from pydantic import BaseModel
 
-from ..device import Device, DeviceType
-from ..response import CommonRequest, Response, common_endpoint_parameters
+from ..device import DeviceRegistry, DeviceType
+from ..dispatch import DeviceDispatcher
+from ..response import CommonRequest, HTTPResponse, Response, common_endpoint_parameters
 
 
 class Description(BaseModel):
@@ -28,52 +30,59 @@ class ConfiguredDevice(BaseModel):
 
 
 def create_router(
-    desc: Union[Callable[[], Description], Description], devices: List[Device]
+    desc: Union[Callable[[], Description], Description],
+    registry: DeviceRegistry,
+    dispatcher: DeviceDispatcher,
 ):
     router = APIRouter()
 
-    async def get_api_versions(
-        req: Annotated[CommonRequest, Query()]
-    ) -> Response[List[int]]:
-        return Response[List[int]].from_request(req, [1])
+    async def get_api_versions(req: Annotated[CommonRequest, Query()]) -> HTTPResponse:
+        return Response[List[int]].encode(req, [1])
 
-    async def get_description(
-        req: Annotated[CommonRequest, Query()]
-    ) -> Response[Description]:
-        return Response[Description].from_request(
+    async def get_description(req: Annotated[CommonRequest, Query()]) -> HTTPResponse:
+        return Response[Description].encode(
             req,
             desc() if callable(desc) else desc,
         )
 
     async def get_configureddevices(
         req: Annotated[CommonRequest, Query()]
-    ) -> Response[List[ConfiguredDevice]]:
-        return Response[List[ConfiguredDevice]].from_request(
+    ) -> HTTPResponse:
+        # mypy joins the sync and async get_name signatures to object.
+        names = cast(
+            List[str],
+            await asyncio.gather(*[dispatcher.call(d.get_name, req) for d in registry]),
+        )
+
+        return Response[List[ConfiguredDevice]].encode(
             req,
             [
                 ConfiguredDevice(
-                    DeviceName=d.get_name(req),
+                    DeviceName=name,
                     DeviceType=d.device_type,
                     DeviceNumber=d.device_number,
                     UniqueID=d.unique_id,
                 )
-                for d in devices
+                for d, name in zip(registry, names)
             ],
         )
 
     router.get(
         "/apiversions",
         **common_endpoint_parameters,
+        response_model=Response[List[int]],
     )(get_api_versions)
 
     router.get(
         "/v1/description",
         **common_endpoint_parameters,
+        response_model=Response[Description],
     )(get_description)
 
     router.get(
         "/v1/configureddevices",
         **common_endpoint_parameters,
+        response_model=Response[List[ConfiguredDevice]],
     )(get_configureddevices)
 
     return router
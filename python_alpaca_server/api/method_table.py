@@ -0,0 +1,86 @@
+import importlib
+from typing import Dict, Iterable, List, Sequence, Type
+
+import structlog
+from fastapi import APIRouter, HTTPException
+from fastapi.routing import APIRoute
+from starlette.routing import BaseRoute, Route
+from starlette.types import Receive, Scope, Send
+
+from ..device import Device, DeviceType, UrlDeviceType
+
+logger: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)
+
+
+def device_base_class(device_type: DeviceType) -> Type[Device]:
+    module = importlib.import_module(
+        f"..devices.{device_type.value.lower()}", __package__
+    )
+
+    return getattr(module, device_type.value)
+
+
+class _MethodTable:
+    """Hands a request to the route serving its method, found in a dict.
+
+    The routes are the ones the per-endpoint routers would mount, so requests
+    are parsed, validated and answered exactly as in that mode. As in
+    Starlette's router, the first route whose HTTP verb matches serves the
+    request, and otherwise the first one for the method answers 405.
+    """
+
+    def __init__(self, url_device_type: UrlDeviceType, routes: Iterable[BaseRoute]):
+        self.url_device_type = url_device_type
+        self.routes: Dict[str, List[APIRoute]] = {}
+
+        for route in routes:
+            if isinstance(route, APIRoute):
+                url_method = route.path.rsplit("/", 1)[1]
+                self.routes.setdefault(url_method, []).append(route)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        path_params = scope["path_params"]
+        routes = self.routes.get(path_params["method"])
+        if routes is None:
+            raise HTTPException(status_code=404)
+
+        scope["path_params"] = {
+            "device_type": self.url_device_type.value,
+            "device_number": path_params["device_number"],
+        }
+
+        http_verb = scope["method"]
+        for route in routes:
+            if route.methods is None or http_verb in route.methods:
+                break
+        else:
+            route = routes[0]
+
+        await route.handle(scope, receive, send)
+
+
+def create_route(device_type: DeviceType, routers: Sequence[APIRouter]) -> Route:
+    """Serve every endpoint of one device type from a single route.
+
+    The endpoints of ``routers`` are kept in a table from the method in the
+    URL to its routes, so finding the handler is a dict lookup no matter how
+    many endpoints the device type has.
+    """
+    url_device_type = UrlDeviceType[device_type.name]
+    table = _MethodTable(
+        url_device_type, (route for router in routers for route in router.routes)
+    )
+
+    return Route(
+        f"/api/v1/{url_device_type.value}/{{device_number}}/{{method}}",
+        table,
+    )
+
+
+def create_routes(
+    routers: Dict[DeviceType, APIRouter], common_router: APIRouter
+) -> List[Route]:
+    return [
+        create_route(device_type, [router, common_router])
+        for device_type, router in routers.items()
+    ]
@@ -1,5 +1,4 @@
 import sys
-from typing import List
 
 if sys.version_info >= (3, 9):
     from typing import Annotated
@@ -9,303 +8,326 @@ else:
 import structlog
 from fastapi import APIRouter, Depends, Query
 
-from ..device import Device, UrlDeviceType, device_finder
+from ..device import DeviceRegistry, UrlDeviceType, device_finder
 from ..devices.observingconditions import ObservingConditions
+from ..dispatch import DeviceDispatcher
 from ..request import CommonRequest, PutAveragePeriodRequest, SensorNameRequest
-from ..response import Response, common_endpoint_parameters
+from ..response import HTTPResponse, Response, common_endpoint_parameters
 
 logger: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)
 
 
-def create_router(devices: List[Device]):
+def create_router(registry: DeviceRegistry, dispatcher: DeviceDispatcher):
     router = APIRouter()
 
     async def get_averageperiod(
         req: Annotated[CommonRequest, Query()],
         device: ObservingConditions = Depends(
-            device_finder(devices, UrlDeviceType.ObservingConditions)
+            device_finder(registry, UrlDeviceType.ObservingConditions)
         ),
-    ) -> Response[float]:
-        return Response[float].from_request(
+    ) -> HTTPResponse:
+        return Response[float].encode(
             req,
-            device.get_averageperiod(req),
+            await dispatcher.call(device.get_averageperiod, req),
         )
 
     async def put_averageperiod(
         req: Annotated[PutAveragePeriodRequest, Query()],
         device: ObservingConditions = Depends(
-            device_finder(devices, UrlDeviceType.ObservingConditions)
+            device_finder(registry, UrlDeviceType.ObservingConditions)
         ),
-    ) -> Response[None]:
-        return Response[None].from_request(
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_averageperiod, req)
+
+        return Response[None].encode(
             req,
-            device.put_averageperiod(req),
+            None,
         )
 
     async def get_cloudcover(
         req: Annotated[CommonRequest, Query()],
         device: ObservingConditions = Depends(
-            device_finder(devices, UrlDeviceType.ObservingConditions)
+            device_finder(registry, UrlDeviceType.ObservingConditions)
         ),
-    ) -> Response[float]:
-        return Response[float].from_request(
+    ) -> HTTPResponse:
+        return Response[float].encode(
             req,
-            device.get_cloudcover(req),
+            await dispatcher.call(device.get_cloudcover, req),
         )
 
     async def get_dewpoint(
         req: Annotated[CommonRequest, Query()],
         device: ObservingConditions = Depends(
-            device_finder(devices, UrlDeviceType.ObservingConditions)
+            device_finder(registry, UrlDeviceType.ObservingConditions)
         ),
-    ) -> Response[float]:
-        return Response[float].from_request(
+    ) -> HTTPResponse:
+        return Response[float].encode(
             req,
-            device.get_dewpoint(req),
+            await dispatcher.call(device.get_dewpoint, req),
         )
 
     async def get_humidity(
         req: Annotated[CommonRequest, Query()],
         device: ObservingConditions = Depends(
-            device_finder(devices, UrlDeviceType.ObservingConditions)
+            device_finder(registry, UrlDeviceType.ObservingConditions)
         ),
-    ) -> Response[float]:
-        return Response[float].from_request(
+    ) -> HTTPResponse:
+        return Response[float].encode(
             req,
-            device.get_humidity(req),
+            await dispatcher.call(device.get_humidity, req),
         )
 
     async def get_pressure(
         req: Annotated[CommonRequest, Query()],
         device: ObservingConditions = Depends(
-            device_finder(devices, UrlDeviceType.ObservingConditions)
+            device_finder(registry, UrlDeviceType.ObservingConditions)
         ),
-    ) -> Response[float]:
-        return Response[float].from_request(
+    ) -> HTTPResponse:
+        return Response[float].encode(
             req,
-            device.get_pressure(req),
+            await dispatcher.call(device.get_pressure, req),
         )
 
     async def get_rainrate(
         req: Annotated[CommonRequest, Query()],
         device: ObservingConditions = Depends(
-            device_finder(devices, UrlDeviceType.ObservingConditions)
+            device_finder(registry, UrlDeviceType.ObservingConditions)
         ),
-    ) -> Response[float]:
-        return Response[float].from_request(
+    ) -> HTTPResponse:
+        return Response[float].encode(
             req,
-            device.get_rainrate(req),
+            await dispatcher.call(device.get_rainrate, req),
         )
 
     async def get_skybrightness(
         req: Annotated[CommonRequest, Query()],
         device: ObservingConditions = Depends(
-            device_finder(devices, UrlDeviceType.ObservingConditions)
+            device_finder(registry, UrlDeviceType.ObservingConditions)
         ),
-    ) -> Response[float]:
-        return Response[float].from_request(
+    ) -> HTTPResponse:
+        return Response[float].encode(
             req,
-            device.get_skybrightness(req),
+            await dispatcher.call(device.get_skybrightness, req),
         )
 
     async def get_skyquality(
         req: Annotated[CommonRequest, Query()],
         device: ObservingConditions = Depends(
-            device_finder(devices, UrlDeviceType.ObservingConditions)
+            device_finder(registry, UrlDeviceType.ObservingConditions)
         ),
-    ) -> Response[float]:
-        return Response[float].from_request(
+    ) -> HTTPResponse:
+        return Response[float].encode(
             req,
-            device.get_skyquality(req),
+            await dispatcher.call(device.get_skyquality, req),
         )
 
     async def get_skytemperature(
         req: Annotated[CommonRequest, Query()],
         device: ObservingConditions = Depends(
-            device_finder(devices, UrlDeviceType.ObservingConditions)
+            device_finder(registry, UrlDeviceType.ObservingConditions)
         ),
-    ) -> Response[float]:
-        return Response[float].from_request(
+    ) -> HTTPResponse:
+        return Response[float].encode(
             req,
-            device.get_skytemperature(req),
+            await dispatcher.call(device.get_skytemperature, req),
         )
 
     async def get_starfwhm(
         req: Annotated[CommonRequest, Query()],
         device: ObservingConditions = Depends(
-            device_finder(devices, UrlDeviceType.ObservingConditions)
+            device_finder(registry, UrlDeviceType.ObservingConditions)
         ),
-    ) -> Response[float]:
-        return Response[float].from_request(
+    ) -> HTTPResponse:
+        return Response[float].encode(
             req,
-            device.get_starfwhm(req),
+            await dispatcher.call(device.get_starfwhm, req),
         )
 
     async def get_temperature(
         req: Annotated[CommonRequest, Query()],
         device: ObservingConditions = Depends(
-            device_finder(devices, UrlDeviceType.ObservingConditions)
+            device_finder(registry, UrlDeviceType.ObservingConditions)
         ),
-    ) -> Response[float]:
-        return Response[float].from_request(
+    ) -> HTTPResponse:
+        return Response[float].encode(
             req,
-            device.get_temperature(req),
+            await dispatcher.call(device.get_temperature, req),
         )
 
     async def get_winddirection(
         req: Annotated[CommonRequest, Query()],
         device: ObservingConditions = Depends(
-            device_finder(devices, UrlDeviceType.ObservingConditions)
+            device_finder(registry, UrlDeviceType.ObservingConditions)
         ),
-    ) -> Response[float]:
-        return Response[float].from_request(
+    ) -> HTTPResponse:
+        return Response[float].encode(
             req,
-            device.get_winddirection(req),
+            await dispatcher.call(device.get_winddirection, req),
         )
 
     async def get_windgust(
         req: Annotated[CommonRequest, Query()],
         device: ObservingConditions = Depends(
-            device_finder(devices, UrlDeviceType.ObservingConditions)
+            device_finder(registry, UrlDeviceType.ObservingConditions)
         ),
-    ) -> Response[float]:
-        return Response[float].from_request(
+    ) -> HTTPResponse:
+        return Response[float].encode(
             req,
-            device.get_windgust(req),
+            await dispatcher.call(device.get_windgust, req),
         )
 
     async def get_windspeed(
         req: Annotated[CommonRequest, Query()],
         device: ObservingConditions = Depends(
-            device_finder(devices, UrlDeviceType.ObservingConditions)
+            device_finder(registry, UrlDeviceType.ObservingConditions)
         ),
-    ) -> Response[float]:
-        return Response[float].from_request(
+    ) -> HTTPResponse:
+        return Response[float].encode(
             req,
-            device.get_windspeed(req),
+            await dispatcher.call(device.get_windspeed, req),
         )
 
     async def put_refresh(
         req: Annotated[CommonRequest, Query()],
         device: ObservingConditions = Depends(
-            device_finder(devices, UrlDeviceType.ObservingConditions)
+            device_finder(registry, UrlDeviceType.ObservingConditions)
         ),
-    ) -> Response[None]:
-        return Response[None].from_request(
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_refresh, req)
+
+        return Response[None].encode(
             req,
-            device.put_refresh(req),
+            None,
         )
 
     async def get_sensordescription(
         req: Annotated[SensorNameRequest, Query()],
         device: ObservingConditions = Depends(
-            device_finder(devices, UrlDeviceType.ObservingConditions)
+            device_finder(registry, UrlDeviceType.ObservingConditions)
         ),
-    ) -> Response[str]:
-        return Response[str].from_request(
+    ) -> HTTPResponse:
+        return Response[str].encode(
             req,
-            device.get_sensordescription(req),
+            await dispatcher.call(device.get_sensordescription, req),
         )
 
     async def get_timesincelastupdate(
         req: Annotated[SensorNameRequest, Query()],
         device: ObservingConditions = Depends(
-            device_finder(devices, UrlDeviceType.ObservingConditions)
+            device_finder(registry, UrlDeviceType.ObservingConditions)
         ),
-    ) -> Response[float]:
-        return Response[float].from_request(
+    ) -> HTTPResponse:
+        return Response[float].encode(
             req,
-            device.get_timesincelastupdate(req),
+            await dispatcher.call(device.get_timesincelastupdate, req),
         )
 
     router.get(
         "/observingconditions/{device_number}/averageperiod",
         **common_endpoint_parameters,
+        response_model=Response[float],
     )(get_averageperiod)
 
     router.put(
         "/observingconditions/{device_number}/averageperiod",
         **common_endpoint_parameters,
+        response_model=Response[None],
     )(put_averageperiod)
 
     router.get(
         "/observingconditions/{device_number}/cloudcover",
         **common_endpoint_parameters,
+        response_model=Response[float],
     )(get_cloudcover)
 
     router.get(
         "/observingconditions/{device_number}/dewpoint",
         **common_endpoint_parameters,
+        response_model=Response[float],
     )(get_dewpoint)
 
     router.get(
         "/observingconditions/{device_number}/humidity",
         **common_endpoint_parameters,
+        response_model=Response[float],
     )(get_humidity)
 
     router.get(
         "/observingconditions/{device_number}/pressure",
         **common_endpoint_parameters,
+        response_model=Response[float],
     )(get_pressure)
 
     router.get(
         "/observingconditions/{device_number}/rainrate",
         **common_endpoint_parameters,
+        response_model=Response[float],
     )(get_rainrate)
 
     router.get(
         "/observingconditions/{device_number}/skybrightness",
         **common_endpoint_parameters,
+        response_model=Response[float],
     )(get_skybrightness)
 
     router.get(
         "/observingconditions/{device_number}/skyquality",
         **common_endpoint_parameters,
+        response_model=Response[float],
     )(get_skyquality)
 
     router.get(
         "/observingconditions/{device_number}/skytemperature",
         **common_endpoint_parameters,
+        response_model=Response[float],
     )(get_skytemperature)
 
     router.get(
         "/observingconditions/{device_number}/starfwhm",
         **common_endpoint_parameters,
+        response_model=Response[float],
     )(get_starfwhm)
 
     router.get(
         "/observingconditions/{device_number}/temperature",
         **common_endpoint_parameters,
+        response_model=Response[float],
     )(get_temperature)
 
     router.get(
         "/observingconditions/{device_number}/winddirection",
         **common_endpoint_parameters,
+        response_model=Response[float],
     )(get_winddirection)
 
     router.get(
         "/observingconditions/{device_number}/windgust",
         **common_endpoint_parameters,
+        response_model=Response[float],
     )(get_windgust)
 
     router.get(
         "/observingconditions/{device_number}/windspeed",
         **common_endpoint_parameters,
+        response_model=Response[float],
     )(get_windspeed)
 
     router.put(
         "/observingconditions/{device_number}/refresh",
         **common_endpoint_parameters,
+        response_model=Response[None],
     )(put_refresh)
 
     router.get(
         "/observingconditions/{device_number}/sensordescription",
         **common_endpoint_parameters,
+        response_model=Response[str],
     )(get_sensordescription)
 
     router.get(
         "/observingconditions/{device_number}/timesincelastupdate",
         **common_endpoint_parameters,
+        response_model=Response[float],
     )(get_timesincelastupdate)
 
     return router
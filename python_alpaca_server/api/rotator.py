@@ -1,5 +1,4 @@
 import sys
-from typing import List
 
 if sys.version_info >= (3, 9):
     from typing import Annotated
@@ -9,197 +8,223 @@ else:
 import structlog
 from fastapi import APIRouter, Depends, Query
 
-from ..device import Device, UrlDeviceType, device_finder
+from ..device import DeviceRegistry, UrlDeviceType, device_finder
 from ..devices.rotator import Rotator
+from ..dispatch import DeviceDispatcher
 from ..request import CommonRequest, PutPositionFloatRequest, PutReverseRequest
-from ..response import Response, common_endpoint_parameters
+from ..response import HTTPResponse, Response, common_endpoint_parameters
 
 logger: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)
 
 
-def create_router(devices: List[Device]):
+def create_router(registry: DeviceRegistry, dispatcher: DeviceDispatcher):
     router = APIRouter()
 
     async def get_canreverse(
         req: Annotated[CommonRequest, Query()],
-        device: Rotator = Depends(device_finder(devices, UrlDeviceType.Rotator)),
-    ) -> Response[bool]:
-        return Response[bool].from_request(
+        device: Rotator = Depends(device_finder(registry, UrlDeviceType.Rotator)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
             req,
-            device.get_canreverse(req),
+            await dispatcher.call(device.get_canreverse, req),
         )
 
     async def get_ismoving(
         req: Annotated[CommonRequest, Query()],
-        device: Rotator = Depends(device_finder(devices, UrlDeviceType.Rotator)),
-    ) -> Response[bool]:
-        return Response[bool].from_request(
+        device: Rotator = Depends(device_finder(registry, UrlDeviceType.Rotator)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
             req,
-            device.get_ismoving(req),
+            await dispatcher.call(device.get_ismoving, req),
         )
 
     async def get_mechanicalposition(
         req: Annotated[CommonRequest, Query()],
-        device: Rotator = Depends(device_finder(devices, UrlDeviceType.Rotator)),
-    ) -> Response[float]:
-        return Response[float].from_request(
+        device: Rotator = Depends(device_finder(registry, UrlDeviceType.Rotator)),
+    ) -> HTTPResponse:
+        return Response[float].encode(
             req,
-            device.get_mechanicalposition(req),
+            await dispatcher.call(device.get_mechanicalposition, req),
         )
 
     async def get_position(
         req: Annotated[CommonRequest, Query()],
-        device: Rotator = Depends(device_finder(devices, UrlDeviceType.Rotator)),
-    ) -> Response[float]:
-        return Response[float].from_request(
+        device: Rotator = Depends(device_finder(registry, UrlDeviceType.Rotator)),
+    ) -> HTTPResponse:
+        return Response[float].encode(
             req,
-            device.get_position(req),
+            await dispatcher.call(device.get_position, req),
         )
 
     async def get_reverse(
         req: Annotated[CommonRequest, Query()],
-        device: Rotator = Depends(device_finder(devices, UrlDeviceType.Rotator)),
-    ) -> Response[bool]:
-        return Response[bool].from_request(
+        device: Rotator = Depends(device_finder(registry, UrlDeviceType.Rotator)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
             req,
-            device.get_reverse(req),
+            await dispatcher.call(device.get_reverse, req),
         )
 
     async def put_reverse(
         req: Annotated[PutReverseRequest, Query()],
-        device: Rotator = Depends(device_finder(devices, UrlDeviceType.Rotator)),
-    ) -> Response[None]:
-        return Response[None].from_request(
+        device: Rotator = Depends(device_finder(registry, UrlDeviceType.Rotator)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_reverse, req)
+
+        return Response[None].encode(
             req,
-            device.put_reverse(req),
+            None,
         )
 
     async def get_stepsize(
         req: Annotated[CommonRequest, Query()],
-        device: Rotator = Depends(device_finder(devices, UrlDeviceType.Rotator)),
-    ) -> Response[float]:
-        return Response[float].from_request(
+        device: Rotator = Depends(device_finder(registry, UrlDeviceType.Rotator)),
+    ) -> HTTPResponse:
+        return Response[float].encode(
             req,
-            device.get_stepsize(req),
+            await dispatcher.call(device.get_stepsize, req),
         )
 
     async def get_targetposition(
         req: Annotated[CommonRequest, Query()],
-        device: Rotator = Depends(device_finder(devices, UrlDeviceType.Rotator)),
-    ) -> Response[float]:
-        return Response[float].from_request(
+        device: Rotator = Depends(device_finder(registry, UrlDeviceType.Rotator)),
+    ) -> HTTPResponse:
+        return Response[float].encode(
             req,
-            device.get_targetposition(req),
+            await dispatcher.call(device.get_targetposition, req),
         )
 
     async def put_halt(
         req: Annotated[CommonRequest, Query()],
-        device: Rotator = Depends(device_finder(devices, UrlDeviceType.Rotator)),
-    ) -> Response[None]:
-        return Response[None].from_request(
+        device: Rotator = Depends(device_finder(registry, UrlDeviceType.Rotator)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_halt, req)
+
+        return Response[None].encode(
             req,
-            device.put_halt(req),
+            None,
         )
 
     async def put_move(
         req: Annotated[PutPositionFloatRequest, Query()],
-        device: Rotator = Depends(device_finder(devices, UrlDeviceType.Rotator)),
-    ) -> Response[None]:
-        return Response[None].from_request(
+        device: Rotator = Depends(device_finder(registry, UrlDeviceType.Rotator)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_move, req)
+
+        return Response[None].encode(
             req,
-            device.put_move(req),
+            None,
         )
 
     async def put_moveabsolute(
         req: Annotated[PutPositionFloatRequest, Query()],
-        device: Rotator = Depends(device_finder(devices, UrlDeviceType.Rotator)),
-    ) -> Response[None]:
-        return Response[None].from_request(
+        device: Rotator = Depends(device_finder(registry, UrlDeviceType.Rotator)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_moveabsolute, req)
+
+        return Response[None].encode(
             req,
-            device.put_moveabsolute(req),
+            None,
         )
 
     async def put_movemechanical(
         req: Annotated[PutPositionFloatRequest, Query()],
-        device: Rotator = Depends(device_finder(devices, UrlDeviceType.Rotator)),
-    ) -> Response[None]:
-        return Response[None].from_request(
+        device: Rotator = Depends(device_finder(registry, UrlDeviceType.Rotator)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_movemechanical, req)
+
+        return Response[None].encode(
             req,
-            device.put_movemechanical(req),
+            None,
         )
 
     async def put_sync(
         req: Annotated[PutPositionFloatRequest, Query()],
-        device: Rotator = Depends(device_finder(devices, UrlDeviceType.Rotator)),
-    ) -> Response[None]:
-        return Response[None].from_request(
+        device: Rotator = Depends(device_finder(registry, UrlDeviceType.Rotator)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_sync, req)
+
+        return Response[None].encode(
             req,
-            device.put_sync(req),
+            None,
         )
 
     router.get(
         "/rotator/{device_number}/canreverse",
         **common_endpoint_parameters,
+        response_model=Response[bool],
     )(get_canreverse)
 
     router.get(
         "/rotator/{device_number}/ismoving",
         **common_endpoint_parameters,
+        response_model=Response[bool],
     )(get_ismoving)
 
     router.get(
         "/rotator/{device_number}/mechanicalposition",
         **common_endpoint_parameters,
+        response_model=Response[float],
     )(get_mechanicalposition)
 
     router.get(
         "/rotator/{device_number}/position",
         **common_endpoint_parameters,
+        response_model=Response[float],
     )(get_position)
 
     router.get(
         "/rotator/{device_number}/reverse",
         **common_endpoint_parameters,
+        response_model=Response[bool],
     )(get_reverse)
 
     router.put(
         "/rotator/{device_number}/reverse",
         **common_endpoint_parameters,
+        response_model=Response[None],
     )(put_reverse)
 
     router.get(
         "/rotator/{device_number}/stepsize",
         **common_endpoint_parameters,
+        response_model=Response[float],
     )(get_stepsize)
 
     router.get(
         "/rotator/{device_number}/targetposition",
         **common_endpoint_parameters,
+        response_model=Response[float],
     )(get_targetposition)
 
     router.put(
         "/rotator/{device_number}/halt",
         **common_endpoint_parameters,
+        response_model=Response[None],
     )(put_halt)
 
     router.put(
         "/rotator/{device_number}/move",
         **common_endpoint_parameters,
+        response_model=Response[None],
     )(put_move)
 
     router.put(
         "/rotator/{device_number}/moveabsolute",
         **common_endpoint_parameters,
+        response_model=Response[None],
     )(put_moveabsolute)
 
     router.put(
         "/rotator/{device_number}/movemechanical",
         **common_endpoint_parameters,
+        response_model=Response[None],
     )(put_movemechanical)
 
     router.put(
         "/rotator/{device_number}/sync",
         **common_endpoint_parameters,
+        response_model=Response[None],
     )(put_sync)
 
     return router
@@ -1,5 +1,4 @@
 import sys
-from typing import List
 
 if sys.version_info >= (3, 9):
     from typing import Annotated
@@ -9,31 +8,33 @@ else:
 import structlog
 from fastapi import APIRouter, Depends, Query
 
-from ..device import Device, UrlDeviceType, device_finder
+from ..device import DeviceRegistry, UrlDeviceType, device_finder
 from ..devices.safetymonitor import SafetyMonitor
+from ..dispatch import DeviceDispatcher
 from ..request import CommonRequest
-from ..response import Response, common_endpoint_parameters
+from ..response import HTTPResponse, Response, common_endpoint_parameters
 
 logger: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)
 
 
-def create_router(devices: List[Device]):
+def create_router(registry: DeviceRegistry, dispatcher: DeviceDispatcher):
     router = APIRouter()
 
     async def get_issafe(
         req: Annotated[CommonRequest, Query()],
         device: SafetyMonitor = Depends(
-            device_finder(devices, UrlDeviceType.SafetyMonitor)
+            device_finder(registry, UrlDeviceType.SafetyMonitor)
         ),
-    ) -> Response[bool]:
-        return Response[bool].from_request(
+    ) -> HTTPResponse:
+        return Response[bool].encode(
             req,
-            device.get_issafe(req),
+            await dispatcher.call(device.get_issafe, req),
         )
 
     router.get(
         "/safetymonitor/{device_number}/issafe",
         **common_endpoint_parameters,
+        response_model=Response[bool],
     )(get_issafe)
 
     return router
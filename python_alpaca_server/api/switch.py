@@ -1,5 +1,4 @@
 import sys
-from typing import List
 
 if sys.version_info >= (3, 9):
     from typing import Annotated
@@ -9,8 +8,9 @@ else:
 import structlog
 from fastapi import APIRouter, Depends, Query
 
-from ..device import Device, UrlDeviceType, device_finder
+from ..device import DeviceRegistry, UrlDeviceType, device_finder
 from ..devices.switch import Switch
+from ..dispatch import DeviceDispatcher
 from ..request import (
     CommonRequest,
     IdRequest,
@@ -18,166 +18,183 @@ from ..request import (
     PutIdStateRequest,
     PutIdValueRequest,
 )
-from ..response import Response, common_endpoint_parameters
+from ..response import HTTPResponse, Response, common_endpoint_parameters
 
 logger: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)
 
 
-def create_router(devices: List[Device]):
+def create_router(registry: DeviceRegistry, dispatcher: DeviceDispatcher):
     router = APIRouter()
 
     async def get_maxswitch(
         req: Annotated[CommonRequest, Query()],
-        device: Switch = Depends(device_finder(devices, UrlDeviceType.Switch)),
-    ) -> Response[int]:
-        return Response[int].from_request(
+        device: Switch = Depends(device_finder(registry, UrlDeviceType.Switch)),
+    ) -> HTTPResponse:
+        return Response[int].encode(
             req,
-            device.get_maxswitch(req),
+            await dispatcher.call(device.get_maxswitch, req),
         )
 
     async def get_canwrite(
         req: Annotated[IdRequest, Query()],
-        device: Switch = Depends(device_finder(devices, UrlDeviceType.Switch)),
-    ) -> Response[bool]:
-        return Response[bool].from_request(
+        device: Switch = Depends(device_finder(registry, UrlDeviceType.Switch)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
             req,
-            device.get_canwrite(req),
+            await dispatcher.call(device.get_canwrite, req),
         )
 
     async def get_getswitch(
         req: Annotated[IdRequest, Query()],
-        device: Switch = Depends(device_finder(devices, UrlDeviceType.Switch)),
-    ) -> Response[bool]:
-        return Response[bool].from_request(
+        device: Switch = Depends(device_finder(registry, UrlDeviceType.Switch)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
             req,
-            device.get_getswitch(req),
+            await dispatcher.call(device.get_getswitch, req),
         )
 
     async def get_getswitchdescription(
         req: Annotated[IdRequest, Query()],
-        device: Switch = Depends(device_finder(devices, UrlDeviceType.Switch)),
-    ) -> Response[str]:
-        return Response[str].from_request(
+        device: Switch = Depends(device_finder(registry, UrlDeviceType.Switch)),
+    ) -> HTTPResponse:
+        return Response[str].encode(
             req,
-            device.get_getswitchdescription(req),
+            await dispatcher.call(device.get_getswitchdescription, req),
         )
 
     async def get_getswitchname(
         req: Annotated[IdRequest, Query()],
-        device: Switch = Depends(device_finder(devices, UrlDeviceType.Switch)),
-    ) -> Response[str]:
-        return Response[str].from_request(
+        device: Switch = Depends(device_finder(registry, UrlDeviceType.Switch)),
+    ) -> HTTPResponse:
+        return Response[str].encode(
             req,
-            device.get_getswitchname(req),
+            await dispatcher.call(device.get_getswitchname, req),
         )
 
     async def get_getswitchvalue(
         req: Annotated[IdRequest, Query()],
-        device: Switch = Depends(device_finder(devices, UrlDeviceType.Switch)),
-    ) -> Response[float]:
-        return Response[float].from_request(
+        device: Switch = Depends(device_finder(registry, UrlDeviceType.Switch)),
+    ) -> HTTPResponse:
+        return Response[float].encode(
             req,
-            device.get_getswitchvalue(req),
+            await dispatcher.call(device.get_getswitchvalue, req),
         )
 
     async def get_minswitchvalue(
         req: Annotated[IdRequest, Query()],
-        device: Switch = Depends(device_finder(devices, UrlDeviceType.Switch)),
-    ) -> Response[float]:
-        return Response[float].from_request(
+        device: Switch = Depends(device_finder(registry, UrlDeviceType.Switch)),
+    ) -> HTTPResponse:
+        return Response[float].encode(
             req,
-            device.get_minswitchvalue(req),
+            await dispatcher.call(device.get_minswitchvalue, req),
         )
 
     async def get_maxswitchvalue(
         req: Annotated[IdRequest, Query()],
-        device: Switch = Depends(device_finder(devices, UrlDeviceType.Switch)),
-    ) -> Response[float]:
-        return Response[float].from_request(
+        device: Switch = Depends(device_finder(registry, UrlDeviceType.Switch)),
+    ) -> HTTPResponse:
+        return Response[float].encode(
             req,
-            device.get_maxswitchvalue(req),
+            await dispatcher.call(device.get_maxswitchvalue, req),
         )
 
     async def put_setswitch(
         req: Annotated[PutIdStateRequest, Query()],
-        device: Switch = Depends(device_finder(devices, UrlDeviceType.Switch)),
-    ) -> Response[None]:
-        return Response[None].from_request(
+        device: Switch = Depends(device_finder(registry, UrlDeviceType.Switch)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_setswitch, req)
+
+        return Response[None].encode(
             req,
-            device.put_setswitch(req),
+            None,
         )
 
     async def put_setswitchname(
         req: Annotated[PutIdNameRequest, Query()],
-        device: Switch = Depends(device_finder(devices, UrlDeviceType.Switch)),
-    ) -> Response[None]:
-        return Response[None].from_request(
+        device: Switch = Depends(device_finder(registry, UrlDeviceType.Switch)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_setswitchname, req)
+
+        return Response[None].encode(
             req,
-            device.put_setswitchname(req),
+            None,
         )
 
     async def put_setswitchvalue(
         req: Annotated[PutIdValueRequest, Query()],
-        device: Switch = Depends(device_finder(devices, UrlDeviceType.Switch)),
-    ) -> Response[None]:
-        return Response[None].from_request(
+        device: Switch = Depends(device_finder(registry, UrlDeviceType.Switch)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_setswitchvalue, req)
+
+        return Response[None].encode(
             req,
-            device.put_setswitchvalue(req),
+            None,
         )
 
     router.get(
         "/switch/{device_number}/maxswitch",
         **common_endpoint_parameters,
+        response_model=Response[int],
     )(get_maxswitch)
 
     router.get(
         "/switch/{device_number}/canwrite",
         **common_endpoint_parameters,
+        response_model=Response[bool],
     )(get_canwrite)
 
     router.get(
         "/switch/{device_number}/getswitch",
         **common_endpoint_parameters,
+        response_model=Response[bool],
     )(get_getswitch)
 
     router.get(
         "/switch/{device_number}/getswitchdescription",
         **common_endpoint_parameters,
+        response_model=Response[str],
     )(get_getswitchdescription)
 
     router.get(
         "/switch/{device_number}/getswitchname",
         **common_endpoint_parameters,
+        response_model=Response[str],
     )(get_getswitchname)
 
     router.get(
         "/switch/{device_number}/getswitchvalue",
         **common_endpoint_parameters,
+        response_model=Response[float],
     )(get_getswitchvalue)
 
     router.get(
         "/switch/{device_number}/minswitchvalue",
         **common_endpoint_parameters,
+        response_model=Response[float],
     )(get_minswitchvalue)
 
     router.get(
         "/switch/{device_number}/maxswitchvalue",
         **common_endpoint_parameters,
+        response_model=Response[float],
     )(get_maxswitchvalue)
 
     router.put(
         "/switch/{device_number}/setswitch",
         **common_endpoint_parameters,
+        response_model=Response[None],
     )(put_setswitch)
 
     router.put(
         "/switch/{device_number}/setswitchname",
         **common_endpoint_parameters,
+        response_model=Response[None],
     )(put_setswitchname)
 
     router.put(
         "/switch/{device_number}/setswitchvalue",
         **common_endpoint_parameters,
+        response_model=Response[None],
     )(put_setswitchvalue)
 
     return router
@@ -0,0 +1,1315 @@
+import sys
+from typing import List
+
+if sys.version_info >= (3, 9):
+    from typing import Annotated
+else:
+    from typing_extensions import Annotated
+
+import structlog
+from fastapi import APIRouter, Depends, Query
+
+from ..device import DeviceRegistry, UrlDeviceType, device_finder
+from ..devices.telescope import (
+    AlignmentMode,
+    AxisRate,
+    EquatorialCoordinateType,
+    Telescope,
+)
+from ..dispatch import DeviceDispatcher
+from ..request import (
+    AltAzRequest,
+    AxisRequest,
+    CommonRequest,
+    CoordinatesRequest,
+    DriveRate,
+    PierSide,
+    PutDeclinationRateRequest,
+    PutDoesRefractionRequest,
+    PutGuideRateDeclinationRequest,
+    PutGuideRateRightAscensionRequest,
+    PutMoveAxisRequest,
+    PutPulseGuideRequest,
+    PutRightAscensionRateRequest,
+    PutSideOfPierRequest,
+    PutSiteElevationRequest,
+    PutSiteLatitudeRequest,
+    PutSiteLongitudeRequest,
+    PutSlewSettleTimeRequest,
+    PutTargetDeclinationRequest,
+    PutTargetRightAscensionRequest,
+    PutTrackingRateRequest,
+    PutTrackingRequest,
+    PutUTCDateRequest,
+)
+from ..response import HTTPResponse, Response, common_endpoint_parameters
+
+logger: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)
+
+
+def create_router(registry: DeviceRegistry, dispatcher: DeviceDispatcher):
+    router = APIRouter()
+
+    async def put_abortslew(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_abortslew, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def get_alignmentmode(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[AlignmentMode].encode(
+            req,
+            await dispatcher.call(device.get_alignmentmode, req),
+        )
+
+    async def get_altitude(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[float].encode(
+            req,
+            await dispatcher.call(device.get_altitude, req),
+        )
+
+    async def get_aperturearea(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[float].encode(
+            req,
+            await dispatcher.call(device.get_aperturearea, req),
+        )
+
+    async def get_aperturediameter(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[float].encode(
+            req,
+            await dispatcher.call(device.get_aperturediameter, req),
+        )
+
+    async def get_athome(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
+            req,
+            await dispatcher.call(device.get_athome, req),
+        )
+
+    async def get_atpark(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
+            req,
+            await dispatcher.call(device.get_atpark, req),
+        )
+
+    async def get_axisrates(
+        req: Annotated[AxisRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[List[AxisRate]].encode(
+            req,
+            await dispatcher.call(device.get_axisrates, req),
+        )
+
+    async def get_azimuth(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[float].encode(
+            req,
+            await dispatcher.call(device.get_azimuth, req),
+        )
+
+    async def get_canfindhome(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
+            req,
+            await dispatcher.call(device.get_canfindhome, req),
+        )
+
+    async def get_canmoveaxis(
+        req: Annotated[AxisRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
+            req,
+            await dispatcher.call(device.get_canmoveaxis, req),
+        )
+
+    async def get_canpark(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
+            req,
+            await dispatcher.call(device.get_canpark, req),
+        )
+
+    async def get_canpulseguide(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
+            req,
+            await dispatcher.call(device.get_canpulseguide, req),
+        )
+
+    async def get_cansetdeclinationrate(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
+            req,
+            await dispatcher.call(device.get_cansetdeclinationrate, req),
+        )
+
+    async def get_cansetguiderates(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
+            req,
+            await dispatcher.call(device.get_cansetguiderates, req),
+        )
+
+    async def get_cansetpark(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
+            req,
+            await dispatcher.call(device.get_cansetpark, req),
+        )
+
+    async def get_cansetpierside(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
+            req,
+            await dispatcher.call(device.get_cansetpierside, req),
+        )
+
+    async def get_cansetrightascensionrate(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
+            req,
+            await dispatcher.call(device.get_cansetrightascensionrate, req),
+        )
+
+    async def get_cansettracking(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
+            req,
+            await dispatcher.call(device.get_cansettracking, req),
+        )
+
+    async def get_canslew(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
+            req,
+            await dispatcher.call(device.get_canslew, req),
+        )
+
+    async def get_canslewaltaz(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
+            req,
+            await dispatcher.call(device.get_canslewaltaz, req),
+        )
+
+    async def get_canslewaltazasync(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
+            req,
+            await dispatcher.call(device.get_canslewaltazasync, req),
+        )
+
+    async def get_canslewasync(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
+            req,
+            await dispatcher.call(device.get_canslewasync, req),
+        )
+
+    async def get_cansync(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
+            req,
+            await dispatcher.call(device.get_cansync, req),
+        )
+
+    async def get_cansyncaltaz(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
+            req,
+            await dispatcher.call(device.get_cansyncaltaz, req),
+        )
+
+    async def get_canunpark(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
+            req,
+            await dispatcher.call(device.get_canunpark, req),
+        )
+
+    async def get_declination(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[float].encode(
+            req,
+            await dispatcher.call(device.get_declination, req),
+        )
+
+    async def get_declinationrate(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[float].encode(
+            req,
+            await dispatcher.call(device.get_declinationrate, req),
+        )
+
+    async def put_declinationrate(
+        req: Annotated[PutDeclinationRateRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_declinationrate, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def get_destinationsideofpier(
+        req: Annotated[CoordinatesRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[PierSide].encode(
+            req,
+            await dispatcher.call(device.get_destinationsideofpier, req),
+        )
+
+    async def get_doesrefraction(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
+            req,
+            await dispatcher.call(device.get_doesrefraction, req),
+        )
+
+    async def put_doesrefraction(
+        req: Annotated[PutDoesRefractionRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_doesrefraction, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def get_equatorialsystem(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[EquatorialCoordinateType].encode(
+            req,
+            await dispatcher.call(device.get_equatorialsystem, req),
+        )
+
+    async def put_findhome(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_findhome, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def get_focallength(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[float].encode(
+            req,
+            await dispatcher.call(device.get_focallength, req),
+        )
+
+    async def get_guideratedeclination(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[float].encode(
+            req,
+            await dispatcher.call(device.get_guideratedeclination, req),
+        )
+
+    async def put_guideratedeclination(
+        req: Annotated[PutGuideRateDeclinationRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_guideratedeclination, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def get_guideraterightascension(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[float].encode(
+            req,
+            await dispatcher.call(device.get_guideraterightascension, req),
+        )
+
+    async def put_guideraterightascension(
+        req: Annotated[PutGuideRateRightAscensionRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_guideraterightascension, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def get_ispulseguiding(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
+            req,
+            await dispatcher.call(device.get_ispulseguiding, req),
+        )
+
+    async def put_moveaxis(
+        req: Annotated[PutMoveAxisRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_moveaxis, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def put_park(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_park, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def put_pulseguide(
+        req: Annotated[PutPulseGuideRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_pulseguide, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def get_rightascension(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[float].encode(
+            req,
+            await dispatcher.call(device.get_rightascension, req),
+        )
+
+    async def get_rightascensionrate(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[float].encode(
+            req,
+            await dispatcher.call(device.get_rightascensionrate, req),
+        )
+
+    async def put_rightascensionrate(
+        req: Annotated[PutRightAscensionRateRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_rightascensionrate, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def put_setpark(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_setpark, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def get_sideofpier(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[PierSide].encode(
+            req,
+            await dispatcher.call(device.get_sideofpier, req),
+        )
+
+    async def put_sideofpier(
+        req: Annotated[PutSideOfPierRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_sideofpier, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def get_siderealtime(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[float].encode(
+            req,
+            await dispatcher.call(device.get_siderealtime, req),
+        )
+
+    async def get_siteelevation(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[float].encode(
+            req,
+            await dispatcher.call(device.get_siteelevation, req),
+        )
+
+    async def put_siteelevation(
+        req: Annotated[PutSiteElevationRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_siteelevation, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def get_sitelatitude(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[float].encode(
+            req,
+            await dispatcher.call(device.get_sitelatitude, req),
+        )
+
+    async def put_sitelatitude(
+        req: Annotated[PutSiteLatitudeRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_sitelatitude, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def get_sitelongitude(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[float].encode(
+            req,
+            await dispatcher.call(device.get_sitelongitude, req),
+        )
+
+    async def put_sitelongitude(
+        req: Annotated[PutSiteLongitudeRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_sitelongitude, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def get_slewing(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
+            req,
+            await dispatcher.call(device.get_slewing, req),
+        )
+
+    async def get_slewsettletime(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[int].encode(
+            req,
+            await dispatcher.call(device.get_slewsettletime, req),
+        )
+
+    async def put_slewsettletime(
+        req: Annotated[PutSlewSettleTimeRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_slewsettletime, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def put_slewtoaltaz(
+        req: Annotated[AltAzRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_slewtoaltaz, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def put_slewtoaltazasync(
+        req: Annotated[AltAzRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_slewtoaltazasync, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def put_slewtocoordinates(
+        req: Annotated[CoordinatesRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_slewtocoordinates, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def put_slewtocoordinatesasync(
+        req: Annotated[CoordinatesRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_slewtocoordinatesasync, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def put_slewtotarget(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_slewtotarget, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def put_slewtotargetasync(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_slewtotargetasync, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def put_synctoaltaz(
+        req: Annotated[AltAzRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_synctoaltaz, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def put_synctocoordinates(
+        req: Annotated[CoordinatesRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_synctocoordinates, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def put_synctotarget(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_synctotarget, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def get_targetdeclination(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[float].encode(
+            req,
+            await dispatcher.call(device.get_targetdeclination, req),
+        )
+
+    async def put_targetdeclination(
+        req: Annotated[PutTargetDeclinationRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_targetdeclination, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def get_targetrightascension(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[float].encode(
+            req,
+            await dispatcher.call(device.get_targetrightascension, req),
+        )
+
+    async def put_targetrightascension(
+        req: Annotated[PutTargetRightAscensionRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_targetrightascension, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def get_tracking(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[bool].encode(
+            req,
+            await dispatcher.call(device.get_tracking, req),
+        )
+
+    async def put_tracking(
+        req: Annotated[PutTrackingRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_tracking, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def get_trackingrate(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[DriveRate].encode(
+            req,
+            await dispatcher.call(device.get_trackingrate, req),
+        )
+
+    async def put_trackingrate(
+        req: Annotated[PutTrackingRateRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_trackingrate, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def get_trackingrates(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[List[DriveRate]].encode(
+            req,
+            await dispatcher.call(device.get_trackingrates, req),
+        )
+
+    async def put_unpark(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_unpark, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    async def get_utcdate(
+        req: Annotated[CommonRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        return Response[str].encode(
+            req,
+            await dispatcher.call(device.get_utcdate, req),
+        )
+
+    async def put_utcdate(
+        req: Annotated[PutUTCDateRequest, Query()],
+        device: Telescope = Depends(device_finder(registry, UrlDeviceType.Telescope)),
+    ) -> HTTPResponse:
+        await dispatcher.call(device.put_utcdate, req)
+
+        return Response[None].encode(
+            req,
+            None,
+        )
+
+    router.put(
+        "/telescope/{device_number}/abortslew",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_abortslew)
+
+    router.get(
+        "/telescope/{device_number}/alignmentmode",
+        **common_endpoint_parameters,
+        response_model=Response[AlignmentMode],
+    )(get_alignmentmode)
+
+    router.get(
+        "/telescope/{device_number}/altitude",
+        **common_endpoint_parameters,
+        response_model=Response[float],
+    )(get_altitude)
+
+    router.get(
+        "/telescope/{device_number}/aperturearea",
+        **common_endpoint_parameters,
+        response_model=Response[float],
+    )(get_aperturearea)
+
+    router.get(
+        "/telescope/{device_number}/aperturediameter",
+        **common_endpoint_parameters,
+        response_model=Response[float],
+    )(get_aperturediameter)
+
+    router.get(
+        "/telescope/{device_number}/athome",
+        **common_endpoint_parameters,
+        response_model=Response[bool],
+    )(get_athome)
+
+    router.get(
+        "/telescope/{device_number}/atpark",
+        **common_endpoint_parameters,
+        response_model=Response[bool],
+    )(get_atpark)
+
+    router.get(
+        "/telescope/{device_number}/axisrates",
+        **common_endpoint_parameters,
+        response_model=Response[List[AxisRate]],
+    )(get_axisrates)
+
+    router.get(
+        "/telescope/{device_number}/azimuth",
+        **common_endpoint_parameters,
+        response_model=Response[float],
+    )(get_azimuth)
+
+    router.get(
+        "/telescope/{device_number}/canfindhome",
+        **common_endpoint_parameters,
+        response_model=Response[bool],
+    )(get_canfindhome)
+
+    router.get(
+        "/telescope/{device_number}/canmoveaxis",
+        **common_endpoint_parameters,
+        response_model=Response[bool],
+    )(get_canmoveaxis)
+
+    router.get(
+        "/telescope/{device_number}/canpark",
+        **common_endpoint_parameters,
+        response_model=Response[bool],
+    )(get_canpark)
+
+    router.get(
+        "/telescope/{device_number}/canpulseguide",
+        **common_endpoint_parameters,
+        response_model=Response[bool],
+    )(get_canpulseguide)
+
+    router.get(
+        "/telescope/{device_number}/cansetdeclinationrate",
+        **common_endpoint_parameters,
+        response_model=Response[bool],
+    )(get_cansetdeclinationrate)
+
+    router.get(
+        "/telescope/{device_number}/cansetguiderates",
+        **common_endpoint_parameters,
+        response_model=Response[bool],
+    )(get_cansetguiderates)
+
+    router.get(
+        "/telescope/{device_number}/cansetpark",
+        **common_endpoint_parameters,
+        response_model=Response[bool],
+    )(get_cansetpark)
+
+    router.get(
+        "/telescope/{device_number}/cansetpierside",
+        **common_endpoint_parameters,
+        response_model=Response[bool],
+    )(get_cansetpierside)
+
+    router.get(
+        "/telescope/{device_number}/cansetrightascensionrate",
+        **common_endpoint_parameters,
+        response_model=Response[bool],
+    )(get_cansetrightascensionrate)
+
+    router.get(
+        "/telescope/{device_number}/cansettracking",
+        **common_endpoint_parameters,
+        response_model=Response[bool],
+    )(get_cansettracking)
+
+    router.get(
+        "/telescope/{device_number}/canslew",
+        **common_endpoint_parameters,
+        response_model=Response[bool],
+    )(get_canslew)
+
+    router.get(
+        "/telescope/{device_number}/canslewaltaz",
+        **common_endpoint_parameters,
+        response_model=Response[bool],
+    )(get_canslewaltaz)
+
+    router.get(
+        "/telescope/{device_number}/canslewaltazasync",
+        **common_endpoint_parameters,
+        response_model=Response[bool],
+    )(get_canslewaltazasync)
+
+    router.get(
+        "/telescope/{device_number}/canslewasync",
+        **common_endpoint_parameters,
+        response_model=Response[bool],
+    )(get_canslewasync)
+
+    router.get(
+        "/telescope/{device_number}/cansync",
+        **common_endpoint_parameters,
+        response_model=Response[bool],
+    )(get_cansync)
+
+    router.get(
+        "/telescope/{device_number}/cansyncaltaz",
+        **common_endpoint_parameters,
+        response_model=Response[bool],
+    )(get_cansyncaltaz)
+
+    router.get(
+        "/telescope/{device_number}/canunpark",
+        **common_endpoint_parameters,
+        response_model=Response[bool],
+    )(get_canunpark)
+
+    router.get(
+        "/telescope/{device_number}/declination",
+        **common_endpoint_parameters,
+        response_model=Response[float],
+    )(get_declination)
+
+    router.get(
+        "/telescope/{device_number}/declinationrate",
+        **common_endpoint_parameters,
+        response_model=Response[float],
+    )(get_declinationrate)
+
+    router.put(
+        "/telescope/{device_number}/declinationrate",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_declinationrate)
+
+    router.get(
+        "/telescope/{device_number}/destinationsideofpier",
+        **common_endpoint_parameters,
+        response_model=Response[PierSide],
+    )(get_destinationsideofpier)
+
+    router.get(
+        "/telescope/{device_number}/doesrefraction",
+        **common_endpoint_parameters,
+        response_model=Response[bool],
+    )(get_doesrefraction)
+
+    router.put(
+        "/telescope/{device_number}/doesrefraction",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_doesrefraction)
+
+    router.get(
+        "/telescope/{device_number}/equatorialsystem",
+        **common_endpoint_parameters,
+        response_model=Response[EquatorialCoordinateType],
+    )(get_equatorialsystem)
+
+    router.put(
+        "/telescope/{device_number}/findhome",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_findhome)
+
+    router.get(
+        "/telescope/{device_number}/focallength",
+        **common_endpoint_parameters,
+        response_model=Response[float],
+    )(get_focallength)
+
+    router.get(
+        "/telescope/{device_number}/guideratedeclination",
+        **common_endpoint_parameters,
+        response_model=Response[float],
+    )(get_guideratedeclination)
+
+    router.put(
+        "/telescope/{device_number}/guideratedeclination",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_guideratedeclination)
+
+    router.get(
+        "/telescope/{device_number}/guideraterightascension",
+        **common_endpoint_parameters,
+        response_model=Response[float],
+    )(get_guideraterightascension)
+
+    router.put(
+        "/telescope/{device_number}/guideraterightascension",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_guideraterightascension)
+
+    router.get(
+        "/telescope/{device_number}/ispulseguiding",
+        **common_endpoint_parameters,
+        response_model=Response[bool],
+    )(get_ispulseguiding)
+
+    router.put(
+        "/telescope/{device_number}/moveaxis",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_moveaxis)
+
+    router.put(
+        "/telescope/{device_number}/park",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_park)
+
+    router.put(
+        "/telescope/{device_number}/pulseguide",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_pulseguide)
+
+    router.get(
+        "/telescope/{device_number}/rightascension",
+        **common_endpoint_parameters,
+        response_model=Response[float],
+    )(get_rightascension)
+
+    router.get(
+        "/telescope/{device_number}/rightascensionrate",
+        **common_endpoint_parameters,
+        response_model=Response[float],
+    )(get_rightascensionrate)
+
+    router.put(
+        "/telescope/{device_number}/rightascensionrate",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_rightascensionrate)
+
+    router.put(
+        "/telescope/{device_number}/setpark",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_setpark)
+
+    router.get(
+        "/telescope/{device_number}/sideofpier",
+        **common_endpoint_parameters,
+        response_model=Response[PierSide],
+    )(get_sideofpier)
+
+    router.put(
+        "/telescope/{device_number}/sideofpier",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_sideofpier)
+
+    router.get(
+        "/telescope/{device_number}/siderealtime",
+        **common_endpoint_parameters,
+        response_model=Response[float],
+    )(get_siderealtime)
+
+    router.get(
+        "/telescope/{device_number}/siteelevation",
+        **common_endpoint_parameters,
+        response_model=Response[float],
+    )(get_siteelevation)
+
+    router.put(
+        "/telescope/{device_number}/siteelevation",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_siteelevation)
+
+    router.get(
+        "/telescope/{device_number}/sitelatitude",
+        **common_endpoint_parameters,
+        response_model=Response[float],
+    )(get_sitelatitude)
+
+    router.put(
+        "/telescope/{device_number}/sitelatitude",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_sitelatitude)
+
+    router.get(
+        "/telescope/{device_number}/sitelongitude",
+        **common_endpoint_parameters,
+        response_model=Response[float],
+    )(get_sitelongitude)
+
+    router.put(
+        "/telescope/{device_number}/sitelongitude",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_sitelongitude)
+
+    router.get(
+        "/telescope/{device_number}/slewing",
+        **common_endpoint_parameters,
+        response_model=Response[bool],
+    )(get_slewing)
+
+    router.get(
+        "/telescope/{device_number}/slewsettletime",
+        **common_endpoint_parameters,
+        response_model=Response[int],
+    )(get_slewsettletime)
+
+    router.put(
+        "/telescope/{device_number}/slewsettletime",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_slewsettletime)
+
+    router.put(
+        "/telescope/{device_number}/slewtoaltaz",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_slewtoaltaz)
+
+    router.put(
+        "/telescope/{device_number}/slewtoaltazasync",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_slewtoaltazasync)
+
+    router.put(
+        "/telescope/{device_number}/slewtocoordinates",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_slewtocoordinates)
+
+    router.put(
+        "/telescope/{device_number}/slewtocoordinatesasync",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_slewtocoordinatesasync)
+
+    router.put(
+        "/telescope/{device_number}/slewtotarget",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_slewtotarget)
+
+    router.put(
+        "/telescope/{device_number}/slewtotargetasync",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_slewtotargetasync)
+
+    router.put(
+        "/telescope/{device_number}/synctoaltaz",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_synctoaltaz)
+
+    router.put(
+        "/telescope/{device_number}/synctocoordinates",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_synctocoordinates)
+
+    router.put(
+        "/telescope/{device_number}/synctotarget",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_synctotarget)
+
+    router.get(
+        "/telescope/{device_number}/targetdeclination",
+        **common_endpoint_parameters,
+        response_model=Response[float],
+    )(get_targetdeclination)
+
+    router.put(
+        "/telescope/{device_number}/targetdeclination",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_targetdeclination)
+
+    router.get(
+        "/telescope/{device_number}/targetrightascension",
+        **common_endpoint_parameters,
+        response_model=Response[float],
+    )(get_targetrightascension)
+
+    router.put(
+        "/telescope/{device_number}/targetrightascension",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_targetrightascension)
+
+    router.get(
+        "/telescope/{device_number}/tracking",
+        **common_endpoint_parameters,
+        response_model=Response[bool],
+    )(get_tracking)
+
+    router.put(
+        "/telescope/{device_number}/tracking",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_tracking)
+
+    router.get(
+        "/telescope/{device_number}/trackingrate",
+        **common_endpoint_parameters,
+        response_model=Response[DriveRate],
+    )(get_trackingrate)
+
+    router.put(
+        "/telescope/{device_number}/trackingrate",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_trackingrate)
+
+    router.get(
+        "/telescope/{device_number}/trackingrates",
+        **common_endpoint_parameters,
+        response_model=Response[List[DriveRate]],
+    )(get_trackingrates)
+
+    router.put(
+        "/telescope/{device_number}/unpark",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_unpark)
+
+    router.get(
+        "/telescope/{device_number}/utcdate",
+        **common_endpoint_parameters,
+        response_model=Response[str],
+    )(get_utcdate)
+
+    router.put(
+        "/telescope/{device_number}/utcdate",
+        **common_endpoint_parameters,
+        response_model=Response[None],
+    )(put_utcdate)
+
+    return router
@@ -1,30 +1,71 @@
 import asyncio
+import importlib
 from contextlib import asynccontextmanager
-from typing import Callable, Dict, List, Union
+from typing import Callable, Dict, List, Optional, Sequence, Union
 
 import structlog
-from fastapi import FastAPI
+from fastapi import APIRouter, FastAPI, Request
 
 from .api.common import create_router as create_common_router
 from .api.management import Description
 from .api.management import create_router as create_management_router
-from .api.safetymonitor import create_router as create_safetymonitor_router
-from .device import Device, DeviceType
+from .api.method_table import create_routes as create_method_table_routes
+from .coalesce import SingleFlight
+from .device import AnyDevice, DeviceRegistry, DeviceType
 from .discovery import DiscoveryServer
-from .middleware import ErrorHandlerMiddleware
+from .dispatch import DeviceDispatcher
+from .errors import AlpacaError
+from .metrics import CONTENT_TYPE, Metrics, MetricsMiddleware
+from .middleware import alpaca_error_handler
+from .position import PositionCache
+from .request import claim_worker_slot, configure_server_transaction_ids
+from .response import HTTPResponse
+from .tracing import Exporter, TracingMiddleware
 
 logger: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)
 
+# Routers are imported only for the device types a server actually serves.
+_device_routers: Dict[DeviceType, str] = {
+    DeviceType.Camera: ".api.camera",
+    DeviceType.CoverCalibrator: ".api.covercalibrator",
+    DeviceType.Dome: ".api.dome",
+    DeviceType.FilterWheel: ".api.filterwheel",
+    DeviceType.Focuser: ".api.focuser",
+    DeviceType.ObservingConditions: ".api.observingconditions",
+    DeviceType.Rotator: ".api.rotator",
+    DeviceType.SafetyMonitor: ".api.safetymonitor",
+    DeviceType.Switch: ".api.switch",
+    DeviceType.Telescope: ".api.telescope",
+}
 
-def _start_discovery_server(http_port: int):
+
+def _start_discovery_server(http_port: int, server: "AlpacaServer", discovery: bool):
     @asynccontextmanager
     async def lifespan(app: FastAPI):
+        if server.worker_slots is not None:
+            # Scoped to the port so unrelated servers on the host do not
+            # share slots.
+            slot, generation = claim_worker_slot(
+                server.worker_slots, f"python-alpaca-server-{http_port}"
+            )
+            configure_server_transaction_ids(slot, server.worker_slots, generation)
+
+        tasks: List[asyncio.Task] = []
         try:
-            discovery_server = DiscoveryServer(http_port)
-            task = asyncio.create_task(discovery_server.start())
+            if discovery:
+                discovery_server = DiscoveryServer(http_port)
+                tasks.append(asyncio.create_task(discovery_server.start()))
+            if server.positions is not None:
+                tasks.append(
+                    asyncio.create_task(
+                        server.positions.run(server.devices, server.dispatcher)
+                    )
+                )
             yield
         finally:
-            task.cancel()
+            for task in tasks:
+                task.cancel()
+            server.dispatcher.shutdown()
 
     return lifespan
 
@@ -33,7 +74,14 @@ class AlpacaServer:
     def __init__(
         self,
         server_description: Union[Callable[[], Description], Description],
-        devices: List[Device],
+        devices: Sequence[AnyDevice],
+        max_workers: Optional[int] = None,
+        worker_slots: Optional[int] = None,
+        single_route: bool = False,
+        metrics: bool = False,
+        position_interval: Optional[float] = None,
+        coalesce_window_ms: Optional[float] = None,
+        trace_exporter: Optional[Exporter] = None,
     ):
         number_by_type: Dict[DeviceType, int] = {}
 
@@ -42,24 +90,73 @@ class AlpacaServer:
             number_by_type[d.device_type] = d.device_number + 1
 
         self.devices = devices
+        self.registry = DeviceRegistry(devices)
         self.server_description = server_description
+        self.dispatcher = DeviceDispatcher(max_workers)
+        self.worker_slots = worker_slots
+        self.single_route = single_route
+        self.metrics: Optional[Metrics] = Metrics() if metrics else None
+        self.dispatcher.metrics = self.metrics
+        self.positions: Optional[PositionCache] = (
+            PositionCache(position_interval) if position_interval is not None else None
+        )
+        self.dispatcher.positions = self.positions
+        if coalesce_window_ms is not None:
+            self.dispatcher.single_flight = SingleFlight(coalesce_window_ms / 1000)
+        self.trace_exporter = trace_exporter
+
+    def _add_metrics(self, metrics: Metrics):
+        self.app.state.metrics = metrics
+        self.app.add_middleware(MetricsMiddleware, metrics=metrics)
+
+        async def get_metrics(request: Request) -> HTTPResponse:
+            return HTTPResponse(metrics.render(), media_type=CONTENT_TYPE)
+
+        self.app.add_route("/metrics", get_metrics, include_in_schema=False)
+
+    def create_app(self, http_port: int, discovery: bool = True):
+        self.app = FastAPI(lifespan=_start_discovery_server(http_port, self, discovery))
+
+        # Handled by Starlette's existing exception middleware, so successful
+        # requests do not pay for an extra middleware layer.
+        self.app.add_exception_handler(AlpacaError, alpaca_error_handler)
 
-    def create_app(self, http_port: int):
-        self.app = FastAPI(lifespan=_start_discovery_server(http_port))
+        if self.metrics is not None:
+            self._add_metrics(self.metrics)
 
-        self.app.add_middleware(ErrorHandlerMiddleware)
+        # Added last so it is outermost and its trace covers the other layers.
+        if self.trace_exporter is not None:
+            self.app.add_middleware(TracingMiddleware, exporter=self.trace_exporter)
 
         self.app.include_router(
-            create_management_router(self.server_description, self.devices),
+            create_management_router(
+                self.server_description, self.registry, self.dispatcher
+            ),
             prefix="/management",
         )
-        self.app.include_router(
-            create_common_router(self.devices),
-            prefix="/api/v1",
-        )
-        self.app.include_router(
-            create_safetymonitor_router(self.devices),
-            prefix="/api/v1",
-        )
+        routers: Dict[DeviceType, APIRouter] = {}
+        for device_type in dict.fromkeys(d.device_type for d in self.devices):
+            module_name = _device_routers.get(device_type)
+            if module_name is None:
+                logger.warning("no router for device type", device_type=device_type)
+                continue
+
+            module = importlib.import_module(module_name, __package__)
+            routers[device_type] = module.create_router(self.registry, self.dispatcher)
+
+        common_router = create_common_router(self.registry, self.dispatcher)
+
+        if self.single_route:
+            self.app.router.routes.extend(
+                create_method_table_routes(routers, common_router)
+            )
+        else:
+            for router in routers.values():
+                self.app.include_router(router, prefix="/api/v1")
+
+        # Device specific routes go first so the hot property endpoints are
+        # matched without trying every common route before them. The common
+        # routes also answer device types that are not configured.
+        self.app.include_router(common_router, prefix="/api/v1")
 
         return self.app
@@ -0,0 +1,69 @@
+import math
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, Type, TypeVar
+
+from .request import CommonRequest
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_TTL_ATTRIBUTE = "__alpaca_cache_ttl__"
+
+MISSING = object()
+
+
+def immutable(method: F) -> F:
+    """Mark a driver property as never changing while the device is connected."""
+    setattr(method, _TTL_ATTRIBUTE, math.inf)
+    return method
+
+
+def cached(ttl: float) -> Callable[[F], F]:
+    """Mark a driver property as cacheable for ``ttl`` seconds."""
+
+    def decorator(method: F) -> F:
+        setattr(method, _TTL_ATTRIBUTE, ttl)
+        return method
+
+    return decorator
+
+
+def cache_ttl(method: Callable[..., Any]) -> Optional[float]:
+    return getattr(method, _TTL_ATTRIBUTE, None)
+
+
+@lru_cache(maxsize=None)
+def _key_fields(cls: Type[CommonRequest]) -> Tuple[str, ...]:
+    return tuple(f for f in cls.model_fields if f not in CommonRequest.model_fields)
+
+
+def _request_key(req: CommonRequest) -> Tuple[Hashable, ...]:
+    return tuple(getattr(req, f) for f in _key_fields(type(req)))
+
+
+class PropertyCache:
+    def __init__(self) -> None:
+        self._entries: Dict[int, Dict[Tuple[Hashable, ...], Tuple[float, Any]]] = {}
+
+    def get(self, device: object, name: str, req: CommonRequest) -> Any:
+        entries = self._entries.get(id(device))
+        if entries is None:
+            return MISSING
+
+        entry = entries.get((name, *_request_key(req)))
+        if entry is None or entry[0] < time.monotonic():
+            return MISSING
+
+        return entry[1]
+
+    def put(
+        self, device: object, name: str, req: CommonRequest, ttl: float, value: Any
+    ) -> None:
+        entries = self._entries.setdefault(id(device), {})
+        entries[(name, *_request_key(req))] = (time.monotonic() + ttl, value)
+
+    def invalidate(self, device: object) -> None:
+        self._entries.pop(id(device), None)
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -0,0 +1,101 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+from .cache import MISSING, _request_key
+from .device import DeviceBase
+from .errors import for_request
+from .request import CommonRequest
+
+Key = Tuple[Hashable, ...]
+
+
+class SingleFlight:
+    """Shares one driver call between concurrent identical reads.
+
+    Reads of the same property of the same device with the same arguments
+    wait on the call already in flight instead of starting their own. With
+    ``window`` seconds set, a result is also reused by reads that arrive
+    within that long after it completed. Calls are tagged with the device's
+    generation, which ``invalidate`` moves on when a command is scheduled and
+    when it completes, so reads never join a call that may predate it.
+    """
+
+    def __init__(self, window: float = 0.0):
+        self.window = window
+        self._in_flight: Dict[Key, Tuple[int, asyncio.Future]] = {}
+        self._results: Dict[Key, Tuple[float, Any]] = {}
+        self._generations: Dict[int, int] = {}
+
+    def _recent(self, key: Key) -> Any:
+        entry = self._results.get(key)
+        if entry is None:
+            return MISSING
+
+        if entry[0] < time.monotonic():
+            del self._results[key]
+            return MISSING
+
+        return entry[1]
+
+    async def call(
+        self,
+        device: DeviceBase,
+        name: str,
+        req: CommonRequest,
+        run: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        key = (id(device), name, *_request_key(req))
+
+        if self.window:
+            value = self._recent(key)
+            if value is not MISSING:
+                return value
+
+        device_id = id(device)
+        generation = self._generations.get(device_id, 0)
+
+        future: asyncio.Future
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None and in_flight[0] == generation:
+            leader = False
+            future = in_flight[1]
+        else:
+            leader = True
+            # A task of its own, so a waiter that is cancelled, e.g. by a
+            # client disconnecting, does not cancel the call for the others.
+            future = asyncio.ensure_future(run())
+            self._in_flight[key] = (generation, future)
+            future.add_done_callback(
+                lambda f: self._done(key, device_id, generation, f)
+            )
+
+        try:
+            return await asyncio.shield(future)
+        except Exception as e:
+            if leader:
+                raise
+            # Every other waiter gets the error with its own transaction ids.
+            raise for_request(e, req) from None
+
+    def _done(
+        self, key: Key, device_id: int, generation: int, future: asyncio.Future
+    ) -> None:
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None and in_flight[1] is future:
+            del self._in_flight[key]
+
+        if future.cancelled() or future.exception() is not None:
+            return
+
+        # A read that overlapped a command may predate it, so it is shared
+        # with the waiters it already has but not kept.
+        if self.window and self._generations.get(device_id, 0) == generation:
+            self._results[key] = (time.monotonic() + self.window, future.result())
+
+    def invalidate(self, device: DeviceBase) -> None:
+        device_id = id(device)
+        self._generations[device_id] = self._generations.get(device_id, 0) + 1
+
+        for key in [k for k in self._results if k[0] == device_id]:
+            del self._results[key]
@@ -1,7 +1,25 @@
+import asyncio
 import sys
+import threading
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
+from contextvars import ContextVar
+from datetime import datetime, timezone
 from enum import Enum
-from typing import List, Optional
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    ClassVar,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 if sys.version_info >= (3, 9):
     from typing import Annotated
@@ -12,11 +30,43 @@ import structlog
 from fastapi import HTTPException, Path
 from pydantic import BaseModel, field_validator
 
-from .errors import NotImplementedError
+from .errors import AlpacaError, NotImplementedError
 from .request import ActionRequest, CommandRequest, CommonRequest, PutConnectedRequest
+from .tracing import current_trace, now
 
 logger: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)
 
+# Work for a long-running operation: an awaitable, or a blocking callable.
+Work = Union[Awaitable[Any], Callable[[], Any]]
+
+
+class OperationHandle:
+    """What the work of an operation uses to share the device.
+
+    ``cancelled`` is set when the command that stops the motion, such as a
+    halt, is sent. Blocking work runs without holding the device, so other
+    calls are served while it waits; ``with handle.hold():`` around each
+    exchange with the hardware waits for the device like a driver call.
+    """
+
+    __slots__ = ("cancelled", "hold")
+
+    def __init__(self) -> None:
+        self.cancelled = threading.Event()
+        # Set by the dispatcher for the blocking work it runs.
+        self.hold: Callable[[], ContextManager[Any]] = nullcontext
+
+
+# An operation handed over by a PUT: its work, state and handle.
+Operation = Tuple[Work, Optional[Dict[str, Any]], OperationHandle]
+
+# The operations started by the PUT being dispatched, or None outside one.
+# Each call gets its own list, so overlapping PUTs to an async device do not
+# collect each other's operations.
+started_operations: ContextVar[Optional[List[Operation]]] = ContextVar(
+    "started_operations", default=None
+)
+
 
 class DeviceType(str, Enum):
     Camera = "Camera"
@@ -44,12 +94,56 @@ class UrlDeviceType(str, Enum):
     Telescope = "telescope"
 
 
-class Device(ABC):
+class StateValue(BaseModel):
+    Name: str
+    Value: Any
+
+
+def state_timestamp() -> StateValue:
+    return StateValue(
+        Name="TimeStamp",
+        Value=datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+    )
+
+
+class DeviceBase(ABC):
+    # Operational properties reported by the devicestate endpoint, by their
+    # Alpaca names. Each one is read through the matching get_ method.
+    device_state_properties: ClassVar[Tuple[str, ...]] = ()
+
     def __init__(self, device_type: DeviceType, unique_id: str):
         self.device_type = device_type
         self.unique_id = unique_id
         self.device_number: int = -1
 
+    def start_operation(
+        self, work: Work, state: Optional[Dict[str, Any]] = None
+    ) -> OperationHandle:
+        """Finish the current PUT in the background.
+
+        Call from a put_ method such as ``put_move`` that must return before
+        the device is done. Once the method returns, ``work`` is run by the
+        server: awaited on the event loop if it is awaitable, or otherwise
+        called on a thread of its own. While it runs, the get_ methods named
+        in ``state`` answer with the given values instead of calling the
+        driver, e.g. ``{"get_ismoving": True}``; the default depends on the
+        device type and the PUT. A failure is raised by the next of those
+        reads.
+
+        Blocking work does not hold the device, so it should wrap each
+        exchange with the hardware in ``with handle.hold():`` and return once
+        ``handle.cancelled`` is set; awaitables are also cancelled.
+        """
+        operations = started_operations.get()
+        if operations is None:
+            raise RuntimeError("start_operation must be called from a put_ method")
+
+        handle = OperationHandle()
+        operations.append((work, state, handle))
+        return handle
+
+
+class Device(DeviceBase):
     @abstractmethod
     def put_action(self, req: ActionRequest) -> str:
         raise NotImplementedError(req)
@@ -98,6 +192,116 @@ class Device(ABC):
     def get_supportedactions(self, req: CommonRequest) -> List[str]:
         raise NotImplementedError(req)
 
+    def get_devicestate(self, req: CommonRequest) -> List[StateValue]:
+        """Read every operational property in one call.
+
+        Drivers that can fetch their whole state from the hardware at once
+        should override this. Properties the driver does not implement are left
+        out, as the Alpaca specification requires.
+        """
+        state: List[StateValue] = []
+
+        for name in self.device_state_properties:
+            try:
+                value = getattr(self, f"get_{name.lower()}")(req)
+            except AlpacaError:
+                continue
+
+            state.append(StateValue(Name=name, Value=value))
+
+        state.append(state_timestamp())
+
+        return state
+
+
+class AsyncDevice(DeviceBase):
+    """Base class for drivers whose methods are coroutines.
+
+    The server awaits these methods on its event loop instead of running them
+    on the driver thread pool, and does not serialize calls to the device, so a
+    driver can serve many concurrent requests over a network connection.
+    """
+
+    @abstractmethod
+    async def put_action(self, req: ActionRequest) -> str:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_command_blind(self, req: CommandRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_command_bool(self, req: CommandRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_command_string(self, req: CommandRequest) -> str:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_connected(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_connected(self, req: PutConnectedRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_description(self, req: CommonRequest) -> str:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_driverinfo(self, req: CommonRequest) -> str:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_driverversion(self, req: CommonRequest) -> str:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_interfaceversion(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_name(self, req: CommonRequest) -> str:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_supportedactions(self, req: CommonRequest) -> List[str]:
+        raise NotImplementedError(req)
+
+    async def get_devicestate(self, req: CommonRequest) -> List[StateValue]:
+        """Read every operational property concurrently.
+
+        Drivers that can fetch their whole state from the hardware at once
+        should override this. Properties the driver does not implement are left
+        out, as the Alpaca specification requires.
+        """
+        values = await asyncio.gather(
+            *(
+                getattr(self, f"get_{name.lower()}")(req)
+                for name in self.device_state_properties
+            ),
+            return_exceptions=True,
+        )
+
+        state: List[StateValue] = []
+
+        for name, value in zip(self.device_state_properties, values):
+            if isinstance(value, AlpacaError):
+                continue
+            if isinstance(value, BaseException):
+                raise value
+
+            state.append(StateValue(Name=name, Value=value))
+
+        state.append(state_timestamp())
+
+        return state
+
+
+AnyDevice = Union[Device, AsyncDevice]
+
 
 class PathArgs(BaseModel):
     device_number: int
@@ -124,22 +328,41 @@ class PathArgs(BaseModel):
         return None
 
 
-def device_finder(devices: List[Device], device_type: UrlDeviceType):
-    def find_device(
+class DeviceRegistry:
+    def __init__(self, devices: Sequence[AnyDevice]):
+        self.devices = devices
+        self._devices: Dict[Tuple[UrlDeviceType, int], AnyDevice] = {
+            (UrlDeviceType[d.device_type.name], d.device_number): d for d in devices
+        }
+
+    def get(
+        self, device_type: UrlDeviceType, device_number: int
+    ) -> Optional[AnyDevice]:
+        return self._devices.get((device_type, device_number))
+
+    def __iter__(self) -> Iterator[AnyDevice]:
+        return iter(self.devices)
+
+    def __len__(self) -> int:
+        return len(self.devices)
+
+
+def device_finder(registry: DeviceRegistry, device_type: UrlDeviceType):
+    async def find_device(
         args: Annotated[PathArgs, Path()],
-    ) -> Device:
+    ) -> AnyDevice:
+        trace = current_trace.get()
+        start = now() if trace is not None else 0
+
         logger.debug(
             "looking for device",
             device_type=device_type,
             device_number=args.device_number,
         )
-        device: Optional[Device] = None
-        for d in devices:
-            if (
-                d.device_number == args.device_number
-                and d.device_type.value.lower() == device_type.value.lower()
-            ):
-                device = d
+        device = registry.get(device_type, args.device_number)
+
+        if trace is not None:
+            trace.add("device lookup", start)
 
         if not device:
             raise HTTPException(status_code=404)
@@ -149,10 +372,13 @@ def device_finder(devices: List[Device], device_type: UrlDeviceType):
     return find_device
 
 
-def common_device_finder(devices: List[Device]):
-    def find_device(
+def common_device_finder(registry: DeviceRegistry):
+    async def find_device(
         args: Annotated[PathArgs, Path()],
-    ) -> Device:
+    ) -> AnyDevice:
+        trace = current_trace.get()
+        start = now() if trace is not None else 0
+
         logger.debug(
             "looking for device",
             device_type=args.device_type,
@@ -162,13 +388,10 @@ def common_device_finder(devices: List[Device]):
         if args.device_type is None:
             raise HTTPException(status_code=400, detail="Invalid device type")
 
-        device: Optional[Device] = None
-        for d in devices:
-            if (
-                d.device_number == args.device_number
-                and d.device_type.value.lower() == args.device_type.value.lower()
-            ):
-                device = d
+        device = registry.get(args.device_type, args.device_number)
+
+        if trace is not None:
+            trace.add("device lookup", start)
 
         if not device:
             raise HTTPException(status_code=404)
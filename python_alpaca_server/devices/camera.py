@@ -1,6 +1,648 @@
-from ..device import Device, DeviceType
+from abc import abstractmethod
+from enum import Enum
+from typing import List
+
+from ..device import AsyncDevice, Device, DeviceType
+from ..imagearray import ImageArray
+from ..request import (
+    CommonRequest,
+    PutBinXRequest,
+    PutBinYRequest,
+    PutCoolerOnRequest,
+    PutFastReadoutRequest,
+    PutGainRequest,
+    PutNumXRequest,
+    PutNumYRequest,
+    PutOffsetRequest,
+    PutPulseGuideRequest,
+    PutReadoutModeRequest,
+    PutSetCCDTemperatureRequest,
+    PutStartXRequest,
+    PutStartYRequest,
+    PutSubExposureDurationRequest,
+    StartExposureRequest,
+)
+
+
+class CameraState(int, Enum):
+    Idle = 0
+    Waiting = 1
+    Exposing = 2
+    Reading = 3
+    Download = 4
+    Error = 5
+
+
+class SensorType(int, Enum):
+    Monochrome = 0
+    Color = 1
+    RGGB = 2
+    CMYG = 3
+    CMYG2 = 4
+    LRGB = 5
 
 
 class Camera(Device):
+    """An ASCOM ICameraV4 camera.
+
+    ``get_imagearray`` returns the image as a NumPy array or any other object
+    supporting the buffer protocol, indexed ``[x][y]`` or ``[x][y][plane]``
+    as in the Alpaca API. It is sent to clients without converting pixels in
+    Python.
+    """
+
+    device_state_properties = (
+        "CameraState",
+        "CCDTemperature",
+        "CoolerPower",
+        "HeatSinkTemperature",
+        "ImageReady",
+        "IsPulseGuiding",
+        "PercentCompleted",
+    )
+
     def __init__(self, unique_id: str):
         super().__init__(DeviceType.Camera, unique_id)
+
+    @abstractmethod
+    def put_abortexposure(self, req: CommonRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_bayeroffsetx(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_bayeroffsety(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_binx(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_binx(self, req: PutBinXRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_biny(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_biny(self, req: PutBinYRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_camerastate(self, req: CommonRequest) -> CameraState:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_cameraxsize(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_cameraysize(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_canabortexposure(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_canasymmetricbin(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_canfastreadout(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_cangetcoolerpower(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_canpulseguide(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_cansetccdtemperature(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_canstopexposure(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_ccdtemperature(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_cooleron(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_cooleron(self, req: PutCoolerOnRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_coolerpower(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_electronsperadu(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_exposuremax(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_exposuremin(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_exposureresolution(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_fastreadout(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_fastreadout(self, req: PutFastReadoutRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_fullwellcapacity(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_gain(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_gain(self, req: PutGainRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_gainmax(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_gainmin(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_gains(self, req: CommonRequest) -> List[str]:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_hasshutter(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_heatsinktemperature(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_imagearray(self, req: CommonRequest) -> ImageArray:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_imagearrayvariant(self, req: CommonRequest) -> ImageArray:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_imageready(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_ispulseguiding(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_lastexposureduration(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_lastexposurestarttime(self, req: CommonRequest) -> str:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_maxadu(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_maxbinx(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_maxbiny(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_numx(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_numx(self, req: PutNumXRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_numy(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_numy(self, req: PutNumYRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_offset(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_offset(self, req: PutOffsetRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_offsetmax(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_offsetmin(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_offsets(self, req: CommonRequest) -> List[str]:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_percentcompleted(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_pixelsizex(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_pixelsizey(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_pulseguide(self, req: PutPulseGuideRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_readoutmode(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_readoutmode(self, req: PutReadoutModeRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_readoutmodes(self, req: CommonRequest) -> List[str]:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_sensorname(self, req: CommonRequest) -> str:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_sensortype(self, req: CommonRequest) -> SensorType:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_setccdtemperature(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_setccdtemperature(self, req: PutSetCCDTemperatureRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_startexposure(self, req: StartExposureRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_startx(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_startx(self, req: PutStartXRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_starty(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_starty(self, req: PutStartYRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_stopexposure(self, req: CommonRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_subexposureduration(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_subexposureduration(self, req: PutSubExposureDurationRequest) -> None:
+        raise NotImplementedError(req)
+
+
+class AsyncCamera(AsyncDevice):
+    device_state_properties = Camera.device_state_properties
+
+    def __init__(self, unique_id: str):
+        super().__init__(DeviceType.Camera, unique_id)
+
+    @abstractmethod
+    async def put_abortexposure(self, req: CommonRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_bayeroffsetx(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_bayeroffsety(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_binx(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_binx(self, req: PutBinXRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_biny(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_biny(self, req: PutBinYRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_camerastate(self, req: CommonRequest) -> CameraState:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_cameraxsize(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_cameraysize(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_canabortexposure(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_canasymmetricbin(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_canfastreadout(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_cangetcoolerpower(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_canpulseguide(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_cansetccdtemperature(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_canstopexposure(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_ccdtemperature(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_cooleron(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_cooleron(self, req: PutCoolerOnRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_coolerpower(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_electronsperadu(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_exposuremax(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_exposuremin(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_exposureresolution(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_fastreadout(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_fastreadout(self, req: PutFastReadoutRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_fullwellcapacity(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_gain(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_gain(self, req: PutGainRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_gainmax(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_gainmin(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_gains(self, req: CommonRequest) -> List[str]:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_hasshutter(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_heatsinktemperature(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_imagearray(self, req: CommonRequest) -> ImageArray:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_imagearrayvariant(self, req: CommonRequest) -> ImageArray:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_imageready(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_ispulseguiding(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_lastexposureduration(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_lastexposurestarttime(self, req: CommonRequest) -> str:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_maxadu(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_maxbinx(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_maxbiny(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_numx(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_numx(self, req: PutNumXRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_numy(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_numy(self, req: PutNumYRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_offset(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_offset(self, req: PutOffsetRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_offsetmax(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_offsetmin(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_offsets(self, req: CommonRequest) -> List[str]:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_percentcompleted(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_pixelsizex(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_pixelsizey(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_pulseguide(self, req: PutPulseGuideRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_readoutmode(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_readoutmode(self, req: PutReadoutModeRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_readoutmodes(self, req: CommonRequest) -> List[str]:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_sensorname(self, req: CommonRequest) -> str:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_sensortype(self, req: CommonRequest) -> SensorType:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_setccdtemperature(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_setccdtemperature(self, req: PutSetCCDTemperatureRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_startexposure(self, req: StartExposureRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_startx(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_startx(self, req: PutStartXRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_starty(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_starty(self, req: PutStartYRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_stopexposure(self, req: CommonRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_subexposureduration(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_subexposureduration(self, req: PutSubExposureDurationRequest) -> None:
+        raise NotImplementedError(req)
@@ -1,7 +1,7 @@
 from abc import abstractmethod
 from enum import Enum
 
-from ..device import Device, DeviceType
+from ..device import AsyncDevice, Device, DeviceType
 from ..request import CommonRequest, PutBrightnessRequest
 
 
@@ -24,6 +24,12 @@ class CoverState(int, Enum):
 
 
 class CoverCalibrator(Device):
+    device_state_properties = (
+        "Brightness",
+        "CalibratorState",
+        "CoverState",
+    )
+
     def __init__(self, unique_id: str):
         super().__init__(DeviceType.CoverCalibrator, unique_id)
 
@@ -62,3 +68,46 @@ class CoverCalibrator(Device):
     @abstractmethod
     def put_opencover(self, req: CommonRequest) -> None:
         raise NotImplementedError(req)
+
+
+class AsyncCoverCalibrator(AsyncDevice):
+    device_state_properties = CoverCalibrator.device_state_properties
+
+    def __init__(self, unique_id: str):
+        super().__init__(DeviceType.CoverCalibrator, unique_id)
+
+    @abstractmethod
+    async def get_brightness(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_calibratorstate(self, req: CommonRequest) -> CalibratorState:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_coverstate(self, req: CommonRequest) -> CoverState:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_maxbrightness(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_calibratoroff(self, req: CommonRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_calibratoron(self, req: PutBrightnessRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_closecover(self, req: CommonRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_haltcover(self, req: CommonRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_opencover(self, req: CommonRequest) -> None:
+        raise NotImplementedError(req)
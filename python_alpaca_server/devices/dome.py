@@ -1,7 +1,7 @@
 from abc import abstractmethod
 from enum import Enum
 
-from ..device import Device, DeviceType
+from ..device import AsyncDevice, Device, DeviceType
 from ..request import (
     CommonRequest,
     PutAltitudeRequest,
@@ -19,6 +19,15 @@ class ShutterState(int, Enum):
 
 
 class Dome(Device):
+    device_state_properties = (
+        "Altitude",
+        "AtHome",
+        "AtPark",
+        "Azimuth",
+        "ShutterStatus",
+        "Slewing",
+    )
+
     def __init__(self, unique_id: str):
         super().__init__(DeviceType.Dome, unique_id)
 
@@ -121,3 +130,110 @@ class Dome(Device):
     @abstractmethod
     def put_synctoazimuth(self, req: PutAzimuthRequest) -> None:
         raise NotImplementedError(req)
+
+
+class AsyncDome(AsyncDevice):
+    device_state_properties = Dome.device_state_properties
+
+    def __init__(self, unique_id: str):
+        super().__init__(DeviceType.Dome, unique_id)
+
+    @abstractmethod
+    async def get_altitude(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_athome(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_atpark(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_azimuth(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_canfindhome(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_canpark(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_cansetaltitude(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_cansetazimuth(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_cansetpark(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_cansetshutter(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_canslave(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_cansyncazimuth(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_shutterstatus(self, req: CommonRequest) -> ShutterState:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_slaved(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_slaved(self, req: PutSlavedRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_slewing(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_abortslew(self, req: CommonRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_closeshutter(self, req: CommonRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_findhome(self, req: CommonRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_openshutter(self, req: CommonRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_park(self, req: CommonRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_setpark(self, req: CommonRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_slewtoaltitude(self, req: PutAltitudeRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_slewtoazimuth(self, req: PutAzimuthRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_synctoazimuth(self, req: PutAzimuthRequest) -> None:
+        raise NotImplementedError(req)
@@ -1,11 +1,13 @@
 from abc import abstractmethod
 from typing import List
 
-from ..device import Device, DeviceType
+from ..device import AsyncDevice, Device, DeviceType
 from ..request import CommonRequest, PutPositionRequest
 
 
 class FilterWheel(Device):
+    device_state_properties = ("Position",)
+
     def __init__(self, unique_id: str):
         super().__init__(DeviceType.FilterWheel, unique_id)
 
@@ -24,3 +26,26 @@ class FilterWheel(Device):
     @abstractmethod
     def put_position(self, req: PutPositionRequest) -> None:
         raise NotImplementedError(req)
+
+
+class AsyncFilterWheel(AsyncDevice):
+    device_state_properties = FilterWheel.device_state_properties
+
+    def __init__(self, unique_id: str):
+        super().__init__(DeviceType.FilterWheel, unique_id)
+
+    @abstractmethod
+    async def get_focusoffsets(self, req: CommonRequest) -> List[int]:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_names(self, req: CommonRequest) -> List[str]:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_position(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_position(self, req: PutPositionRequest) -> None:
+        raise NotImplementedError(req)
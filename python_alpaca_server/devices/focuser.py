@@ -1,10 +1,16 @@
 from abc import abstractmethod
 
-from ..device import Device, DeviceType
+from ..device import AsyncDevice, Device, DeviceType
 from ..request import CommonRequest, PutPositionRequest, PutTempCompRequest
 
 
 class Focuser(Device):
+    device_state_properties = (
+        "IsMoving",
+        "Position",
+        "Temperature",
+    )
+
     def __init__(self, unique_id: str):
         super().__init__(DeviceType.Focuser, unique_id)
 
@@ -55,3 +61,58 @@ class Focuser(Device):
     @abstractmethod
     def put_move(self, req: PutPositionRequest) -> None:
         raise NotImplementedError(req)
+
+
+class AsyncFocuser(AsyncDevice):
+    device_state_properties = Focuser.device_state_properties
+
+    def __init__(self, unique_id: str):
+        super().__init__(DeviceType.Focuser, unique_id)
+
+    @abstractmethod
+    async def get_absolute(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_ismoving(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_maxincrement(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_maxstep(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_position(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_stepsize(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_tempcomp(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_tempcomp(self, req: PutTempCompRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_tempcompavailable(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_temperature(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_halt(self, req: CommonRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_move(self, req: PutPositionRequest) -> None:
+        raise NotImplementedError(req)
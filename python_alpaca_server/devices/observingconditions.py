@@ -1,10 +1,26 @@
 from abc import abstractmethod
 
-from ..device import Device, DeviceType
+from ..device import AsyncDevice, Device, DeviceType
 from ..request import CommonRequest, PutAveragePeriodRequest, SensorNameRequest
 
 
 class ObservingConditions(Device):
+    device_state_properties = (
+        "CloudCover",
+        "DewPoint",
+        "Humidity",
+        "Pressure",
+        "RainRate",
+        "SkyBrightness",
+        "SkyQuality",
+        "SkyTemperature",
+        "StarFWHM",
+        "Temperature",
+        "WindDirection",
+        "WindGust",
+        "WindSpeed",
+    )
+
     def __init__(self, unique_id: str):
         super().__init__(DeviceType.ObservingConditions, unique_id)
 
@@ -79,3 +95,82 @@ class ObservingConditions(Device):
     @abstractmethod
     def get_timesincelastupdate(self, req: SensorNameRequest) -> float:
         raise NotImplementedError(req)
+
+
+class AsyncObservingConditions(AsyncDevice):
+    device_state_properties = ObservingConditions.device_state_properties
+
+    def __init__(self, unique_id: str):
+        super().__init__(DeviceType.ObservingConditions, unique_id)
+
+    @abstractmethod
+    async def get_averageperiod(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_averageperiod(self, req: PutAveragePeriodRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_cloudcover(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_dewpoint(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_humidity(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_pressure(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_rainrate(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_skybrightness(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_skyquality(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_skytemperature(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_starfwhm(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_temperature(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_winddirection(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_windgust(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_windspeed(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_refresh(self, req: CommonRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_sensordescription(self, req: SensorNameRequest) -> str:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_timesincelastupdate(self, req: SensorNameRequest) -> float:
+        raise NotImplementedError(req)
@@ -1,10 +1,16 @@
 from abc import abstractmethod
 
-from ..device import Device, DeviceType
+from ..device import AsyncDevice, Device, DeviceType
 from ..request import CommonRequest, PutPositionFloatRequest, PutReverseRequest
 
 
 class Rotator(Device):
+    device_state_properties = (
+        "IsMoving",
+        "MechanicalPosition",
+        "Position",
+    )
+
     def __init__(self, unique_id: str):
         super().__init__(DeviceType.Rotator, unique_id)
 
@@ -59,3 +65,62 @@ class Rotator(Device):
     @abstractmethod
     def put_sync(self, req: PutPositionFloatRequest) -> None:
         raise NotImplementedError(req)
+
+
+class AsyncRotator(AsyncDevice):
+    device_state_properties = Rotator.device_state_properties
+
+    def __init__(self, unique_id: str):
+        super().__init__(DeviceType.Rotator, unique_id)
+
+    @abstractmethod
+    async def get_canreverse(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_ismoving(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_mechanicalposition(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_position(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_reverse(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_reverse(self, req: PutReverseRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_stepsize(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_targetposition(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_halt(self, req: CommonRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_move(self, req: PutPositionFloatRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_moveabsolute(self, req: PutPositionFloatRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_movemechanical(self, req: PutPositionFloatRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_sync(self, req: PutPositionFloatRequest) -> None:
+        raise NotImplementedError(req)
@@ -1,13 +1,26 @@
 from abc import abstractmethod
 
-from ..device import Device, DeviceType
+from ..device import AsyncDevice, Device, DeviceType
 from ..request import CommonRequest
 
 
 class SafetyMonitor(Device):
+    device_state_properties = ("IsSafe",)
+
     def __init__(self, unique_id: str):
         super().__init__(DeviceType.SafetyMonitor, unique_id)
 
     @abstractmethod
     def get_issafe(self, req: CommonRequest) -> bool:
         raise NotImplementedError(req)
+
+
+class AsyncSafetyMonitor(AsyncDevice):
+    device_state_properties = SafetyMonitor.device_state_properties
+
+    def __init__(self, unique_id: str):
+        super().__init__(DeviceType.SafetyMonitor, unique_id)
+
+    @abstractmethod
+    async def get_issafe(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
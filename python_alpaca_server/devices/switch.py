@@ -1,6 +1,8 @@
 from abc import abstractmethod
+from typing import List
 
-from ..device import Device, DeviceType
+from ..device import AsyncDevice, Device, DeviceType, StateValue, state_timestamp
+from ..errors import AlpacaError
 from ..request import (
     CommonRequest,
     IdRequest,
@@ -57,3 +59,102 @@ class Switch(Device):
     @abstractmethod
     def put_setswitchvalue(self, req: PutIdValueRequest) -> None:
         raise NotImplementedError(req)
+
+    def get_devicestate(self, req: CommonRequest) -> List[StateValue]:
+        state: List[StateValue] = []
+
+        for i in range(self.get_maxswitch(req)):
+            id_req = IdRequest(
+                Id=i,
+                ClientTransactionID=req.ClientTransactionID,
+                ClientID=req.ClientID,
+                ServerTransactionID=req.ServerTransactionID,
+            )
+
+            for name, getter in (
+                ("GetSwitch", self.get_getswitch),
+                ("GetSwitchValue", self.get_getswitchvalue),
+            ):
+                try:
+                    state.append(StateValue(Name=f"{name}{i}", Value=getter(id_req)))
+                except AlpacaError:
+                    pass
+
+        state.append(state_timestamp())
+
+        return state
+
+
+class AsyncSwitch(AsyncDevice):
+    def __init__(self, unique_id: str):
+        super().__init__(DeviceType.Switch, unique_id)
+
+    @abstractmethod
+    async def get_maxswitch(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_canwrite(self, req: IdRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_getswitch(self, req: IdRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_getswitchdescription(self, req: IdRequest) -> str:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_getswitchname(self, req: IdRequest) -> str:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_getswitchvalue(self, req: IdRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_minswitchvalue(self, req: IdRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_maxswitchvalue(self, req: IdRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_setswitch(self, req: PutIdStateRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_setswitchname(self, req: PutIdNameRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_setswitchvalue(self, req: PutIdValueRequest) -> None:
+        raise NotImplementedError(req)
+
+    async def get_devicestate(self, req: CommonRequest) -> List[StateValue]:
+        state: List[StateValue] = []
+
+        for i in range(await self.get_maxswitch(req)):
+            id_req = IdRequest(
+                Id=i,
+                ClientTransactionID=req.ClientTransactionID,
+                ClientID=req.ClientID,
+                ServerTransactionID=req.ServerTransactionID,
+            )
+
+            for name, getter in (
+                ("GetSwitch", self.get_getswitch),
+                ("GetSwitchValue", self.get_getswitchvalue),
+            ):
+                try:
+                    value = await getter(id_req)
+                except AlpacaError:
+                    continue
+
+                state.append(StateValue(Name=f"{name}{i}", Value=value))
+
+        state.append(state_timestamp())
+
+        return state
@@ -1,6 +1,728 @@
-from ..device import Device, DeviceType
+from abc import abstractmethod
+from enum import Enum
+from typing import List
+
+from pydantic import BaseModel
+
+from ..device import AsyncDevice, Device, DeviceType
+from ..request import (
+    AltAzRequest,
+    AxisRequest,
+    CommonRequest,
+    CoordinatesRequest,
+    DriveRate,
+    PierSide,
+    PutDeclinationRateRequest,
+    PutDoesRefractionRequest,
+    PutGuideRateDeclinationRequest,
+    PutGuideRateRightAscensionRequest,
+    PutMoveAxisRequest,
+    PutPulseGuideRequest,
+    PutRightAscensionRateRequest,
+    PutSideOfPierRequest,
+    PutSiteElevationRequest,
+    PutSiteLatitudeRequest,
+    PutSiteLongitudeRequest,
+    PutSlewSettleTimeRequest,
+    PutTargetDeclinationRequest,
+    PutTargetRightAscensionRequest,
+    PutTrackingRateRequest,
+    PutTrackingRequest,
+    PutUTCDateRequest,
+)
+
+
+class AlignmentMode(int, Enum):
+    AltAz = 0
+    Polar = 1
+    GermanPolar = 2
+
+
+class EquatorialCoordinateType(int, Enum):
+    Other = 0
+    Topocentric = 1
+    J2000 = 2
+    J2050 = 3
+    B1950 = 4
+
+
+class AxisRate(BaseModel):
+    Maximum: float
+    Minimum: float
 
 
 class Telescope(Device):
+    device_state_properties = (
+        "Altitude",
+        "AtHome",
+        "AtPark",
+        "Azimuth",
+        "Declination",
+        "IsPulseGuiding",
+        "RightAscension",
+        "SideOfPier",
+        "SiderealTime",
+        "Slewing",
+        "Tracking",
+        "UTCDate",
+    )
+
+    def __init__(self, unique_id: str):
+        super().__init__(DeviceType.Telescope, unique_id)
+
+    @abstractmethod
+    def put_abortslew(self, req: CommonRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_alignmentmode(self, req: CommonRequest) -> AlignmentMode:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_altitude(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_aperturearea(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_aperturediameter(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_athome(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_atpark(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_axisrates(self, req: AxisRequest) -> List[AxisRate]:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_azimuth(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_canfindhome(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_canmoveaxis(self, req: AxisRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_canpark(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_canpulseguide(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_cansetdeclinationrate(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_cansetguiderates(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_cansetpark(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_cansetpierside(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_cansetrightascensionrate(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_cansettracking(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_canslew(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_canslewaltaz(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_canslewaltazasync(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_canslewasync(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_cansync(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_cansyncaltaz(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_canunpark(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_declination(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_declinationrate(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_declinationrate(self, req: PutDeclinationRateRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_destinationsideofpier(self, req: CoordinatesRequest) -> PierSide:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_doesrefraction(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_doesrefraction(self, req: PutDoesRefractionRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_equatorialsystem(self, req: CommonRequest) -> EquatorialCoordinateType:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_findhome(self, req: CommonRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_focallength(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_guideratedeclination(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_guideratedeclination(self, req: PutGuideRateDeclinationRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_guideraterightascension(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_guideraterightascension(
+        self, req: PutGuideRateRightAscensionRequest
+    ) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_ispulseguiding(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_moveaxis(self, req: PutMoveAxisRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_park(self, req: CommonRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_pulseguide(self, req: PutPulseGuideRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_rightascension(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_rightascensionrate(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_rightascensionrate(self, req: PutRightAscensionRateRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_setpark(self, req: CommonRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_sideofpier(self, req: CommonRequest) -> PierSide:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_sideofpier(self, req: PutSideOfPierRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_siderealtime(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_siteelevation(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_siteelevation(self, req: PutSiteElevationRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_sitelatitude(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_sitelatitude(self, req: PutSiteLatitudeRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_sitelongitude(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_sitelongitude(self, req: PutSiteLongitudeRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_slewing(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_slewsettletime(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_slewsettletime(self, req: PutSlewSettleTimeRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_slewtoaltaz(self, req: AltAzRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_slewtoaltazasync(self, req: AltAzRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_slewtocoordinates(self, req: CoordinatesRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_slewtocoordinatesasync(self, req: CoordinatesRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_slewtotarget(self, req: CommonRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_slewtotargetasync(self, req: CommonRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_synctoaltaz(self, req: AltAzRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_synctocoordinates(self, req: CoordinatesRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_synctotarget(self, req: CommonRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_targetdeclination(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_targetdeclination(self, req: PutTargetDeclinationRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_targetrightascension(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_targetrightascension(self, req: PutTargetRightAscensionRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_tracking(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_tracking(self, req: PutTrackingRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_trackingrate(self, req: CommonRequest) -> DriveRate:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_trackingrate(self, req: PutTrackingRateRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_trackingrates(self, req: CommonRequest) -> List[DriveRate]:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_unpark(self, req: CommonRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def get_utcdate(self, req: CommonRequest) -> str:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    def put_utcdate(self, req: PutUTCDateRequest) -> None:
+        raise NotImplementedError(req)
+
+
+class AsyncTelescope(AsyncDevice):
+    device_state_properties = Telescope.device_state_properties
+
     def __init__(self, unique_id: str):
         super().__init__(DeviceType.Telescope, unique_id)
+
+    @abstractmethod
+    async def put_abortslew(self, req: CommonRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_alignmentmode(self, req: CommonRequest) -> AlignmentMode:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_altitude(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_aperturearea(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_aperturediameter(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_athome(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_atpark(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_axisrates(self, req: AxisRequest) -> List[AxisRate]:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_azimuth(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_canfindhome(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_canmoveaxis(self, req: AxisRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_canpark(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_canpulseguide(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_cansetdeclinationrate(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_cansetguiderates(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_cansetpark(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_cansetpierside(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_cansetrightascensionrate(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_cansettracking(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_canslew(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_canslewaltaz(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_canslewaltazasync(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_canslewasync(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_cansync(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_cansyncaltaz(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_canunpark(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_declination(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_declinationrate(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_declinationrate(self, req: PutDeclinationRateRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_destinationsideofpier(self, req: CoordinatesRequest) -> PierSide:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_doesrefraction(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_doesrefraction(self, req: PutDoesRefractionRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_equatorialsystem(
+        self, req: CommonRequest
+    ) -> EquatorialCoordinateType:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_findhome(self, req: CommonRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_focallength(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_guideratedeclination(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_guideratedeclination(
+        self, req: PutGuideRateDeclinationRequest
+    ) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_guideraterightascension(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_guideraterightascension(
+        self, req: PutGuideRateRightAscensionRequest
+    ) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_ispulseguiding(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_moveaxis(self, req: PutMoveAxisRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_park(self, req: CommonRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_pulseguide(self, req: PutPulseGuideRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_rightascension(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_rightascensionrate(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_rightascensionrate(self, req: PutRightAscensionRateRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_setpark(self, req: CommonRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_sideofpier(self, req: CommonRequest) -> PierSide:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_sideofpier(self, req: PutSideOfPierRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_siderealtime(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_siteelevation(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_siteelevation(self, req: PutSiteElevationRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_sitelatitude(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_sitelatitude(self, req: PutSiteLatitudeRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_sitelongitude(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_sitelongitude(self, req: PutSiteLongitudeRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_slewing(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_slewsettletime(self, req: CommonRequest) -> int:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_slewsettletime(self, req: PutSlewSettleTimeRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_slewtoaltaz(self, req: AltAzRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_slewtoaltazasync(self, req: AltAzRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_slewtocoordinates(self, req: CoordinatesRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_slewtocoordinatesasync(self, req: CoordinatesRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_slewtotarget(self, req: CommonRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_slewtotargetasync(self, req: CommonRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_synctoaltaz(self, req: AltAzRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_synctocoordinates(self, req: CoordinatesRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_synctotarget(self, req: CommonRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_targetdeclination(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_targetdeclination(self, req: PutTargetDeclinationRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_targetrightascension(self, req: CommonRequest) -> float:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_targetrightascension(
+        self, req: PutTargetRightAscensionRequest
+    ) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_tracking(self, req: CommonRequest) -> bool:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_tracking(self, req: PutTrackingRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_trackingrate(self, req: CommonRequest) -> DriveRate:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_trackingrate(self, req: PutTrackingRateRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_trackingrates(self, req: CommonRequest) -> List[DriveRate]:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_unpark(self, req: CommonRequest) -> None:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def get_utcdate(self, req: CommonRequest) -> str:
+        raise NotImplementedError(req)
+
+    @abstractmethod
+    async def put_utcdate(self, req: PutUTCDateRequest) -> None:
+        raise NotImplementedError(req)
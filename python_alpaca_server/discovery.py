@@ -1,27 +1,221 @@
+import asyncio
 import json
-from typing import Optional
+import socket
+import struct
+import sys
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
 
-import asyncudp
 import structlog
 
 logger: structlog.stdlib.BoundLogger = structlog.get_logger()
 
+DISCOVERY_PORT = 32227
+DISCOVERY_MESSAGE = b"alpacadiscovery"
+IPV6_DISCOVERY_GROUP = "ff12::a1:9aca"
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: float, now: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = now
+
+    def take(self, now: float) -> bool:
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+        if self.tokens < 1:
+            return False
+
+        self.tokens -= 1
+        return True
+
+
+class RateLimiter:
+    """Limits responses per source address and in total.
+
+    The total limit keeps spoofed or very many sources from costing more than
+    a fixed amount of event loop time.
+    """
+
+    def __init__(
+        self,
+        rate: float = 2.0,
+        burst: float = 10.0,
+        total_rate: float = 200.0,
+        total_burst: float = 200.0,
+        max_sources: int = 4096,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.max_sources = max_sources
+        self.total = TokenBucket(total_rate, total_burst, time.monotonic())
+        self._sources: Dict[str, TokenBucket] = {}
+
+    def allow(self, source: str, now: float) -> bool:
+        bucket = self._sources.get(source)
+        if bucket is None:
+            if len(self._sources) >= self.max_sources:
+                self._sources.clear()
+
+            bucket = self._sources[source] = TokenBucket(self.rate, self.burst, now)
+
+        return bucket.take(now) and self.total.take(now)
+
+
+class _DiscoveryProtocol(asyncio.DatagramProtocol):
+    def __init__(self, server: "DiscoveryServer"):
+        self.server = server
+        self.transport: Optional[asyncio.DatagramTransport] = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data: bytes, addr: Tuple):
+        server = self.server
+
+        # Any protocol version, e.g. "alpacadiscovery1", gets the same answer.
+        if not data.startswith(DISCOVERY_MESSAGE):
+            return
+
+        if server.limiter is not None and not server.limiter.allow(
+            addr[0], time.monotonic()
+        ):
+            server.dropped += 1
+            return
+
+        assert self.transport is not None
+        self.transport.sendto(server.response, addr)
+        server.responses += 1
+
+    def error_received(self, exc: Exception):
+        logger.debug("discovery socket error", error=exc)
+
 
 class DiscoveryServer:
-    def __init__(self, http_port: int = 80):
-        self.socket: Optional[asyncudp.Socket] = None
+    """Answers Alpaca discovery on IPv4 broadcast and the IPv6 multicast group.
+
+    ``interfaces`` restricts discovery to the named network interfaces, e.g.
+    ``["eth0"]``. By default every interface is served. ``address`` binds the
+    IPv4 socket to one local address instead, which only receives unicast
+    requests. The response is
+    encoded once, and ``limiter`` caps how often it is sent, so a discovery
+    storm cannot starve the HTTP server sharing the event loop.
+    """
+
+    def __init__(
+        self,
+        http_port: int = 80,
+        interfaces: Optional[Sequence[str]] = None,
+        ipv6: bool = True,
+        port: int = DISCOVERY_PORT,
+        limiter: Optional[RateLimiter] = None,
+        address: str = "0.0.0.0",
+    ):
         self.http_port = http_port
+        self.interfaces = interfaces
+        self.ipv6 = ipv6
+        self.port = port
+        self.address = address
+        self.limiter = limiter if limiter is not None else RateLimiter()
+        self.response = json.dumps({"AlpacaPort": http_port}).encode()
 
-    async def start(self):
-        self.socket = await asyncudp.create_socket(local_addr=("0.0.0.0", 32227))
+        self.responses = 0
+        self.dropped = 0
+        self.transports: List[asyncio.BaseTransport] = []
+
+    def _ipv4_sockets(self) -> List[socket.socket]:
+        if not self.interfaces:
+            names: List[Optional[str]] = [None]
+        elif hasattr(socket, "SO_BINDTODEVICE"):
+            names = list(self.interfaces)
+        else:
+            logger.warning(
+                "binding to interfaces is not supported, serving all of them",
+                platform=sys.platform,
+            )
+            names = [None]
 
-        while True:
-            data, addr = await self.socket.recvfrom()
+        socks = []
+        for name in names:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if name is not None:
+                sock.setsockopt(
+                    socket.SOL_SOCKET,
+                    socket.SO_BINDTODEVICE,  # type: ignore[attr-defined]
+                    name.encode(),
+                )
+            sock.bind((self.address, self.port))
+            socks.append(sock)
+
+        return socks
+
+    def _ipv6_socket(self) -> socket.socket:
+        sock = socket.socket(socket.AF_INET6, socket.SOCK_DGRAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.setsockopt(socket.IPPROTO_IPV6, socket.IPV6_V6ONLY, 1)
+        sock.bind(("::", self.port))
 
-            logger.debug("Received data", data=data, addr=addr)
+        if self.interfaces:
+            indexes = [socket.if_nametoindex(name) for name in self.interfaces]
+        else:
+            indexes = [index for index, _ in socket.if_nameindex()]
 
-            if data == b"alpacadiscovery1":
-                logger.info("Sending response")
-                self.socket.sendto(
-                    json.dumps({"AlpacaPort": self.http_port}).encode(), addr
+        group = socket.inet_pton(socket.AF_INET6, IPV6_DISCOVERY_GROUP)
+        joined = 0
+        for index in indexes:
+            try:
+                sock.setsockopt(
+                    socket.IPPROTO_IPV6,
+                    socket.IPV6_JOIN_GROUP,
+                    group + struct.pack("@I", index),
                 )
+                joined += 1
+            except OSError as e:
+                # Interfaces without multicast, e.g. some tunnels, are skipped.
+                logger.debug("could not join discovery group", index=index, error=e)
+
+        if not joined:
+            sock.close()
+            raise OSError("could not join the IPv6 discovery group on any interface")
+
+        return sock
+
+    async def start(self):
+        loop = asyncio.get_running_loop()
+
+        socks = self._ipv4_sockets()
+        if self.ipv6 and socket.has_ipv6:
+            try:
+                socks.append(self._ipv6_socket())
+            except OSError as e:
+                logger.warning("IPv6 discovery disabled", error=e)
+
+        try:
+            for sock in socks:
+                transport, _ = await loop.create_datagram_endpoint(
+                    lambda: _DiscoveryProtocol(self), sock=sock
+                )
+                self.transports.append(transport)
+
+            logger.info(
+                "discovery server started",
+                port=self.port,
+                http_port=self.http_port,
+                sockets=len(self.transports),
+            )
+
+            # Datagrams are handled by the protocol until this is cancelled.
+            await asyncio.Event().wait()
+        finally:
+            for transport in self.transports:
+                transport.close()
+
+            # Also closes sockets that never got a transport.
+            for sock in socks:
+                sock.close()
+
+            self.transports.clear()
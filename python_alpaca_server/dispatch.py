@@ -0,0 +1,338 @@
+import asyncio
+import contextvars
+import inspect
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+    overload,
+)
+
+import structlog
+
+from .cache import MISSING, PropertyCache, _request_key, cache_ttl
+from .coalesce import SingleFlight
+from .device import (
+    DeviceBase,
+    DeviceType,
+    Operation,
+    OperationHandle,
+    started_operations,
+)
+from .errors import for_request
+from .metrics import Metrics
+from .operations import OperationManager
+from .position import POSITION_METHODS, PositionCache
+from .request import CommonRequest
+from .scheduler import CommandQueue, Priority, classify
+from .tracing import current_trace, now
+
+logger: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)
+
+R = TypeVar("R", bound=CommonRequest)
+T = TypeVar("T")
+
+
+def _timed_call(method: Callable[[R], T], req: R, timing: List[float]) -> T:
+    # Timed on the worker thread so the duration excludes lock and queue waits.
+    start = time.perf_counter()
+    try:
+        return method(req)
+    finally:
+        timing.append(time.perf_counter() - start)
+
+
+class DeviceDispatcher:
+    """Runs synchronous driver methods on a thread pool.
+
+    Calls to the same device are serialized so drivers do not need to be thread
+    safe, while calls to different devices run in parallel. Calls waiting for
+    a device are queued by priority, so stop commands such as ``put_halt``
+    are not held up by a backlog of reads, and a waiting read is shared by
+    identical reads that arrive while it waits. Coroutine methods
+    of ``AsyncDevice`` drivers are awaited directly on the event loop. Methods marked with
+    ``cache.immutable`` or ``cache.cached`` are answered from memory until they
+    expire or the device's connected state is changed. With ``positions``
+    set, telescope position GETs are answered from its sampled mount model,
+    and with ``single_flight`` set, concurrent identical GETs share one call.
+    Operations that drivers start from their PUTs run on ``operations``,
+    which also answers the progress GETs of a device while one is running.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._operation_executor: Optional[ThreadPoolExecutor] = None
+        self._queues: Dict[int, CommandQueue] = {}
+        self.cache = PropertyCache()
+        self.metrics: Optional[Metrics] = None
+        self.positions: Optional[PositionCache] = None
+        self.single_flight: Optional[SingleFlight] = None
+        self.operations = OperationManager(self._run_operation)
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="alpaca-driver",
+            )
+
+        return self._executor
+
+    @property
+    def operation_executor(self) -> ThreadPoolExecutor:
+        # Kept apart from the driver threads: an operation waiting for a
+        # device must not take the thread the call holding it needs.
+        if self._operation_executor is None:
+            self._operation_executor = ThreadPoolExecutor(
+                thread_name_prefix="alpaca-operation",
+            )
+
+        return self._operation_executor
+
+    def _queue_for(self, device: DeviceBase) -> CommandQueue:
+        # Queues are created lazily so they bind to the loop serving requests
+        # rather than whichever loop existed when the server was constructed.
+        queue = self._queues.get(id(device))
+        if queue is None:
+            queue = self._queues[id(device)] = CommandQueue()
+
+        return queue
+
+    @overload
+    async def call(self, method: Callable[[R], Awaitable[T]], req: R) -> T: ...
+
+    @overload
+    async def call(self, method: Callable[[R], T], req: R) -> T: ...
+
+    async def call(self, method: Callable[[R], Any], req: R) -> Any:
+        trace = current_trace.get()
+        if trace is None:
+            return await self._dispatch(method, req)
+
+        start = now()
+        try:
+            return await self._dispatch(method, req)
+        finally:
+            trace.add("driver call", start, method=method.__name__)
+
+    async def _dispatch(self, method: Callable[[R], Any], req: R) -> Any:
+        device: DeviceBase = getattr(method, "__self__")
+        name = method.__name__
+
+        operations = self.operations
+        if operations.active and name.startswith("get_"):
+            value = operations.status(device, name, req)
+            if value is not MISSING:
+                return value
+
+        ttl = cache_ttl(method)
+        if ttl is not None:
+            value = self.cache.get(device, name, req)
+            if value is not MISSING:
+                return value
+
+        positions = self.positions
+        if positions is not None and name in POSITION_METHODS:
+            value = positions.get(device, name)
+            if value is not MISSING:
+                return value
+
+        single_flight = self.single_flight
+        if single_flight is not None and name.startswith("get_"):
+            result = await single_flight.call(
+                device, name, req, lambda: self._call(device, name, method, req)
+            )
+        elif name.startswith("put_"):
+            if operations.active:
+                operations.cancel(device, name)
+            if single_flight is not None:
+                # Reads from now on must not join one started before this.
+                single_flight.invalidate(device)
+
+            started: List[Operation] = []
+            token = started_operations.set(started)
+            try:
+                result = await self._call(device, name, method, req)
+            except BaseException:
+                operations.discard(started)
+                raise
+            finally:
+                started_operations.reset(token)
+
+            for work, state, handle in started:
+                operations.start(device, name, work, state, handle)
+        else:
+            result = await self._call(device, name, method, req)
+
+        if name == "get_devicestate":
+            result = operations.device_state(device, result)
+
+        if ttl is not None:
+            self.cache.put(device, name, req, ttl, result)
+        elif name == "put_connected":
+            self.cache.invalidate(device)
+
+        if name.startswith("put_"):
+            if single_flight is not None:
+                single_flight.invalidate(device)
+            if positions is not None and device.device_type == DeviceType.Telescope:
+                positions.invalidate(device)
+
+        return result
+
+    async def _call(
+        self, device: DeviceBase, name: str, method: Callable[[R], Any], req: R
+    ) -> Any:
+        if inspect.iscoroutinefunction(method):
+            return await self._await(device, name, method, req)
+
+        return await self._run(device, name, method, req)
+
+    async def _await(
+        self,
+        device: DeviceBase,
+        name: str,
+        method: Callable[[R], Awaitable[T]],
+        req: R,
+    ) -> T:
+        # Async drivers run on the event loop and are not serialized, so they
+        # can serve concurrent requests over their own connections.
+        if self.metrics is None:
+            return await method(req)
+
+        start = time.perf_counter()
+        try:
+            return await method(req)
+        finally:
+            self.metrics.observe_driver_call(device, name, time.perf_counter() - start)
+
+    async def _run(
+        self, device: DeviceBase, name: str, method: Callable[[R], T], req: R
+    ) -> T:
+        queue = self._queue_for(device)
+        priority = classify(name)
+
+        if priority is Priority.READ and queue.busy:
+            return await self._queued_read(queue, device, name, method, req)
+
+        await queue.acquire(priority)
+        try:
+            return await self._execute(device, name, method, req)
+        finally:
+            queue.release()
+
+    async def _queued_read(
+        self,
+        queue: CommandQueue,
+        device: DeviceBase,
+        name: str,
+        method: Callable[[R], T],
+        req: R,
+    ) -> T:
+        key = (name, *_request_key(req))
+
+        shared = queue.reads.get(key)
+        while shared is not None:
+            try:
+                return await asyncio.shield(shared)
+            except asyncio.CancelledError:
+                # The read being waited on was cancelled rather than this
+                # one, so wait for the device in its place.
+                if not shared.cancelled():
+                    raise
+            except Exception as e:
+                raise for_request(e, req) from None
+
+            shared = queue.reads.get(key)
+
+        future = queue.reads[key] = asyncio.get_running_loop().create_future()
+        try:
+            try:
+                await queue.acquire(Priority.READ)
+            finally:
+                # Identical reads from now on may see a later value.
+                del queue.reads[key]
+        except BaseException:
+            future.cancel()
+            raise
+
+        try:
+            result = await self._execute(device, name, method, req)
+        except Exception as e:
+            future.set_exception(e)
+            # Marks the exception as retrieved when no read shared it.
+            future.exception()
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            queue.release()
+
+        future.set_result(result)
+        return result
+
+    async def _execute(
+        self, device: DeviceBase, name: str, method: Callable[[R], T], req: R
+    ) -> T:
+        loop = asyncio.get_running_loop()
+        metrics = self.metrics
+        # Run in this call's context, so the driver sees started_operations.
+        context = contextvars.copy_context()
+
+        if metrics is None:
+            return await loop.run_in_executor(self.executor, context.run, method, req)
+
+        timing: List[float] = []
+        try:
+            return await loop.run_in_executor(
+                self.executor, context.run, _timed_call, method, req, timing
+            )
+        finally:
+            if timing:
+                metrics.observe_driver_call(device, name, timing[0])
+
+    async def _run_operation(
+        self, device: DeviceBase, work: Callable[[], T], handle: OperationHandle
+    ) -> Optional[T]:
+        # Blocking operations hold the device only for each step they wrap in
+        # handle.hold(), so reads and stops are served between the steps.
+        loop = asyncio.get_running_loop()
+        queue = self._queue_for(device)
+
+        @contextmanager
+        def hold() -> Iterator[None]:
+            acquire = queue.acquire(Priority.WRITE)
+            asyncio.run_coroutine_threadsafe(acquire, loop).result()
+            try:
+                yield
+            finally:
+                loop.call_soon_threadsafe(queue.release)
+
+        handle.hold = hold
+        if handle.cancelled.is_set():
+            return None
+
+        return await loop.run_in_executor(self.operation_executor, work)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        if self._operation_executor is not None:
+            self._operation_executor.shutdown(wait=False)
+            self._operation_executor = None
+
+        self._queues.clear()
+        self.cache.clear()
+        self.operations.shutdown()
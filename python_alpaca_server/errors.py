@@ -1,5 +1,18 @@
+import copy
+from typing import Any, Dict, Tuple, Type, TypeVar
+
 from .request import CommonRequest
 
+E = TypeVar("E", bound="AlpacaError")
+
+
+def _restore_error(cls: Type[E], args: Tuple[Any, ...], state: Dict[str, Any]) -> E:
+    error = cls.__new__(cls)
+    Exception.__init__(error, *args)
+    error.__dict__.update(state)
+
+    return error
+
 
 class AlpacaError(Exception):
     def __init__(
@@ -18,6 +31,11 @@ class AlpacaError(Exception):
 
         super().__init__(f"{error_number} - {error_message}")
 
+    def __reduce__(self):
+        # Subclasses take a request rather than the fields, so rebuild from
+        # the instance state instead of calling __init__ again.
+        return (_restore_error, (type(self), self.args, self.__dict__))
+
 
 class NotImplementedError(AlpacaError):
     def __init__(self, req: CommonRequest):
@@ -105,3 +123,30 @@ class ActionNotImplemented(AlpacaError):
             req.ClientID,
             req.ServerTransactionID,
         )
+
+
+class DriverError(AlpacaError):
+    def __init__(self, req: CommonRequest, message: str = "driver error"):
+        super().__init__(
+            0x500,
+            message,
+            req.ClientTransactionID,
+            req.ClientID,
+            req.ServerTransactionID,
+        )
+
+
+def for_request(e: BaseException, req: CommonRequest) -> BaseException:
+    """Copy an ``AlpacaError`` with the transaction ids of ``req``.
+
+    Used when an error raised for one request is reported to another.
+    """
+    if not isinstance(e, AlpacaError):
+        return e
+
+    error = copy.copy(e)
+    error.client_transaction_id = req.ClientTransactionID
+    error.client_id = req.ClientID
+    error.server_transaction_id = req.ServerTransactionID
+
+    return error
@@ -0,0 +1,318 @@
+import array
+import json
+import struct
+import sys
+from enum import Enum
+from typing import Any, Awaitable, Dict, Iterator, Optional, Tuple
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+from .errors import AlpacaError
+from .middleware import _count_error
+from .request import CommonRequest
+from .response import HTTPResponse
+from .tracing import current_trace, now
+
+# A NumPy array or any other object supporting the buffer protocol, with
+# shape (x, y) or (x, y, planes).
+ImageArray = Any
+
+IMAGEBYTES_MEDIA_TYPE = "application/imagebytes"
+
+# Driver methods whose value is an image rather than a JSON value.
+IMAGE_METHODS = frozenset(("get_imagearray", "get_imagearrayvariant"))
+
+# Version 1 of the ImageBytes header: eleven little-endian 32-bit integers.
+_header = struct.Struct("<iiIIiiiiiii")
+
+_chunk_size = 1 << 20
+
+# Pixels encoded per chunk of a streamed JSON image.
+_json_chunk_values = 1 << 16
+
+
+class ImageArrayElementType(int, Enum):
+    Unknown = 0
+    Int16 = 1
+    Int32 = 2
+    Double = 3
+    Single = 4
+    UInt64 = 5
+    Byte = 6
+    Int64 = 7
+    UInt16 = 8
+    UInt32 = 9
+
+
+# (struct format character kind, item size) -> element type
+_element_types: Dict[Tuple[str, int], ImageArrayElementType] = {
+    ("u", 1): ImageArrayElementType.Byte,
+    ("i", 2): ImageArrayElementType.Int16,
+    ("u", 2): ImageArrayElementType.UInt16,
+    ("i", 4): ImageArrayElementType.Int32,
+    ("u", 4): ImageArrayElementType.UInt32,
+    ("i", 8): ImageArrayElementType.Int64,
+    ("u", 8): ImageArrayElementType.UInt64,
+    ("f", 4): ImageArrayElementType.Single,
+    ("f", 8): ImageArrayElementType.Double,
+}
+
+# The array module typecode for each element type, used to reorder bytes.
+_typecodes = {
+    (kind, array.array(code).itemsize): code
+    for kind, codes in (("i", "qlih"), ("u", "QLIHB"), ("f", "df"))
+    for code in codes
+}
+
+
+def _cast(view: memoryview, typecode: str, shape: Tuple[int, ...]) -> memoryview:
+    return view.cast(typecode, shape)  # type: ignore[call-overload]
+
+
+class Image:
+    """An image as a C-contiguous, native byte order ``memoryview``.
+
+    Buffers in another layout or byte order are converted with one copy made
+    by ``memoryview`` and ``array``, so no pixel is touched in Python.
+    """
+
+    def __init__(self, image: ImageArray):
+        view = memoryview(image)
+
+        if view.ndim not in (2, 3):
+            raise ValueError(f"image must have 2 or 3 dimensions, not {view.ndim}")
+
+        byte_order = view.format[0] if view.format[0] in "@=<>!" else "@"
+        code = view.format.lstrip("@=<>!")
+
+        if len(code) != 1:
+            raise ValueError(f"unsupported image element format {view.format!r}")
+        elif code in "fd":
+            kind = "f"
+        elif code in "bhilq":
+            kind = "i"
+        elif code in "BHILQ":
+            kind = "u"
+        else:
+            raise ValueError(f"unsupported image element format {view.format!r}")
+
+        if (kind, view.itemsize) not in _element_types:
+            raise ValueError(f"unsupported image element format {view.format!r}")
+
+        shape = tuple(view.shape or ())
+        if 0 in shape:
+            raise ValueError("image is empty")
+
+        swap = byte_order in "<>!" and (byte_order == "<") != (
+            sys.byteorder == "little"
+        )
+        typecode = _typecodes[(kind, view.itemsize)]
+
+        if swap:
+            converted = array.array(typecode, view.tobytes())
+            converted.byteswap()
+            view = _cast(memoryview(converted).cast("B"), typecode, shape)
+        elif not view.c_contiguous:
+            view = _cast(memoryview(view.tobytes()), typecode, shape)
+        elif view.format != typecode:
+            view = _cast(view.cast("B"), typecode, shape)
+
+        self.view = view
+        self.shape = shape
+        self.element_type = _element_types[(kind, view.itemsize)]
+        self.image_element_type = (
+            ImageArrayElementType.Double if kind == "f" else ImageArrayElementType.Int32
+        )
+
+    @property
+    def rank(self) -> int:
+        return self.view.ndim
+
+    def little_endian_bytes(self) -> memoryview:
+        if sys.byteorder == "little":
+            return self.view.cast("B")
+
+        converted = array.array(self.view.format, self.view.tobytes())
+        converted.byteswap()
+
+        return memoryview(converted).cast("B")
+
+
+def _imagebytes_header(
+    error_number: int,
+    client_transaction_id: int,
+    server_transaction_id: int,
+    image: Optional[Image] = None,
+) -> bytes:
+    if image is None:
+        element_type = transmission_type = rank = 0
+        dimensions: Tuple[int, ...] = (0, 0, 0)
+    else:
+        # The image type tells the client which array to build, the
+        # transmission type how the pixels are sent.
+        element_type = image.image_element_type
+        transmission_type = image.element_type
+        rank = image.rank
+        dimensions = image.shape + (0,) * (3 - image.rank)
+
+    # The header holds uint32 transaction IDs, while requests accept any int.
+    return _header.pack(
+        1,
+        error_number,
+        client_transaction_id & 0xFFFFFFFF,
+        server_transaction_id & 0xFFFFFFFF,
+        _header.size,
+        element_type,
+        transmission_type,
+        rank,
+        *dimensions,
+    )
+
+
+class ImageBytesResponse(HTTPResponse):
+    """Sends the ImageBytes header and then the pixels in 1 MiB chunks, so
+    only one chunk of the image is copied at a time."""
+
+    media_type = IMAGEBYTES_MEDIA_TYPE
+
+    def __init__(self, header: bytes, data: memoryview):
+        self.header = header
+        self.data = data
+
+        super().__init__(
+            headers={"content-length": str(len(header) + len(data))},
+            media_type=self.media_type,
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            }
+        )
+        await send(
+            {"type": "http.response.body", "body": self.header, "more_body": True}
+        )
+
+        data = self.data
+        for start in range(0, len(data), _chunk_size):
+            end = start + _chunk_size
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": bytes(data[start:end]),
+                    "more_body": True,
+                }
+            )
+
+        await send({"type": "http.response.body", "body": b""})
+
+
+def imagebytes_response(req: CommonRequest, image: ImageArray) -> HTTPResponse:
+    img = Image(image)
+    header = _imagebytes_header(
+        0, req.ClientTransactionID, req.ServerTransactionID, img
+    )
+
+    return ImageBytesResponse(header, img.little_endian_bytes())
+
+
+def imagebytes_error_response(e: AlpacaError) -> HTTPResponse:
+    # The error message follows the header in place of the pixels.
+    header = _imagebytes_header(
+        e.error_number, e.client_transaction_id, e.server_transaction_id
+    )
+
+    return HTTPResponse(
+        header + e.error_message.encode("utf-8"), media_type=IMAGEBYTES_MEDIA_TYPE
+    )
+
+
+def _json_chunks(req: CommonRequest, img: Image) -> Iterator[bytes]:
+    yield (
+        b'{"Type":%d,"Rank":%d,"ClientTransactionID":%d,'
+        b'"ServerTransactionID":%d,"Value":['
+    ) % (
+        img.image_element_type,
+        img.rank,
+        req.ClientTransactionID,
+        req.ServerTransactionID,
+    )
+
+    # Each chunk is a block of whole columns, i.e. consecutive x indexes,
+    # listed and encoded by the C implementations of memoryview and json.
+    column_shape = img.shape[1:]
+    column_values = 1
+    for n in column_shape:
+        column_values *= n
+
+    columns = max(1, _json_chunk_values // max(column_values, 1))
+    column_bytes = column_values * img.view.itemsize
+    data = img.view.cast("B")
+
+    for x in range(0, img.shape[0], columns):
+        count = min(columns, img.shape[0] - x)
+        start = x * column_bytes
+        end = start + count * column_bytes
+
+        encoded = json.dumps(
+            _cast(data[start:end], img.view.format, (count,) + column_shape).tolist(),
+            separators=(",", ":"),
+        )
+        # Drop the block's own brackets so the blocks join into one array.
+        yield (encoded[1:-1] if x == 0 else "," + encoded[1:-1]).encode()
+
+    yield b"]}"
+
+
+def json_response(req: CommonRequest, image: ImageArray) -> HTTPResponse:
+    """Stream the JSON ``ImageArray`` response a block of columns at a time,
+    so memory use stays bounded however large the image is."""
+    return StreamingResponse(
+        _json_chunks(req, Image(image)), media_type="application/json"
+    )
+
+
+def accepts_imagebytes(request: Request) -> bool:
+    return IMAGEBYTES_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+async def image_response(
+    request: Request, req: CommonRequest, image: Awaitable[ImageArray]
+) -> HTTPResponse:
+    """Answer an ``imagearray`` request as ImageBytes when the client accepts
+    it, and as JSON otherwise.
+
+    Errors are sent in the ImageBytes format too, since a client asking for
+    it may not expect a JSON body.
+    """
+    if not accepts_imagebytes(request):
+        value = await image
+        trace = current_trace.get()
+        start = now() if trace is not None else 0
+
+        # The values themselves are encoded while the response is sent.
+        response: HTTPResponse = json_response(req, value)
+        if trace is not None:
+            trace.add("encode response", start, format="json")
+
+        return response
+
+    try:
+        value = await image
+    except AlpacaError as e:
+        _count_error(request.scope, e)
+        return imagebytes_error_response(e)
+
+    trace = current_trace.get()
+    start = now() if trace is not None else 0
+
+    response = imagebytes_response(req, value)
+    if trace is not None:
+        trace.add("encode response", start, format="imagebytes")
+
+    return response
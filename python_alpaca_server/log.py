@@ -0,0 +1,198 @@
+import atexit
+import logging
+import queue
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Mapping, MutableMapping, Optional, TextIO, Tuple, Union
+
+import structlog
+from structlog.typing import EventDict, Processor, WrappedLogger
+
+# Events logged for every request or datagram, with how many of them go by
+# for each one written.
+DEFAULT_SAMPLING: Dict[str, int] = {
+    "discovery socket error": 100,
+    "ignoring discovery response": 100,
+    "looking for device": 100,
+}
+
+_writer: Optional["LogWriter"] = None
+
+
+class Sampler:
+    """Keeps one in every ``n`` of the events named in ``rates``.
+
+    Kept events get a ``sampled`` key with their rate, so counts can be
+    scaled back up.
+    """
+
+    def __init__(self, rates: Mapping[str, int]):
+        self.rates = dict(rates)
+        self._counts: Dict[str, int] = {}
+
+    def __call__(
+        self, logger: WrappedLogger, method_name: str, event_dict: EventDict
+    ) -> EventDict:
+        event = event_dict.get("event")
+        if not isinstance(event, str):
+            return event_dict
+
+        rate = self.rates.get(event)
+        if rate is None or rate <= 1:
+            return event_dict
+
+        count = self._counts.get(event, 0)
+        self._counts[event] = count + 1
+        if count % rate:
+            raise structlog.DropEvent
+
+        event_dict["sampled"] = rate
+        return event_dict
+
+
+def _capture_exc_info(
+    logger: WrappedLogger, method_name: str, event_dict: EventDict
+) -> EventDict:
+    # The writer thread cannot see the caller's exception, so it is taken here.
+    if event_dict.get("exc_info") is True or method_name == "exception":
+        event_dict["exc_info"] = sys.exc_info()
+
+    return event_dict
+
+
+def _timestamp(
+    logger: WrappedLogger, method_name: str, event_dict: EventDict
+) -> EventDict:
+    # Formatted by the writer.
+    event_dict["timestamp"] = time.time()
+    return event_dict
+
+
+def _enqueue(
+    logger: WrappedLogger, method_name: str, event_dict: EventDict
+) -> Tuple[Tuple[str, EventDict], Dict[str, Any]]:
+    return (method_name, event_dict), {}
+
+
+class LogWriter:
+    """Renders and writes log events on a background thread.
+
+    Events wait in a queue of at most ``max_queued``. When the writer falls
+    that far behind, new events are counted in ``dropped`` instead of
+    blocking the event loop.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO,
+        renderer: Optional[Processor] = None,
+        max_queued: int = 10000,
+    ):
+        self.stream = stream
+        self.renderer = renderer or structlog.dev.ConsoleRenderer(colors=False)
+        self.max_queued = max_queued
+        self.dropped = 0
+        # Unbounded but checked in put, since it is much cheaper to put to.
+        self._queue: "queue.SimpleQueue[Optional[Tuple[str, EventDict]]]" = (
+            queue.SimpleQueue()
+        )
+        self._thread = threading.Thread(
+            target=self._write, name="alpaca-log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def put(self, method_name: str, event_dict: EventDict) -> None:
+        if self._queue.qsize() >= self.max_queued:
+            self.dropped += 1
+            return
+
+        self._queue.put((method_name, event_dict))
+
+    def _render(self, method_name: str, event_dict: MutableMapping[str, Any]) -> str:
+        timestamp = event_dict.get("timestamp")
+        if isinstance(timestamp, float):
+            event_dict["timestamp"] = datetime.fromtimestamp(timestamp).strftime(
+                "%Y-%m-%d %H:%M:%S"
+            )
+
+        return str(self.renderer(None, method_name, event_dict))
+
+    def _write(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+
+            try:
+                self.stream.write(self._render(*item) + "\n")
+                if self._queue.empty():
+                    self.stream.flush()
+            except Exception:
+                # A bad event or a closed stream must not stop the writer.
+                pass
+
+    def close(self, timeout: float = 1.0) -> None:
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+
+class _QueueLogger:
+    def msg(self, method_name: str, event_dict: EventDict) -> None:
+        # The current writer rather than the one at creation, since loggers
+        # are cached by the first configuration they are used with.
+        if _writer is not None:
+            _writer.put(method_name, event_dict)
+
+    debug = info = warning = warn = error = critical = fatal = exception = msg
+
+
+def configure_logging(
+    level: Union[int, str] = logging.INFO,
+    sampling: Optional[Mapping[str, int]] = None,
+    stream: Optional[TextIO] = None,
+    renderer: Optional[Processor] = None,
+    max_queued: int = 10000,
+) -> LogWriter:
+    """Configure structlog for serving.
+
+    Calls below ``level`` return at once without building an event. The rest
+    are sampled by event name with ``sampling``, one in every n, which
+    defaults to ``DEFAULT_SAMPLING``, and are handed to a ``LogWriter`` that
+    renders them with ``renderer`` and writes them to ``stream`` (stderr by
+    default) on its own thread. Call it once at startup, since loggers keep
+    the level they were first used with.
+    """
+    global _writer
+
+    if isinstance(level, str):
+        level = logging.getLevelName(level.upper())
+        if not isinstance(level, int):
+            raise ValueError(f"unknown log level: {level}")
+
+    if _writer is not None:
+        _writer.close()
+
+    _writer = LogWriter(stream or sys.stderr, renderer, max_queued)
+    structlog.configure(
+        processors=[
+            Sampler(DEFAULT_SAMPLING if sampling is None else sampling),
+            structlog.contextvars.merge_contextvars,
+            structlog.processors.add_log_level,
+            _capture_exc_info,
+            _timestamp,
+            _enqueue,
+        ],
+        wrapper_class=structlog.make_filtering_bound_logger(level),
+        logger_factory=lambda *args: _QueueLogger(),
+        cache_logger_on_first_use=True,
+    )
+
+    return _writer
+
+
+@atexit.register
+def _flush() -> None:
+    if _writer is not None:
+        _writer.close()
@@ -0,0 +1,218 @@
+import time
+from bisect import bisect_left
+from typing import Dict, List, Sequence, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .device import DeviceBase, UrlDeviceType
+
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Labels = Tuple[str, ...]
+
+_url_device_types = frozenset(t.value for t in UrlDeviceType)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    return ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values))
+
+
+class Counter:
+    def __init__(self, name: str, help: str, label_names: Sequence[str]):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(label_names)
+        self.values: Dict[Labels, int] = {}
+
+    def inc(self, labels: Labels) -> None:
+        self.values[labels] = self.values.get(labels, 0) + 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for labels, value in self.values.items():
+            lines.append(
+                f"{self.name}{{{_format_labels(self.label_names, labels)}}} {value}"
+            )
+
+        return lines
+
+
+class Histogram:
+    """A Prometheus histogram with fixed buckets.
+
+    Each label set owns a pre-allocated list of per-bucket counts followed by
+    the sum, so observing a value is a bisect and two in-place additions.
+    Counts are made cumulative only when rendered.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        label_names: Sequence[str],
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(buckets)
+        self.series: Dict[Labels, List[float]] = {}
+
+    def observe(self, labels: Labels, value: float) -> None:
+        series = self.series.get(labels)
+        if series is None:
+            # One slot per bucket, one for +Inf and one for the sum.
+            series = self.series[labels] = [0] * (len(self.buckets) + 2)
+
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        bounds = [repr(b) for b in self.buckets] + ["+Inf"]
+
+        for labels, series in self.series.items():
+            label_text = _format_labels(self.label_names, labels)
+            prefix = f"{label_text}," if label_text else ""
+
+            count = 0
+            for bound, bucket_count in zip(bounds, series):
+                count += int(bucket_count)
+                lines.append(f'{self.name}_bucket{{{prefix}le="{bound}"}} {count}')
+
+            lines.append(f"{self.name}_sum{{{label_text}}} {series[-1]!r}")
+            lines.append(f"{self.name}_count{{{label_text}}} {count}")
+
+        return lines
+
+
+class Metrics:
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        endpoint_labels = ("device_type", "device_number", "method")
+
+        self.requests = Counter(
+            "alpaca_requests_total",
+            "HTTP requests by endpoint and status code.",
+            endpoint_labels + ("status",),
+        )
+        self.request_duration = Histogram(
+            "alpaca_request_duration_seconds",
+            "Time to serve an HTTP request, including driver calls.",
+            endpoint_labels,
+            buckets,
+        )
+        self.driver_duration = Histogram(
+            "alpaca_driver_call_duration_seconds",
+            "Time spent inside driver methods.",
+            endpoint_labels,
+            buckets,
+        )
+        self.errors = Counter(
+            "alpaca_errors_total",
+            "AlpacaError responses by ErrorNumber.",
+            ("error_number",),
+        )
+        self.in_flight = 0
+
+        self._driver_labels: Dict[Tuple[int, str], Labels] = {}
+
+    def observe_driver_call(self, device: DeviceBase, name: str, duration: float):
+        key = (id(device), name)
+        labels = self._driver_labels.get(key)
+        if labels is None:
+            labels = self._driver_labels[key] = (
+                UrlDeviceType[device.device_type.name].value,
+                str(device.device_number),
+                name,
+            )
+
+        self.driver_duration.observe(labels, duration)
+
+    def count_error(self, error_number: int) -> None:
+        self.errors.inc((str(error_number),))
+
+    def render(self) -> bytes:
+        lines = [
+            "# HELP alpaca_requests_in_flight HTTP requests currently being served.",
+            "# TYPE alpaca_requests_in_flight gauge",
+            f"alpaca_requests_in_flight {self.in_flight}",
+        ]
+        lines += self.requests.render()
+        lines += self.request_duration.render()
+        lines += self.driver_duration.render()
+        lines += self.errors.render()
+
+        return ("\n".join(lines) + "\n").encode()
+
+
+def _endpoint_labels(path: str, status: int) -> Labels:
+    # Unmatched paths are folded together so arbitrary URLs cannot create
+    # unbounded label sets.
+    if status == 404:
+        return ("", "", "unmatched")
+
+    parts = path.split("/")
+    if len(parts) == 6 and parts[1] == "api":
+        if parts[3] in _url_device_types and parts[4].isdigit():
+            # Normalized as the device lookup parses it, so "00" and "0"
+            # share a series.
+            return (parts[3], str(int(parts[4])), parts[5])
+
+        return ("", "", "unmatched")
+
+    return ("", "", path)
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp, metrics: Metrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        metrics = self.metrics
+        status = 500
+
+        async def _send(message: Message):
+            nonlocal status
+
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+            await send(message)
+
+        metrics.in_flight += 1
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, _send)
+        finally:
+            duration = time.perf_counter() - start
+            metrics.in_flight -= 1
+
+            labels = _endpoint_labels(scope["path"], status)
+            metrics.request_duration.observe(labels, duration)
+            metrics.requests.inc(labels + (str(status),))
@@ -1,57 +1,98 @@
 import structlog
 from fastapi import Request
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from .errors import AlpacaError
 from .response import Response
+from .tracing import current_trace, now
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+def _count_error(scope: Scope, e: AlpacaError) -> None:
+    metrics = getattr(getattr(scope.get("app"), "state", None), "metrics", None)
+    if metrics is not None:
+        metrics.count_error(e.error_number)
+
+
+def alpaca_error_response(e: AlpacaError) -> JSONResponse:
+    response = Response[None](
+        Value=None,
+        ErrorNumber=e.error_number,
+        ErrorMessage=e.error_message,
+        ClientTransactionID=e.client_transaction_id,
+        ServerTransactionID=e.server_transaction_id,
+    )
+
+    return JSONResponse(
+        response.model_dump(
+            exclude_defaults=True, exclude_none=True, exclude_unset=True
+        ),
+        status_code=200,
+    )
+
+
+async def alpaca_error_handler(request: Request, exc: Exception) -> JSONResponse:
+    assert isinstance(exc, AlpacaError)
+
+    _count_error(request.scope, exc)
+
+    trace = current_trace.get()
+    start = now() if trace is not None else 0
+
+    response = alpaca_error_response(exc)
+    if trace is not None:
+        trace.add("encode response", start, error_number=exc.error_number)
+
+    return response
+
+
+class LoggingMiddleware:
     def __init__(
         self,
         app: ASGIApp,
         logger: structlog.stdlib.BoundLogger,
     ):
-        super().__init__(app)
+        self.app = app
         self.logger = logger
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint):
-        self.logger.info(
-            "Request",
-            method=request.method,
-            path=request.url.path,
-        )
-
-        # process the request and get the response
-        response = await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http":
+            self.logger.info(
+                "Request",
+                method=scope["method"],
+                path=scope["path"],
+            )
 
-        return response
+        await self.app(scope, receive, send)
 
 
-class ErrorHandlerMiddleware(BaseHTTPMiddleware):
+class ErrorHandlerMiddleware:
     def __init__(
         self,
         app: ASGIApp,
     ):
-        super().__init__(app)
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def _send(message: Message):
+            nonlocal response_started
+
+            if message["type"] == "http.response.start":
+                response_started = True
+
+            await send(message)
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint):
         try:
-            return await call_next(request)
+            await self.app(scope, receive, _send)
         except AlpacaError as e:
-            response = Response[None](
-                Value=None,
-                ErrorNumber=e.error_number,
-                ErrorMessage=e.error_message,
-                ClientTransactionID=e.client_transaction_id,
-                ServerTransactionID=e.server_transaction_id,
-            )
+            if response_started:
+                raise
 
-            return JSONResponse(
-                response.model_dump(
-                    exclude_defaults=True, exclude_none=True, exclude_unset=True
-                ),
-                status_code=200,
-            )
+            _count_error(scope, e)
+            await alpaca_error_response(e)(scope, receive, send)
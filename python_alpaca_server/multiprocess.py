@@ -0,0 +1,467 @@
+import asyncio
+import hashlib
+import hmac
+import itertools
+import multiprocessing
+import os
+import pickle
+import shutil
+import signal
+import socket
+import struct
+import tempfile
+from types import MethodType
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union, cast
+
+import structlog
+
+from .api.management import Description
+from .app import AlpacaServer
+from .cache import MISSING
+from .device import AnyDevice, DeviceBase, DeviceType
+from .discovery import DiscoveryServer
+from .log import configure_logging
+from .request import CommonRequest, configure_server_transaction_ids
+from .statetable import Layout, StatePublisher, StateTable, table_layout
+
+logger: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)
+
+Address = Union[str, Tuple[str, int]]
+
+_header = struct.Struct("!I")
+_digest_size = hashlib.sha256().digest_size
+
+
+def _digest(authkey: bytes, payload: bytes) -> bytes:
+    return hmac.new(authkey, payload, hashlib.sha256).digest()
+
+
+async def _read_frame(reader: asyncio.StreamReader, authkey: bytes) -> Any:
+    # Frames are pickled, so one is only unpickled once its HMAC shows it
+    # came from a process started with the same key.
+    (size,) = _header.unpack(await reader.readexactly(_header.size))
+    digest = await reader.readexactly(_digest_size)
+    payload = await reader.readexactly(size)
+
+    if not hmac.compare_digest(digest, _digest(authkey, payload)):
+        raise multiprocessing.AuthenticationError("frame failed authentication")
+
+    return pickle.loads(payload)
+
+
+def _write_frame(writer: asyncio.StreamWriter, authkey: bytes, message: Any) -> None:
+    payload = pickle.dumps(message, pickle.HIGHEST_PROTOCOL)
+    writer.write(_header.pack(len(payload)) + _digest(authkey, payload) + payload)
+
+
+class DeviceOwner:
+    """Runs the driver calls sent by worker processes.
+
+    Calls go through the server's own dispatcher, so per-device serialization
+    and caching behave exactly as they do in a single process. Connections
+    whose frames are not signed with ``authkey`` are closed.
+    """
+
+    def __init__(
+        self,
+        server: AlpacaServer,
+        authkey: bytes,
+        publisher: Optional[StatePublisher] = None,
+    ):
+        self.server = server
+        self.authkey = authkey
+        self.publisher = publisher
+
+    async def _call(
+        self,
+        writer: asyncio.StreamWriter,
+        call_id: int,
+        device_index: int,
+        name: str,
+        req: CommonRequest,
+    ) -> None:
+        try:
+            if not name.startswith(("get_", "put_")):
+                raise AttributeError(name)
+
+            method = getattr(self.server.devices[device_index], name)
+            response = (call_id, True, await self.server.dispatcher.call(method, req))
+        except Exception as e:
+            response = (call_id, False, e)
+        else:
+            # Commands usually change the published state, so refresh it now
+            # rather than at the next poll.
+            if self.publisher is not None and name.startswith("put_"):
+                self.publisher.publish_soon(device_index)
+
+        try:
+            _write_frame(writer, self.authkey, response)
+        except Exception as e:
+            # The value or exception could not be pickled.
+            _write_frame(writer, self.authkey, (call_id, False, RuntimeError(repr(e))))
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        tasks = set()
+
+        try:
+            while True:
+                call_id, device_index, name, req = await _read_frame(
+                    reader, self.authkey
+                )
+
+                task = asyncio.ensure_future(
+                    self._call(writer, call_id, device_index, name, req)
+                )
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except multiprocessing.AuthenticationError:
+            logger.warning("closed unauthenticated device owner connection")
+        finally:
+            for task in tasks:
+                task.cancel()
+
+            writer.close()
+
+
+class DeviceClient:
+    """Sends driver calls from a worker process to the device owner.
+
+    All calls share one connection and are matched to their responses by id,
+    so any number of requests can wait on the owner at once.
+    """
+
+    def __init__(self, address: Address, authkey: bytes):
+        self.address = address
+        self.authkey = authkey
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._connecting: Optional[asyncio.Lock] = None
+        self._reader_task: Optional[asyncio.Future] = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._call_ids = itertools.count()
+
+    async def _connect(self) -> asyncio.StreamWriter:
+        if self._connecting is None:
+            self._connecting = asyncio.Lock()
+
+        async with self._connecting:
+            if self._writer is None:
+                if isinstance(self.address, str):
+                    reader, writer = await asyncio.open_unix_connection(self.address)
+                else:
+                    reader, writer = await asyncio.open_connection(*self.address)
+
+                self._reader_task = asyncio.ensure_future(self._read(reader))
+                self._writer = writer
+
+            return self._writer
+
+    async def _read(self, reader: asyncio.StreamReader) -> None:
+        try:
+            while True:
+                call_id, ok, value = await _read_frame(reader, self.authkey)
+
+                future = self._pending.pop(call_id, None)
+                if future is not None and not future.done():
+                    future.set_result((ok, value))
+        except Exception as e:
+            error = e
+
+        # Calls made from now on open a new connection.
+        self._writer = None
+
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError(f"device owner lost: {error}"))
+
+        self._pending.clear()
+
+    async def call(self, device_index: int, name: str, req: CommonRequest) -> Any:
+        writer = self._writer or await self._connect()
+
+        call_id = next(self._call_ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[call_id] = future
+
+        try:
+            _write_frame(writer, self.authkey, (call_id, device_index, name, req))
+            ok, value = await future
+        finally:
+            self._pending.pop(call_id, None)
+
+        if not ok:
+            raise value
+
+        return value
+
+
+class DeviceProxy(DeviceBase):
+    """Stands in for a device that lives in the device owner process.
+
+    Every ``get_`` and ``put_`` method is a coroutine that forwards the call,
+    so the dispatcher awaits it like an ``AsyncDevice`` method. Properties in
+    the state table are answered from shared memory while they are fresh.
+    """
+
+    def __init__(
+        self,
+        client: DeviceClient,
+        device_index: int,
+        device_type: DeviceType,
+        unique_id: str,
+        state: Optional[StateTable] = None,
+        state_max_age: float = 1.0,
+    ):
+        super().__init__(device_type, unique_id)
+        self._client = client
+        self._device_index = device_index
+        self._state = state
+        self._state_max_age = state_max_age
+
+    def __getattr__(self, name: str) -> Any:
+        if not name.startswith(("get_", "put_")):
+            raise AttributeError(name)
+
+        key = (self._device_index, name)
+        state = self._state
+
+        if state is not None and key in state.layout:
+
+            async def method(self: DeviceProxy, req: CommonRequest) -> Any:
+                value = state.read(key, self._state_max_age)
+                if value is not MISSING:
+                    return value
+
+                return await self._client.call(self._device_index, name, req)
+
+        else:
+
+            async def method(self: DeviceProxy, req: CommonRequest) -> Any:
+                return await self._client.call(self._device_index, name, req)
+
+        method.__name__ = name
+
+        bound = MethodType(method, self)
+        setattr(self, name, bound)
+
+        return bound
+
+
+class _WorkerConfig(NamedTuple):
+    worker_index: int
+    generation: int
+    workers: int
+    address: Address
+    authkey: bytes
+    description: Description
+    devices: List[Tuple[DeviceType, str]]
+    http_port: int
+    single_route: bool
+    metrics: bool
+    log_level: str
+    state_table: Optional[Tuple[str, Layout]]
+    state_max_age: float
+
+
+def _run_worker(config: _WorkerConfig, sock: socket.socket) -> None:
+    import uvicorn
+
+    configure_logging(config.log_level)
+
+    # Each worker hands out its own ServerTransactionID range, and one that
+    # replaces an exited worker does not repeat that worker's IDs.
+    configure_server_transaction_ids(
+        config.worker_index, config.workers, config.generation
+    )
+
+    state: Optional[StateTable] = None
+    if config.state_table is not None:
+        state = StateTable.attach(*config.state_table)
+
+    client = DeviceClient(config.address, config.authkey)
+    proxies = [
+        DeviceProxy(client, i, device_type, unique_id, state, config.state_max_age)
+        for i, (device_type, unique_id) in enumerate(config.devices)
+    ]
+
+    server = AlpacaServer(
+        config.description,
+        cast(List[AnyDevice], proxies),
+        single_route=config.single_route,
+        metrics=config.metrics,
+    )
+    app = server.create_app(config.http_port, discovery=False)
+
+    uvicorn.Server(uvicorn.Config(app, log_level=config.log_level)).run(sockets=[sock])
+
+
+async def _serve(
+    server: AlpacaServer,
+    sock: socket.socket,
+    http_port: int,
+    workers: int,
+    log_level: str,
+    state_interval: Optional[float],
+    state_max_age: float,
+) -> None:
+    loop = asyncio.get_running_loop()
+
+    state: Optional[StateTable] = None
+    publisher: Optional[StatePublisher] = None
+    publishing: Optional[asyncio.Future] = None
+    if state_interval is not None:
+        state = StateTable.create(table_layout(server.devices))
+        publisher = StatePublisher(state, server.devices, server.dispatcher)
+        publishing = asyncio.ensure_future(publisher.run(state_interval))
+
+    sampling: Optional[asyncio.Future] = None
+    if server.positions is not None:
+        sampling = asyncio.ensure_future(
+            server.positions.run(server.devices, server.dispatcher)
+        )
+
+    # Handed to workers through the spawn pipe rather than the IPC socket.
+    authkey = os.urandom(32)
+    owner = DeviceOwner(server, authkey, publisher)
+
+    ipc_dir: Optional[str] = None
+    address: Address
+    if hasattr(socket, "AF_UNIX"):
+        ipc_dir = tempfile.mkdtemp(prefix="python-alpaca-server-")
+        address = os.path.join(ipc_dir, "owner.sock")
+        ipc_server = await asyncio.start_unix_server(owner.handle, address)
+    else:
+        ipc_server = await asyncio.start_server(owner.handle, "127.0.0.1", 0)
+        address = ipc_server.sockets[0].getsockname()[:2]
+
+    discovery = asyncio.ensure_future(DiscoveryServer(http_port).start())
+
+    desc = server.server_description
+    description = desc() if callable(desc) else desc
+
+    def start_worker(
+        index: int, generation: int = 0
+    ) -> multiprocessing.process.BaseProcess:
+        config = _WorkerConfig(
+            worker_index=index,
+            generation=generation,
+            workers=workers,
+            address=address,
+            authkey=authkey,
+            description=description,
+            devices=[(d.device_type, d.unique_id) for d in server.devices],
+            http_port=http_port,
+            single_route=server.single_route,
+            metrics=server.metrics is not None,
+            log_level=log_level,
+            state_table=None if state is None else (state.name, state.layout),
+            state_max_age=state_max_age,
+        )
+        process = multiprocessing.get_context("spawn").Process(
+            target=_run_worker,
+            args=(config, sock),
+            name=f"alpaca-http-{index}",
+        )
+        process.start()
+
+        return process
+
+    processes = [start_worker(i) for i in range(workers)]
+    generations = [0] * workers
+
+    stop = asyncio.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:
+            pass
+
+    try:
+        while not stop.is_set():
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=0.5)
+            except asyncio.TimeoutError:
+                pass
+
+            for i, process in enumerate(processes):
+                if not stop.is_set() and not process.is_alive():
+                    logger.warning(
+                        "http worker exited, restarting",
+                        worker=i,
+                        exitcode=process.exitcode,
+                    )
+                    generations[i] += 1
+                    processes[i] = start_worker(i, generations[i])
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+        for process in processes:
+            await loop.run_in_executor(None, process.join)
+
+        discovery.cancel()
+        if publishing is not None:
+            publishing.cancel()
+        if sampling is not None:
+            sampling.cancel()
+
+        ipc_server.close()
+        await ipc_server.wait_closed()
+        server.dispatcher.shutdown()
+
+        if ipc_dir is not None:
+            shutil.rmtree(ipc_dir, ignore_errors=True)
+
+        if state is not None:
+            state.close()
+            state.unlink()
+
+
+def serve(
+    server: AlpacaServer,
+    host: str = "0.0.0.0",
+    port: int = 8000,
+    workers: Optional[int] = None,
+    log_level: str = "info",
+    state_interval: Optional[float] = None,
+    state_max_age: float = 1.0,
+) -> None:
+    """Serve HTTP from several processes while one process owns the devices.
+
+    The calling process keeps the drivers, answers discovery and runs every
+    driver call. ``workers`` spawned processes share the listening socket,
+    parse requests and encode responses, and forward driver calls to it over
+    a local socket.
+
+    With ``state_interval`` set, the owner also reads every device's state
+    that often and publishes its scalar properties into shared memory.
+    Workers answer GETs for those properties from there while they are at
+    most ``state_max_age`` seconds old.
+    """
+    workers = workers or os.cpu_count() or 1
+
+    sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.set_inheritable(True)
+
+    try:
+        asyncio.run(
+            _serve(
+                server,
+                sock,
+                port,
+                workers,
+                log_level,
+                state_interval,
+                state_max_age,
+            )
+        )
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sock.close()
@@ -0,0 +1,309 @@
+import asyncio
+import inspect
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    cast,
+)
+
+import structlog
+
+from .cache import MISSING
+from .device import DeviceBase, DeviceType, Operation, OperationHandle, StateValue, Work
+from .devices.camera import CameraState
+from .devices.covercalibrator import CalibratorState, CoverState
+from .devices.dome import ShutterState
+from .errors import AlpacaError, DriverError, for_request
+from .request import CommonRequest
+
+logger: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)
+
+_SLEWING = {"get_slewing": True}
+
+# What a device reports while an operation runs, by device type and then by
+# the PUT that started it. Operations started by other PUTs report nothing
+# unless the driver passes ``state``.
+PROGRESS: Dict[DeviceType, Dict[str, Dict[str, Any]]] = {
+    DeviceType.Camera: {
+        "put_pulseguide": {"get_ispulseguiding": True},
+        "put_startexposure": {
+            "get_camerastate": CameraState.Exposing,
+            "get_imageready": False,
+        },
+    },
+    DeviceType.CoverCalibrator: {
+        "put_calibratoron": {"get_calibratorstate": CalibratorState.NotReady},
+        "put_closecover": {"get_coverstate": CoverState.Moving},
+        "put_opencover": {"get_coverstate": CoverState.Moving},
+    },
+    DeviceType.Dome: {
+        "put_closeshutter": {
+            "get_shutterstatus": ShutterState.Closing,
+            "get_slewing": True,
+        },
+        "put_findhome": _SLEWING,
+        "put_openshutter": {
+            "get_shutterstatus": ShutterState.Opening,
+            "get_slewing": True,
+        },
+        "put_park": _SLEWING,
+        "put_slewtoaltitude": _SLEWING,
+        "put_slewtoazimuth": _SLEWING,
+    },
+    DeviceType.FilterWheel: {"put_position": {"get_position": -1}},
+    DeviceType.Focuser: {"put_move": {"get_ismoving": True}},
+    DeviceType.Rotator: {
+        "put_move": {"get_ismoving": True},
+        "put_moveabsolute": {"get_ismoving": True},
+        "put_movemechanical": {"get_ismoving": True},
+    },
+    DeviceType.Telescope: {
+        "put_findhome": _SLEWING,
+        "put_park": _SLEWING,
+        "put_pulseguide": {"get_ispulseguiding": True},
+        "put_slewtoaltazasync": _SLEWING,
+        "put_slewtocoordinatesasync": _SLEWING,
+        "put_slewtotargetasync": _SLEWING,
+    },
+}
+
+
+_SLEWS = frozenset(("put_findhome", "put_park"))
+
+# The operations each PUT cancels, by device type and then by the PUT. Stop
+# commands cancel only the motion they stop, e.g. an abortslew leaves a
+# pulse guide or a moving shutter running.
+CANCELS: Dict[DeviceType, Dict[str, FrozenSet[str]]] = {
+    DeviceType.Camera: {
+        "put_abortexposure": frozenset(("put_startexposure",)),
+        "put_stopexposure": frozenset(("put_startexposure",)),
+    },
+    DeviceType.CoverCalibrator: {
+        "put_calibratoroff": frozenset(("put_calibratoron",)),
+        "put_haltcover": frozenset(("put_closecover", "put_opencover")),
+    },
+    DeviceType.Dome: {
+        "put_abortslew": _SLEWS
+        | frozenset(("put_slewtoaltitude", "put_slewtoazimuth")),
+    },
+    DeviceType.Focuser: {"put_halt": frozenset(("put_move",))},
+    DeviceType.Rotator: {
+        "put_halt": frozenset(("put_move", "put_moveabsolute", "put_movemechanical")),
+    },
+    DeviceType.Telescope: {
+        "put_abortslew": _SLEWS
+        | frozenset(
+            (
+                "put_slewtoaltazasync",
+                "put_slewtocoordinatesasync",
+                "put_slewtotargetasync",
+            )
+        ),
+    },
+}
+
+
+# Runs blocking work for a device, or skips it once it has been cancelled.
+RunBlocking = Callable[[DeviceBase, Callable[[], Any], OperationHandle], Awaitable[Any]]
+
+
+def progress(device_type: DeviceType, name: str) -> Dict[str, Any]:
+    return PROGRESS.get(device_type, {}).get(name, {})
+
+
+class _Operation:
+    __slots__ = ("name", "state", "future", "handle", "blocking")
+
+    def __init__(
+        self,
+        name: str,
+        state: Dict[str, Any],
+        future: asyncio.Future,
+        handle: OperationHandle,
+        blocking: bool,
+    ):
+        self.name = name
+        self.state = state
+        self.future = future
+        self.handle = handle
+        self.blocking = blocking
+
+    def cancel(self) -> None:
+        self.handle.cancelled.set()
+        # A thread cannot be interrupted, so blocking work is left to see the
+        # event and return.
+        if not self.blocking:
+            self.future.cancel()
+
+
+class OperationManager:
+    """Runs the long-running part of PUTs such as moves and slews.
+
+    Drivers hand over the work with ``DeviceBase.start_operation``. While it
+    runs, the progress properties of the device, e.g. ``ismoving``, are
+    answered by the manager, and once it has failed the next read of one of
+    them reports the failure. A new operation started by the same PUT
+    replaces the one already running.
+
+    Blocking work is run by ``run_blocking``, which the dispatcher uses to
+    let the work hold the device through its handle a step at a time.
+    Cancelling an operation sets ``cancelled`` on the handle
+    ``start_operation`` returned, and blocking work is reported as running
+    until it returns.
+    """
+
+    def __init__(self, run_blocking: RunBlocking):
+        self.run_blocking = run_blocking
+        self._running: Dict[int, Dict[str, _Operation]] = {}
+        self._failures: Dict[int, Dict[str, Tuple[BaseException, Dict[str, Any]]]] = {}
+
+    @property
+    def active(self) -> bool:
+        return bool(self._running or self._failures)
+
+    def start(
+        self,
+        device: DeviceBase,
+        name: str,
+        work: Work,
+        state: Optional[Dict[str, Any]] = None,
+        handle: Optional[OperationHandle] = None,
+    ) -> None:
+        if state is None:
+            state = progress(device.device_type, name)
+        if handle is None:
+            handle = OperationHandle()
+
+        running = self._running.setdefault(id(device), {})
+        previous = running.pop(name, None)
+        if previous is not None:
+            previous.cancel()
+
+        failures = self._failures.get(id(device))
+        if failures is not None:
+            failures.pop(name, None)
+            if not failures:
+                del self._failures[id(device)]
+
+        future: asyncio.Future
+        blocking = not inspect.isawaitable(work)
+        if blocking:
+            future = asyncio.ensure_future(
+                self.run_blocking(device, cast(Callable[[], Any], work), handle)
+            )
+        else:
+            future = asyncio.ensure_future(cast(Awaitable[Any], work))
+
+        operation = running[name] = _Operation(name, state, future, handle, blocking)
+        future.add_done_callback(lambda f: self._done(device, operation))
+
+    def _done(self, device: DeviceBase, operation: _Operation) -> None:
+        running = self._running.get(id(device))
+        if running is None or running.get(operation.name) is not operation:
+            # Replaced or cancelled, so whatever it did is no longer reported.
+            return
+
+        del running[operation.name]
+        if not running:
+            del self._running[id(device)]
+
+        future = operation.future
+        error = None if future.cancelled() else future.exception()
+        if error is None or operation.handle.cancelled.is_set():
+            # A driver may well fail the work it was asked to abandon.
+            return
+
+        logger.warning(
+            "operation failed",
+            device=device.unique_id,
+            operation=operation.name,
+            error=error,
+        )
+        failures = self._failures.setdefault(id(device), {})
+        failures[operation.name] = (error, operation.state)
+
+    def status(self, device: DeviceBase, name: str, req: CommonRequest) -> Any:
+        """The value of ``name`` while an operation runs, or ``MISSING``."""
+        failures = self._failures.get(id(device))
+        if failures is not None:
+            for put, (error, state) in list(failures.items()):
+                if name not in state:
+                    continue
+
+                del failures[put]
+                if not failures:
+                    del self._failures[id(device)]
+
+                if not isinstance(error, AlpacaError):
+                    raise DriverError(req, f"{put} failed: {error}") from error
+                raise for_request(error, req)
+
+        for operation in self._running.get(id(device), {}).values():
+            if name in operation.state:
+                return operation.state[name]
+
+        return MISSING
+
+    def device_state(
+        self, device: DeviceBase, state: List[StateValue]
+    ) -> List[StateValue]:
+        running = self._running.get(id(device))
+        if not running:
+            return state
+
+        overrides: Dict[str, Any] = {}
+        for operation in running.values():
+            overrides.update(operation.state)
+
+        return [
+            (
+                StateValue(Name=s.Name, Value=overrides[f"get_{s.Name.lower()}"])
+                if f"get_{s.Name.lower()}" in overrides
+                else s
+            )
+            for s in state
+        ]
+
+    def cancel(self, device: DeviceBase, name: str) -> None:
+        """Cancel the operations of ``device`` that the PUT ``name`` stops."""
+        cancels = CANCELS.get(device.device_type, {}).get(name)
+        if cancels is None:
+            return
+
+        running = self._running.get(id(device))
+        if running is not None:
+            for put in cancels & running.keys():
+                operation = running[put]
+                operation.cancel()
+                if not operation.blocking:
+                    del running[put]
+            if not running:
+                del self._running[id(device)]
+
+        failures = self._failures.get(id(device))
+        if failures is not None:
+            for put in cancels & failures.keys():
+                del failures[put]
+            if not failures:
+                del self._failures[id(device)]
+
+    def discard(self, works: List[Operation]) -> None:
+        # Work handed over by a PUT that then failed is never started.
+        for work, _, _ in works:
+            if inspect.iscoroutine(work):
+                work.close()
+
+    def shutdown(self) -> None:
+        for running in self._running.values():
+            for operation in running.values():
+                operation.cancel()
+                operation.future.cancel()
+
+        self._running.clear()
+        self._failures.clear()
@@ -0,0 +1,271 @@
+import asyncio
+import math
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+
+import structlog
+
+from .cache import MISSING
+from .device import AnyDevice, DeviceBase, StateValue
+from .devices.telescope import AsyncTelescope, Telescope
+from .request import CommonRequest, DriveRate
+
+if TYPE_CHECKING:
+    from .dispatch import DeviceDispatcher
+
+logger: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)
+
+# Sidereal seconds per SI second, and the sidereal rate in arcseconds of
+# right ascension per SI second.
+SIDEREAL_RATIO = 1.00273790935
+SIDEREAL_RATE = 15.0410671787
+
+DRIVE_RATES: Dict[DriveRate, float] = {
+    DriveRate.Sidereal: SIDEREAL_RATE,
+    DriveRate.Lunar: 14.685,
+    DriveRate.Solar: 15.0,
+    DriveRate.King: 15.0369,
+}
+
+# Telescope properties answered from the model.
+POSITION_METHODS = frozenset(
+    (
+        "get_altitude",
+        "get_azimuth",
+        "get_declination",
+        "get_rightascension",
+        "get_siderealtime",
+    )
+)
+
+
+class Rates(NamedTuple):
+    latitude: float
+    drive_rate: float
+    right_ascension_rate: float
+    declination_rate: float
+
+
+class MountSample(NamedTuple):
+    time: float
+    right_ascension: float
+    declination: float
+    altitude: float
+    azimuth: float
+    sidereal_time: float
+    tracking: bool
+    slewing: bool
+    rates: Rates
+
+
+def _altaz(
+    hour_angle: float, declination: float, latitude: float
+) -> Tuple[float, float]:
+    ha = math.radians(hour_angle * 15.0)
+    dec = math.radians(declination)
+    lat = math.radians(latitude)
+
+    altitude = math.asin(
+        math.sin(dec) * math.sin(lat) + math.cos(dec) * math.cos(lat) * math.cos(ha)
+    )
+    azimuth = math.atan2(
+        -math.cos(dec) * math.sin(ha),
+        math.sin(dec) * math.cos(lat) - math.cos(dec) * math.sin(lat) * math.cos(ha),
+    )
+
+    return math.degrees(altitude), math.degrees(azimuth) % 360.0
+
+
+def predict(sample: MountSample, name: str, now: float) -> float:
+    """Extrapolate one position property of ``sample`` to ``now``."""
+    elapsed = now - sample.time
+    sidereal_time = (sample.sidereal_time + elapsed * SIDEREAL_RATIO / 3600.0) % 24.0
+
+    if name == "get_siderealtime":
+        return sidereal_time
+
+    if sample.slewing:
+        # The mount is moving on its own, so only report what it last said.
+        return getattr(sample, _sample_fields[name])
+
+    rates = sample.rates
+    if sample.tracking:
+        # Right ascension drifts by the difference between the drive rate and
+        # the sidereal rate, plus the requested offset rates.
+        drift = (1.0 - rates.drive_rate / SIDEREAL_RATE) * SIDEREAL_RATIO
+        drift += rates.right_ascension_rate * SIDEREAL_RATIO
+        right_ascension = sample.right_ascension + elapsed * drift / 3600.0
+        declination = sample.declination + elapsed * rates.declination_rate / 3600.0
+    else:
+        # A stopped mount keeps its altitude and azimuth while the sky turns.
+        if name == "get_altitude":
+            return sample.altitude
+        if name == "get_azimuth":
+            return sample.azimuth
+
+        right_ascension = sample.right_ascension + elapsed * SIDEREAL_RATIO / 3600.0
+        declination = sample.declination
+
+    if name == "get_rightascension":
+        return right_ascension % 24.0
+    if name == "get_declination":
+        return declination
+
+    # Alt/az moves by the change in the computed position, so the mount's own
+    # corrections, e.g. refraction, carry over from the sample.
+    then = _altaz(
+        sample.sidereal_time - sample.right_ascension,
+        sample.declination,
+        rates.latitude,
+    )
+    current = _altaz(sidereal_time - right_ascension, declination, rates.latitude)
+
+    if name == "get_altitude":
+        return sample.altitude + current[0] - then[0]
+
+    delta = (current[1] - then[1] + 180.0) % 360.0 - 180.0
+    return (sample.azimuth + delta) % 360.0
+
+
+_sample_fields = {
+    "get_altitude": "altitude",
+    "get_azimuth": "azimuth",
+    "get_declination": "declination",
+    "get_rightascension": "right_ascension",
+}
+
+
+class PositionCache:
+    """Answers telescope position GETs from a sampled model of the mount.
+
+    Each telescope's device state is read every ``interval`` seconds and
+    position GETs in between are extrapolated from the latest sample using
+    the tracking state and rates, so clients polling at high rates cost no
+    driver calls. Samples older than ``max_age`` seconds are not used, and
+    any PUT to a telescope drops its sample until the next one is taken.
+    """
+
+    def __init__(self, interval: float = 1.0, max_age: Optional[float] = None):
+        self.interval = interval
+        self.max_age = max_age if max_age is not None else 3 * interval
+
+        self._samples: Dict[int, MountSample] = {}
+        self._rates: Dict[int, Rates] = {}
+        self._generations: Dict[int, int] = {}
+        self._wake: Optional[asyncio.Event] = None
+
+    def get(self, device: DeviceBase, name: str) -> Any:
+        sample = self._samples.get(id(device))
+        if sample is None:
+            return MISSING
+
+        now = time.monotonic()
+        if now - sample.time > self.max_age:
+            return MISSING
+
+        return predict(sample, name, now)
+
+    def invalidate(self, device: DeviceBase) -> None:
+        self._samples.pop(id(device), None)
+        self._rates.pop(id(device), None)
+        self._generations[id(device)] = self._generations.get(id(device), 0) + 1
+
+        if self._wake is not None:
+            self._wake.set()
+
+    async def _read_rates(
+        self, device: Union[Telescope, AsyncTelescope], dispatcher: "DeviceDispatcher"
+    ) -> Rates:
+        req = CommonRequest()
+
+        async def read(method: Any, default: float) -> float:
+            try:
+                return float(await dispatcher.call(method, req))
+            except Exception:
+                return default
+
+        drive_rate = DriveRate.Sidereal
+        try:
+            drive_rate = DriveRate(await dispatcher.call(device.get_trackingrate, req))
+        except Exception:
+            pass
+
+        return Rates(
+            latitude=await read(device.get_sitelatitude, 0.0),
+            drive_rate=DRIVE_RATES[drive_rate],
+            right_ascension_rate=await read(device.get_rightascensionrate, 0.0),
+            declination_rate=await read(device.get_declinationrate, 0.0),
+        )
+
+    async def sample(
+        self, device: Union[Telescope, AsyncTelescope], dispatcher: "DeviceDispatcher"
+    ) -> None:
+        # A PUT while sampling may change what was read, so the result is
+        # only kept if none arrived.
+        generation = self._generations.get(id(device), 0)
+
+        # Rates only change through PUTs, which drop them, so they are read
+        # once rather than with every sample.
+        rates = self._rates.get(id(device))
+        if rates is None:
+            rates = await self._read_rates(device, dispatcher)
+
+        start = time.monotonic()
+        try:
+            state = cast(
+                List[StateValue],
+                await dispatcher.call(device.get_devicestate, CommonRequest()),
+            )
+        except Exception as e:
+            logger.debug("failed to sample mount", device=device.unique_id, error=e)
+            self._samples.pop(id(device), None)
+            return
+
+        values = {s.Name: s.Value for s in state}
+        try:
+            sample = MountSample(
+                # The state was read somewhere between start and now.
+                time=(start + time.monotonic()) / 2,
+                right_ascension=float(values["RightAscension"]),
+                declination=float(values["Declination"]),
+                altitude=float(values["Altitude"]),
+                azimuth=float(values["Azimuth"]),
+                sidereal_time=float(values["SiderealTime"]),
+                tracking=bool(values["Tracking"]),
+                slewing=bool(values["Slewing"]),
+                rates=rates,
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            logger.debug("incomplete mount state", device=device.unique_id, error=e)
+            self._samples.pop(id(device), None)
+            return
+
+        if self._generations.get(id(device), 0) == generation:
+            self._rates[id(device)] = rates
+            self._samples[id(device)] = sample
+
+    async def run(
+        self, devices: Sequence[AnyDevice], dispatcher: "DeviceDispatcher"
+    ) -> None:
+        telescopes = [d for d in devices if isinstance(d, (Telescope, AsyncTelescope))]
+        self._wake = asyncio.Event()
+
+        while True:
+            self._wake.clear()
+            await asyncio.gather(*(self.sample(d, dispatcher) for d in telescopes))
+
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
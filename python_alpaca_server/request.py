@@ -1,5 +1,10 @@
-import threading
-from typing import Any
+import itertools
+import os
+import sys
+import tempfile
+from enum import Enum
+from functools import lru_cache
+from typing import IO, Any, Dict, List, NamedTuple, Optional, Type
 
 import structlog
 from fastapi import HTTPException
@@ -7,17 +12,100 @@ from pydantic import BaseModel, Field, field_validator, model_validator
 
 logger: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)
 
-counter_lock = threading.Lock()
-counter = 0
+# next() on an itertools.count is a single C call, so it is atomic under the GIL
+# and needs no lock even when driver threads and the event loop race for IDs.
+_server_transaction_ids = itertools.count(1)
+_worker_slot_files: List[IO[bytes]] = []
+
+# ServerTransactionIDs are uint32 in the Alpaca API. Their top bits hold the
+# generation of the slot that handed them out, so a process that takes over
+# a slot does not repeat the IDs of the one before it.
+_GENERATION_BITS = 4
+_GENERATION_SHIFT = 32 - _GENERATION_BITS
 
 
 def _server_transaction_id() -> int:
-    global counter
+    return next(_server_transaction_ids)
+
+
+def configure_server_transaction_ids(
+    slot: int, slots: int, generation: int = 0
+) -> None:
+    """Hand out only the IDs congruent to ``slot + 1`` modulo ``slots``.
+
+    Processes serving the same Alpaca server each take a different slot, which
+    keeps their ServerTransactionIDs unique without any shared state. A process
+    that takes a slot over from one that exited passes a higher
+    ``generation``, which starts its IDs in a range of their own.
+    """
+    global _server_transaction_ids
+
+    if not 0 <= slot < slots:
+        raise ValueError(f"slot must be between 0 and {slots - 1}")
+
+    start = (generation % (1 << _GENERATION_BITS)) << _GENERATION_SHIFT
+    _server_transaction_ids = itertools.count(start + slot + 1, slots)
+
+
+def _try_lock(f: IO[bytes]) -> bool:
+    try:
+        if sys.platform == "win32":
+            import msvcrt
+
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+
+    return True
+
+
+class WorkerSlot(NamedTuple):
+    slot: int
+    generation: int
+
+
+def _next_generation(f: IO[bytes]) -> int:
+    # The lock file holds the generation of the slot's last holder.
+    f.seek(0)
+    try:
+        generation = int(f.read() or b"-1") + 1
+    except ValueError:
+        generation = 0
+
+    f.truncate(0)
+    f.write(b"%d" % generation)
+    f.flush()
+
+    return generation
+
+
+def claim_worker_slot(
+    slots: int, name: str = "python-alpaca-server", lock_dir: Optional[str] = None
+) -> WorkerSlot:
+    """Claim the lowest slot in ``range(slots)`` not held by another process.
+
+    Slots are held with an OS file lock for the lifetime of the process, so a
+    worker that exits frees its slot for the worker that replaces it. Each
+    claim of a slot gets the next generation. Servers sharing ``lock_dir``
+    need different ``name``s.
+    """
+    lock_dir = lock_dir or tempfile.gettempdir()
+
+    for slot in range(slots):
+        path = os.path.join(lock_dir, f"{name}-worker-{slot}.lock")
+        f = open(path, "a+b")
+
+        if _try_lock(f):
+            _worker_slot_files.append(f)
+            return WorkerSlot(slot, _next_generation(f))
 
-    with counter_lock:
-        counter += 1
+        f.close()
 
-    return counter
+    raise RuntimeError(f"all {slots} worker slots are in use")
 
 
 def _lenient_int_validator(value: Any) -> int:
@@ -68,6 +156,11 @@ def _strict_float_validator(value) -> float:
     raise HTTPException(status_code=400, detail="invalid float value")
 
 
+@lru_cache(maxsize=None)
+def _field_names_by_lower(cls: Type[BaseModel]) -> Dict[str, str]:
+    return {field.lower(): field for field in cls.model_fields}
+
+
 class CommonRequest(BaseModel):
     ClientTransactionID: int = 0
     ClientID: int = 0
@@ -75,15 +168,15 @@ class CommonRequest(BaseModel):
 
     @model_validator(mode="before")
     @classmethod
-    def body_params_case_insensitive(cls, values: dict):
-        for field in cls.model_fields:
-            in_fields = list(
-                filter(lambda f: f.lower() == field.lower(), values.keys())
-            )
-            for in_field in in_fields:
-                values[field] = values.pop(in_field)
+    def body_params_case_insensitive(cls, values: Any):
+        if not isinstance(values, dict):
+            return values
+
+        field_names = _field_names_by_lower(cls)
 
-        return values
+        return {
+            field_names.get(key.lower(), key): value for key, value in values.items()
+        }
 
     _check_ids = field_validator("ClientTransactionID", "ClientID", mode="before")(
         _lenient_int_validator
@@ -201,3 +294,287 @@ class PutIdStateRequest(CommonRequest):
 
     _check_id = field_validator("Id", mode="before")(_strict_int_validator)
     _check_state = field_validator("State", mode="before")(_strict_bool_validator)
+
+
+class GuideDirection(int, Enum):
+    North = 0
+    South = 1
+    East = 2
+    West = 3
+
+
+class PierSide(int, Enum):
+    Unknown = -1
+    East = 0
+    West = 1
+
+
+class DriveRate(int, Enum):
+    Sidereal = 0
+    Lunar = 1
+    Solar = 2
+    King = 3
+
+
+class TelescopeAxis(int, Enum):
+    Primary = 0
+    Secondary = 1
+    Tertiary = 2
+
+
+class PutBinXRequest(CommonRequest):
+    BinX: int
+
+    _check_binx = field_validator("BinX", mode="before")(_strict_int_validator)
+
+
+class PutBinYRequest(CommonRequest):
+    BinY: int
+
+    _check_biny = field_validator("BinY", mode="before")(_strict_int_validator)
+
+
+class PutCoolerOnRequest(CommonRequest):
+    CoolerOn: bool
+
+    _check_cooler_on = field_validator("CoolerOn", mode="before")(
+        _strict_bool_validator
+    )
+
+
+class PutFastReadoutRequest(CommonRequest):
+    FastReadout: bool
+
+    _check_fast_readout = field_validator("FastReadout", mode="before")(
+        _strict_bool_validator
+    )
+
+
+class PutGainRequest(CommonRequest):
+    Gain: int
+
+    _check_gain = field_validator("Gain", mode="before")(_strict_int_validator)
+
+
+class PutNumXRequest(CommonRequest):
+    NumX: int
+
+    _check_numx = field_validator("NumX", mode="before")(_strict_int_validator)
+
+
+class PutNumYRequest(CommonRequest):
+    NumY: int
+
+    _check_numy = field_validator("NumY", mode="before")(_strict_int_validator)
+
+
+class PutOffsetRequest(CommonRequest):
+    Offset: int
+
+    _check_offset = field_validator("Offset", mode="before")(_strict_int_validator)
+
+
+class PutReadoutModeRequest(CommonRequest):
+    ReadoutMode: int
+
+    _check_readout_mode = field_validator("ReadoutMode", mode="before")(
+        _strict_int_validator
+    )
+
+
+class PutSetCCDTemperatureRequest(CommonRequest):
+    SetCCDTemperature: float
+
+    _check_set_ccd_temperature = field_validator("SetCCDTemperature", mode="before")(
+        _strict_float_validator
+    )
+
+
+class PutStartXRequest(CommonRequest):
+    StartX: int
+
+    _check_startx = field_validator("StartX", mode="before")(_strict_int_validator)
+
+
+class PutStartYRequest(CommonRequest):
+    StartY: int
+
+    _check_starty = field_validator("StartY", mode="before")(_strict_int_validator)
+
+
+class PutSubExposureDurationRequest(CommonRequest):
+    SubExposureDuration: float
+
+    _check_sub_exposure_duration = field_validator(
+        "SubExposureDuration", mode="before"
+    )(_strict_float_validator)
+
+
+class PutPulseGuideRequest(CommonRequest):
+    Direction: GuideDirection
+    Duration: int
+
+    _check_direction = field_validator("Direction", mode="before")(
+        _strict_int_validator
+    )
+    _check_duration = field_validator("Duration", mode="before")(_strict_int_validator)
+
+
+class StartExposureRequest(CommonRequest):
+    Duration: float
+    Light: bool
+
+    _check_duration = field_validator("Duration", mode="before")(
+        _strict_float_validator
+    )
+    _check_light = field_validator("Light", mode="before")(_strict_bool_validator)
+
+
+class PutDeclinationRateRequest(CommonRequest):
+    DeclinationRate: float
+
+    _check_declination_rate = field_validator("DeclinationRate", mode="before")(
+        _strict_float_validator
+    )
+
+
+class PutDoesRefractionRequest(CommonRequest):
+    DoesRefraction: bool
+
+    _check_does_refraction = field_validator("DoesRefraction", mode="before")(
+        _strict_bool_validator
+    )
+
+
+class PutGuideRateDeclinationRequest(CommonRequest):
+    GuideRateDeclination: float
+
+    _check_guide_rate_declination = field_validator(
+        "GuideRateDeclination", mode="before"
+    )(_strict_float_validator)
+
+
+class PutGuideRateRightAscensionRequest(CommonRequest):
+    GuideRateRightAscension: float
+
+    _check_guide_rate_right_ascension = field_validator(
+        "GuideRateRightAscension", mode="before"
+    )(_strict_float_validator)
+
+
+class PutRightAscensionRateRequest(CommonRequest):
+    RightAscensionRate: float
+
+    _check_right_ascension_rate = field_validator("RightAscensionRate", mode="before")(
+        _strict_float_validator
+    )
+
+
+class PutSiteElevationRequest(CommonRequest):
+    SiteElevation: float
+
+    _check_site_elevation = field_validator("SiteElevation", mode="before")(
+        _strict_float_validator
+    )
+
+
+class PutSiteLatitudeRequest(CommonRequest):
+    SiteLatitude: float
+
+    _check_site_latitude = field_validator("SiteLatitude", mode="before")(
+        _strict_float_validator
+    )
+
+
+class PutSiteLongitudeRequest(CommonRequest):
+    SiteLongitude: float
+
+    _check_site_longitude = field_validator("SiteLongitude", mode="before")(
+        _strict_float_validator
+    )
+
+
+class PutSlewSettleTimeRequest(CommonRequest):
+    SlewSettleTime: int
+
+    _check_slew_settle_time = field_validator("SlewSettleTime", mode="before")(
+        _strict_int_validator
+    )
+
+
+class PutTargetDeclinationRequest(CommonRequest):
+    TargetDeclination: float
+
+    _check_target_declination = field_validator("TargetDeclination", mode="before")(
+        _strict_float_validator
+    )
+
+
+class PutTargetRightAscensionRequest(CommonRequest):
+    TargetRightAscension: float
+
+    _check_target_right_ascension = field_validator(
+        "TargetRightAscension", mode="before"
+    )(_strict_float_validator)
+
+
+class PutTrackingRequest(CommonRequest):
+    Tracking: bool
+
+    _check_tracking = field_validator("Tracking", mode="before")(_strict_bool_validator)
+
+
+class PutSideOfPierRequest(CommonRequest):
+    SideOfPier: PierSide
+
+    _check_side_of_pier = field_validator("SideOfPier", mode="before")(
+        _strict_int_validator
+    )
+
+
+class PutTrackingRateRequest(CommonRequest):
+    TrackingRate: DriveRate
+
+    _check_tracking_rate = field_validator("TrackingRate", mode="before")(
+        _strict_int_validator
+    )
+
+
+class PutUTCDateRequest(CommonRequest):
+    UTCDate: str
+
+
+class AxisRequest(CommonRequest):
+    Axis: TelescopeAxis
+
+    _check_axis = field_validator("Axis", mode="before")(_strict_int_validator)
+
+
+class PutMoveAxisRequest(CommonRequest):
+    Axis: TelescopeAxis
+    Rate: float
+
+    _check_axis = field_validator("Axis", mode="before")(_strict_int_validator)
+    _check_rate = field_validator("Rate", mode="before")(_strict_float_validator)
+
+
+class AltAzRequest(CommonRequest):
+    Azimuth: float
+    Altitude: float
+
+    _check_azimuth = field_validator("Azimuth", mode="before")(_strict_float_validator)
+    _check_altitude = field_validator("Altitude", mode="before")(
+        _strict_float_validator
+    )
+
+
+class CoordinatesRequest(CommonRequest):
+    RightAscension: float
+    Declination: float
+
+    _check_right_ascension = field_validator("RightAscension", mode="before")(
+        _strict_float_validator
+    )
+    _check_declination = field_validator("Declination", mode="before")(
+        _strict_float_validator
+    )
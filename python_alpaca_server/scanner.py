@@ -0,0 +1,196 @@
+import asyncio
+import json
+import socket
+import struct
+import sys
+from typing import Callable, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+import httpx
+import structlog
+
+from .api.management import ConfiguredDevice
+from .discovery import DISCOVERY_PORT, IPV6_DISCOVERY_GROUP
+from .response import Response
+
+logger: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)
+
+# Linux ioctls used to find each interface's broadcast address.
+_SIOCGIFFLAGS = 0x8913
+_SIOCGIFBRDADDR = 0x8919
+_IFF_BROADCAST = 0x2
+
+
+class Host(NamedTuple):
+    address: str
+    port: int
+
+    @property
+    def url(self) -> str:
+        address = self.address
+        if ":" in address:
+            # Link-local addresses carry a zone, e.g. fe80::1%eth0.
+            address = "[" + address.replace("%", "%25") + "]"
+
+        return f"http://{address}:{self.port}"
+
+
+class HostInventory(NamedTuple):
+    host: Host
+    devices: List[ConfiguredDevice]
+    error: Optional[str] = None
+
+
+def ipv4_broadcast_addresses() -> List[str]:
+    """The limited broadcast address plus every interface's own broadcast
+    address, where the platform lets us look them up."""
+    addresses = ["255.255.255.255"]
+
+    if not sys.platform.startswith("linux"):
+        return addresses
+
+    import fcntl
+
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        for _, name in socket.if_nameindex():
+            ifreq = struct.pack("256s", name.encode()[:15])
+            try:
+                flags = struct.unpack_from(
+                    "H", fcntl.ioctl(sock, _SIOCGIFFLAGS, ifreq), 16
+                )[0]
+                if flags & _IFF_BROADCAST:
+                    result = fcntl.ioctl(sock, _SIOCGIFBRDADDR, ifreq)
+                    addresses.append(socket.inet_ntoa(result[20:24]))
+            except OSError:
+                continue
+
+    return list(dict.fromkeys(addresses))
+
+
+class _ResponseCollector(asyncio.DatagramProtocol):
+    def __init__(self, on_host: Callable[[Host], None]):
+        self.on_host = on_host
+
+    def datagram_received(self, data: bytes, addr: Tuple):
+        try:
+            port = int(json.loads(data)["AlpacaPort"])
+        except (ValueError, KeyError, TypeError):
+            logger.debug("ignoring discovery response", data=data, addr=addr)
+            return
+
+        self.on_host(Host(addr[0], port))
+
+    def error_received(self, exc: Exception):
+        logger.debug("discovery socket error", error=exc)
+
+
+async def _discover(
+    on_host: Callable[[Host], None],
+    timeout: float,
+    addresses: Optional[Sequence[str]],
+    ipv6: bool,
+    port: int,
+) -> None:
+    loop = asyncio.get_running_loop()
+    seen: Set[Host] = set()
+    transports = []
+
+    def on_response(host: Host) -> None:
+        # Hosts answer once per interface the request reached them on.
+        if host not in seen:
+            seen.add(host)
+            on_host(host)
+
+    try:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        sock.bind(("0.0.0.0", 0))
+        transport, _ = await loop.create_datagram_endpoint(
+            lambda: _ResponseCollector(on_response), sock=sock
+        )
+        transports.append(transport)
+
+        for address in addresses or ipv4_broadcast_addresses():
+            transport.sendto(b"alpacadiscovery1", (address, port))
+
+        if ipv6 and socket.has_ipv6:
+            try:
+                sock6 = socket.socket(socket.AF_INET6, socket.SOCK_DGRAM)
+                sock6.bind(("::", 0))
+            except OSError as e:
+                logger.debug("IPv6 discovery unavailable", error=e)
+            else:
+                transport6, _ = await loop.create_datagram_endpoint(
+                    lambda: _ResponseCollector(on_response), sock=sock6
+                )
+                transports.append(transport6)
+
+                for index, _ in socket.if_nameindex():
+                    # The interface is chosen by the scope id of the group.
+                    transport6.sendto(
+                        b"alpacadiscovery1", (IPV6_DISCOVERY_GROUP, port, 0, index)
+                    )
+
+        await asyncio.sleep(timeout)
+    finally:
+        for t in transports:
+            t.close()
+
+
+async def discover(
+    timeout: float = 0.5,
+    addresses: Optional[Sequence[str]] = None,
+    ipv6: bool = True,
+    port: int = DISCOVERY_PORT,
+) -> List[Host]:
+    """Send discovery requests and collect the answers for ``timeout`` seconds.
+
+    By default requests are broadcast on every IPv4 interface and sent to the
+    IPv6 discovery group on every interface. ``addresses`` replaces the IPv4
+    broadcast addresses, e.g. with unicast addresses of known hosts.
+    """
+    hosts: List[Host] = []
+    await _discover(hosts.append, timeout, addresses, ipv6, port)
+
+    return sorted(hosts)
+
+
+async def _inventory(client: httpx.AsyncClient, host: Host) -> HostInventory:
+    try:
+        response = await client.get(f"{host.url}/management/v1/configureddevices")
+        response.raise_for_status()
+
+        devices = (
+            Response[List[ConfiguredDevice]].model_validate_json(response.content).Value
+        )
+    except (httpx.HTTPError, ValueError) as e:
+        return HostInventory(host, [], f"{type(e).__name__}: {e}")
+
+    return HostInventory(host, devices or [])
+
+
+async def scan(
+    timeout: float = 0.5,
+    http_timeout: float = 2.0,
+    max_connections: int = 64,
+    addresses: Optional[Sequence[str]] = None,
+    ipv6: bool = True,
+    port: int = DISCOVERY_PORT,
+) -> List[HostInventory]:
+    """Discover Alpaca hosts and list the devices each one serves.
+
+    Each host is queried as soon as its discovery response arrives, through
+    one pooled HTTP client, so the scan takes little longer than ``timeout``.
+    Hosts that fail to answer are returned with ``error`` set.
+    """
+    async with httpx.AsyncClient(
+        timeout=http_timeout,
+        limits=httpx.Limits(max_connections=max_connections),
+    ) as client:
+        queries: List[asyncio.Future] = []
+
+        def on_host(host: Host) -> None:
+            queries.append(asyncio.ensure_future(_inventory(client, host)))
+
+        await _discover(on_host, timeout, addresses, ipv6, port)
+
+        return sorted(await asyncio.gather(*queries), key=lambda i: i.host)
@@ -0,0 +1,73 @@
+import asyncio
+import heapq
+import itertools
+from enum import IntEnum
+from typing import Dict, Hashable, List, Tuple
+
+
+class Priority(IntEnum):
+    STOP = 0
+    WRITE = 1
+    READ = 2
+
+
+# The device methods that stop motion or an exposure. Every other put_ method
+# of the device classes is a write and every get_ method a read.
+STOP_METHODS = frozenset(
+    (
+        "put_abortexposure",
+        "put_abortslew",
+        "put_halt",
+        "put_haltcover",
+        "put_stopexposure",
+    )
+)
+
+
+def classify(name: str) -> Priority:
+    if name in STOP_METHODS:
+        return Priority.STOP
+    if name.startswith("get_"):
+        return Priority.READ
+
+    return Priority.WRITE
+
+
+class CommandQueue:
+    """Gives one call at a time a device, by priority rather than arrival.
+
+    Waiting stops go first, then writes, then reads, each in the order they
+    arrived. ``reads`` holds the waiting reads by method and arguments, so
+    the dispatcher can share them.
+    """
+
+    def __init__(self) -> None:
+        self.busy = False
+        self.reads: Dict[Tuple[Hashable, ...], asyncio.Future] = {}
+        self._waiting: List[Tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+
+    async def acquire(self, priority: Priority) -> None:
+        if not self.busy:
+            self.busy = True
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiting, (priority, next(self._sequence), future))
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Cancelled after being handed the device, so pass it on.
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        while self._waiting:
+            future = heapq.heappop(self._waiting)[2]
+            if not future.done():
+                future.set_result(None)
+                return
+
+        self.busy = False
@@ -0,0 +1,102 @@
+"""Simulated drivers generated from the device base classes."""
+
+import array
+from enum import Enum
+from typing import Any, Callable, Dict, List, Type, TypeVar, get_type_hints
+
+from pydantic import BaseModel
+
+from .device import Device
+from .devices.camera import Camera
+from .devices.covercalibrator import CoverCalibrator
+from .devices.dome import Dome
+from .devices.filterwheel import FilterWheel
+from .devices.focuser import Focuser
+from .devices.observingconditions import ObservingConditions
+from .devices.rotator import Rotator
+from .devices.safetymonitor import SafetyMonitor
+from .devices.switch import Switch
+from .devices.telescope import Telescope
+from .request import CommonRequest
+
+D = TypeVar("D", bound=Device)
+
+# Typed loosely since mypy reads Type[Device] as a concrete class whose
+# constructor takes a device type, while each of these takes only an ID.
+DEVICE_CLASSES: List[Type[Any]] = [
+    Camera,
+    CoverCalibrator,
+    Dome,
+    FilterWheel,
+    Focuser,
+    ObservingConditions,
+    Rotator,
+    SafetyMonitor,
+    Switch,
+    Telescope,
+]
+
+# A 3 x 2 image of 16-bit pixels, shaped as the Alpaca API indexes it.
+IMAGE = memoryview(array.array("H", range(6))).cast("B").cast("H", (3, 2))
+
+# Values for the methods whose return type does not say what they return.
+_METHOD_VALUES: Dict[str, Any] = {
+    "get_imagearray": IMAGE,
+    "get_imagearrayvariant": IMAGE,
+}
+
+
+def _default_value(value_type: Any) -> Any:
+    if value_type is bool:
+        return True
+    if value_type is int:
+        return 1
+    if value_type is float:
+        return 1.5
+    if value_type is str:
+        return "simulated"
+    if isinstance(value_type, type) and issubclass(value_type, Enum):
+        return next(iter(value_type))
+    if getattr(value_type, "__origin__", None) is list:
+        return [_default_value(value_type.__args__[0])]
+    if isinstance(value_type, type) and issubclass(value_type, BaseModel):
+        return value_type(
+            **{
+                name: _default_value(field.annotation)
+                for name, field in value_type.model_fields.items()
+            }
+        )
+
+    return None
+
+
+def _simulated_method(name: str, value: Any) -> Callable[[Any, CommonRequest], Any]:
+    def method(self, req: CommonRequest) -> Any:
+        return value
+
+    method.__name__ = name
+    return method
+
+
+def simulated_class(device_class: Type[D]) -> Type[D]:
+    """Subclass ``device_class`` with every abstract method returning a constant."""
+    namespace: Dict[str, Any] = {}
+
+    for name in device_class.__abstractmethods__:
+        if name in _METHOD_VALUES:
+            value = _METHOD_VALUES[name]
+        else:
+            value = _default_value(
+                get_type_hints(getattr(device_class, name))["return"]
+            )
+        namespace[name] = _simulated_method(name, value)
+
+    return type(f"Simulated{device_class.__name__}", (device_class,), namespace)
+
+
+def simulated_devices(per_type: int = 1) -> List[Device]:
+    return [
+        simulated_class(device_class)(f"sim-{device_class.__name__.lower()}-{i}")
+        for device_class in DEVICE_CLASSES
+        for i in range(per_type)
+    ]
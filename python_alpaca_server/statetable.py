@@ -0,0 +1,188 @@
+import asyncio
+import struct
+import time
+from enum import Enum
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Sequence, Set, Tuple, cast, get_type_hints
+
+import structlog
+
+from .api.method_table import device_base_class
+from .cache import MISSING
+from .device import AnyDevice, StateValue
+from .dispatch import DeviceDispatcher
+from .request import CommonRequest
+
+logger: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)
+
+# (device index, get_ method name) -> (record offset, value type)
+Layout = Dict[Tuple[int, str], Tuple[int, type]]
+
+# Each record is a sequence number, a wall clock timestamp, the value and a
+# valid flag. The sequence number is odd while the owner is writing.
+_seq = struct.Struct("<Q")
+_int_record = struct.Struct("<QdqQ")
+_float_record = struct.Struct("<QddQ")
+RECORD_SIZE = 32
+
+_read_attempts = 16
+
+
+def _is_scalar(value_type: Any) -> bool:
+    return value_type in (bool, int, float) or (
+        isinstance(value_type, type) and issubclass(value_type, Enum)
+    )
+
+
+def table_layout(devices: Sequence[AnyDevice]) -> Layout:
+    """Give every scalar devicestate property of every device a record.
+
+    The properties and their types come from the device type's base class, so
+    every device of a type has the same layout.
+    """
+    layout: Layout = {}
+
+    for index, device in enumerate(devices):
+        device_class = device_base_class(device.device_type)
+
+        for name in device_class.device_state_properties:
+            method_name = f"get_{name.lower()}"
+            value_type = get_type_hints(getattr(device_class, method_name))["return"]
+
+            if _is_scalar(value_type):
+                layout[(index, method_name)] = (len(layout) * RECORD_SIZE, value_type)
+
+    return layout
+
+
+class StateTable:
+    """Device properties in shared memory, written by one process.
+
+    Records use a seqlock, so readers in other processes never block the
+    writer and retry if a record changes while they read it.
+    """
+
+    def __init__(self, memory: shared_memory.SharedMemory, layout: Layout):
+        self.memory = memory
+        self.layout = layout
+        self._buf = memory.buf
+
+    @classmethod
+    def create(cls, layout: Layout) -> "StateTable":
+        memory = shared_memory.SharedMemory(
+            create=True, size=max(len(layout), 1) * RECORD_SIZE
+        )
+        memory.buf[: memory.size] = bytes(memory.size)
+
+        return cls(memory, layout)
+
+    @classmethod
+    def attach(cls, name: str, layout: Layout) -> "StateTable":
+        # Workers are spawned by the owner and share its resource tracker, so
+        # attaching does not register the segment a second time.
+        return cls(shared_memory.SharedMemory(name=name), layout)
+
+    @property
+    def name(self) -> str:
+        return self.memory.name
+
+    def _record(self, value_type: type) -> struct.Struct:
+        return _float_record if value_type is float else _int_record
+
+    def write(self, key: Tuple[int, str], value: Any) -> None:
+        offset, value_type = self.layout[key]
+        record = self._record(value_type)
+        converted = float(value) if value_type is float else int(value)
+
+        (seq,) = _seq.unpack_from(self._buf, offset)
+        _seq.pack_into(self._buf, offset, seq + 1)
+        record.pack_into(self._buf, offset, seq + 1, time.time(), converted, 1)
+        _seq.pack_into(self._buf, offset, seq + 2)
+
+    def invalidate(self, key: Tuple[int, str]) -> None:
+        offset, value_type = self.layout[key]
+        record = self._record(value_type)
+
+        (seq,) = _seq.unpack_from(self._buf, offset)
+        _seq.pack_into(self._buf, offset, seq + 1)
+        record.pack_into(self._buf, offset, seq + 1, time.time(), 0, 0)
+        _seq.pack_into(self._buf, offset, seq + 2)
+
+    def read(self, key: Tuple[int, str], max_age: float) -> Any:
+        """Return the value, or ``MISSING`` if it is invalid or older than
+        ``max_age`` seconds."""
+        offset, value_type = self.layout[key]
+        record = self._record(value_type)
+
+        for _ in range(_read_attempts):
+            seq, timestamp, value, valid = record.unpack_from(self._buf, offset)
+            if seq & 1:
+                continue
+
+            if _seq.unpack_from(self._buf, offset)[0] != seq:
+                continue
+
+            if not valid or time.time() - timestamp > max_age:
+                return MISSING
+
+            return value_type(value)
+
+        return MISSING
+
+    def close(self) -> None:
+        del self._buf
+        self.memory.close()
+
+    def unlink(self) -> None:
+        self.memory.unlink()
+
+
+class StatePublisher:
+    """Polls each device's state and writes it into a ``StateTable``."""
+
+    def __init__(
+        self,
+        table: StateTable,
+        devices: Sequence[AnyDevice],
+        dispatcher: DeviceDispatcher,
+    ):
+        self.table = table
+        self.devices = devices
+        self.dispatcher = dispatcher
+
+        self._keys: Dict[int, List[Tuple[str, Tuple[int, str]]]] = {}
+        for index, name in table.layout:
+            self._keys.setdefault(index, []).append((name[4:], (index, name)))
+
+        self._pending: Set[asyncio.Future] = set()
+
+    async def publish(self, index: int) -> None:
+        device = self.devices[index]
+
+        try:
+            state = cast(
+                List[StateValue],
+                await self.dispatcher.call(device.get_devicestate, CommonRequest()),
+            )
+        except Exception as e:
+            logger.debug("failed to read device state", device=index, error=e)
+            values: Dict[str, Any] = {}
+        else:
+            values = {s.Name.lower(): s.Value for s in state}
+
+        for name, key in self._keys[index]:
+            if name in values:
+                self.table.write(key, values[name])
+            else:
+                self.table.invalidate(key)
+
+    def publish_soon(self, index: int) -> None:
+        if index in self._keys:
+            future = asyncio.ensure_future(self.publish(index))
+            self._pending.add(future)
+            future.add_done_callback(self._pending.discard)
+
+    async def run(self, interval: float) -> None:
+        while True:
+            await asyncio.gather(*(self.publish(index) for index in self._keys))
+            await asyncio.sleep(interval)
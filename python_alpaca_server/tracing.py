@@ -0,0 +1,241 @@
+import json
+import queue
+import random
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, List, Optional, Protocol, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# The trace of the request being served, or None when tracing is off. Code on
+# the request path checks it before taking any timestamps.
+current_trace: ContextVar[Optional["Trace"]] = ContextVar("current_trace", default=None)
+
+now = time.perf_counter_ns
+
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+
+# name, start, end, attributes
+Span = Tuple[str, int, int, Optional[Dict[str, Any]]]
+
+
+class Trace:
+    """The spans of one request, with times from ``now``."""
+
+    __slots__ = ("epoch", "start", "end", "spans", "attributes", "name")
+
+    def __init__(self) -> None:
+        self.epoch = time.time_ns()
+        self.start = now()
+        self.end = 0
+        self.spans: List[Span] = []
+        self.attributes: Dict[str, Any] = {}
+        self.name = ""
+
+    def add(self, name: str, start: int, **attributes: Any) -> None:
+        """Record a span from ``start`` until now."""
+        self.spans.append((name, start, now(), attributes or None))
+
+    def unix_nano(self, t: int) -> int:
+        return self.epoch + t - self.start
+
+    def derived_spans(self) -> List[Span]:
+        """The recorded spans plus the ones measured between them.
+
+        ``routing`` runs from the start of the request to the first span, and
+        ``validate request`` from the end of the device lookup to the next
+        span, which covers parsing and validating the request model.
+        """
+        spans = sorted(self.spans, key=lambda s: s[1])
+        if not spans:
+            return spans
+
+        derived: List[Span] = [("routing", self.start, spans[0][1], None)]
+        if not any(s[0] == "validate request" for s in spans):
+            for span, following in zip(spans, spans[1:]):
+                if span[0] == "device lookup":
+                    derived.append(("validate request", span[2], following[1], None))
+
+        return sorted(spans + derived, key=lambda s: s[1])
+
+
+class Exporter(Protocol):
+    def export(self, trace: Trace) -> None: ...
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    if not attributes:
+        return []
+
+    return [{"key": k, "value": _otlp_value(v)} for k, v in attributes.items()]
+
+
+def otlp(trace: Trace, service_name: str) -> Dict[str, Any]:
+    """Convert ``trace`` to an OTLP/JSON ``ExportTraceServiceRequest``."""
+    trace_id = "%032x" % random.getrandbits(128)
+    root_id = "%016x" % random.getrandbits(64)
+
+    spans = [
+        {
+            "traceId": trace_id,
+            "spanId": root_id,
+            "name": trace.name,
+            "kind": SPAN_KIND_SERVER,
+            "startTimeUnixNano": str(trace.unix_nano(trace.start)),
+            "endTimeUnixNano": str(trace.unix_nano(trace.end)),
+            "attributes": _otlp_attributes(trace.attributes),
+        }
+    ]
+    for name, start, end, attributes in trace.derived_spans():
+        spans.append(
+            {
+                "traceId": trace_id,
+                "spanId": "%016x" % random.getrandbits(64),
+                "parentSpanId": root_id,
+                "name": name,
+                "kind": SPAN_KIND_INTERNAL,
+                "startTimeUnixNano": str(trace.unix_nano(start)),
+                "endTimeUnixNano": str(trace.unix_nano(end)),
+                "attributes": _otlp_attributes(attributes),
+            }
+        )
+
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": _otlp_attributes({"service.name": service_name})
+                },
+                "scopeSpans": [
+                    {"scope": {"name": "python_alpaca_server"}, "spans": spans}
+                ],
+            }
+        ]
+    }
+
+
+class MemoryCollector:
+    """Keeps the latest ``max_traces`` traces as OTLP/JSON objects."""
+
+    def __init__(self, max_traces: int = 10000, service_name: str = "alpaca"):
+        self.service_name = service_name
+        self.traces: Deque[Dict[str, Any]] = deque(maxlen=max_traces)
+
+    def export(self, trace: Trace) -> None:
+        self.traces.append(otlp(trace, self.service_name))
+
+    def spans(self) -> List[Dict[str, Any]]:
+        return [
+            span
+            for trace in self.traces
+            for resource_spans in trace["resourceSpans"]
+            for scope_spans in resource_spans["scopeSpans"]
+            for span in scope_spans["spans"]
+        ]
+
+
+class FileExporter:
+    """Appends traces to ``path`` as OTLP/JSON lines.
+
+    One ``ExportTraceServiceRequest`` is written per request, the layout
+    the OpenTelemetry Collector's file exporter and receiver use. Traces are
+    converted and written on a background thread, and at most ``max_queued``
+    wait for it before new ones are dropped and counted in ``dropped``.
+    """
+
+    def __init__(
+        self, path: str, service_name: str = "alpaca", max_queued: int = 10000
+    ):
+        self.path = path
+        self.service_name = service_name
+        self.max_queued = max_queued
+        self.dropped = 0
+        self._queue: "queue.SimpleQueue[Optional[Trace]]" = queue.SimpleQueue()
+        self._thread = threading.Thread(
+            target=self._write, name="alpaca-trace-writer", daemon=True
+        )
+        self._thread.start()
+
+    def export(self, trace: Trace) -> None:
+        if self._queue.qsize() >= self.max_queued:
+            self.dropped += 1
+            return
+
+        self._queue.put(trace)
+
+    def _write(self) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            while True:
+                trace = self._queue.get()
+                if trace is None:
+                    break
+
+                f.write(json.dumps(otlp(trace, self.service_name)) + "\n")
+                if self._queue.empty():
+                    f.flush()
+
+    def close(self, timeout: float = 1.0) -> None:
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+
+class TracingMiddleware:
+    """Records a trace of every HTTP request and hands it to ``exporter``.
+
+    Device lookups, driver calls and response encoding add their spans to
+    the trace of the request they serve through ``current_trace``.
+    """
+
+    def __init__(self, app: ASGIApp, exporter: Exporter):
+        self.app = app
+        self.exporter = exporter
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        trace = Trace()
+        status = 500
+
+        async def _send(message: Message):
+            nonlocal status
+
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+            await send(message)
+
+        token = current_trace.set(trace)
+        try:
+            await self.app(scope, receive, _send)
+        finally:
+            current_trace.reset(token)
+            trace.end = now()
+
+            # The router leaves the matched route in the scope.
+            route = getattr(scope.get("route"), "path", None)
+            trace.name = f"{scope['method']} {route or scope['path']}"
+            trace.attributes = {
+                "http.request.method": scope["method"],
+                "url.path": scope["path"],
+                "http.response.status_code": status,
+            }
+            if route is not None:
+                trace.attributes["http.route"] = route
+
+            self.exporter.export(trace)
@@ -0,0 +1,22 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+from starlette.types import ASGIApp
+
+
+async def request(
+    app: ASGIApp,
+    method: str,
+    path: str,
+    params: Optional[Dict[str, Any]] = None,
+    form: Optional[Dict[str, Any]] = None,
+    headers: Optional[List[Tuple[str, str]]] = None,
+) -> Tuple[int, bytes]:
+    """Send one request to ``app`` in-process and return its status and body."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.request(
+            method, path, params=params, data=form, headers=headers
+        )
+
+    return response.status_code, response.content
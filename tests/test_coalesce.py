@@ -0,0 +1,56 @@
+import asyncio
+import threading
+
+from python_alpaca_server.coalesce import SingleFlight
+from python_alpaca_server.devices.focuser import Focuser
+from python_alpaca_server.dispatch import DeviceDispatcher
+from python_alpaca_server.request import CommonRequest, PutPositionRequest
+from python_alpaca_server.simulators import simulated_class
+
+
+class _Focuser(simulated_class(Focuser)):
+    def __init__(self, unique_id: str):
+        super().__init__(unique_id)
+        self.position = 0
+        self.reading = threading.Event()
+        self.release = threading.Event()
+
+    def get_position(self, req: CommonRequest) -> int:
+        position = self.position
+        self.reading.set()
+        self.release.wait(5)
+        return position
+
+    def put_move(self, req: PutPositionRequest) -> None:
+        self.position = req.Position
+
+
+def test_reads_after_a_command_do_not_join_an_earlier_read():
+    async def run():
+        device = _Focuser("focuser")
+        dispatcher = DeviceDispatcher()
+        dispatcher.single_flight = SingleFlight()
+        loop = asyncio.get_running_loop()
+
+        try:
+            first = asyncio.ensure_future(
+                dispatcher.call(device.get_position, CommonRequest())
+            )
+            await loop.run_in_executor(None, device.reading.wait, 5)
+
+            move = asyncio.ensure_future(
+                dispatcher.call(device.put_move, PutPositionRequest(Position=5))
+            )
+            await asyncio.sleep(0)
+            second = asyncio.ensure_future(
+                dispatcher.call(device.get_position, CommonRequest())
+            )
+            await asyncio.sleep(0)
+
+            device.release.set()
+            return await first, await move, await second
+        finally:
+            device.release.set()
+            dispatcher.shutdown()
+
+    assert asyncio.run(run()) == (0, None, 5)
@@ -0,0 +1,45 @@
+import array
+import asyncio
+import struct
+
+import pytest
+
+from python_alpaca_server.app import AlpacaServer, Description
+from python_alpaca_server.devices.camera import Camera
+from python_alpaca_server.request import CommonRequest
+from python_alpaca_server.simulators import simulated_class
+from tests.client import request
+
+_header = struct.Struct("<iiIIiiiiiii")
+
+
+class _Camera(simulated_class(Camera)):
+    def get_imagearray(self, req: CommonRequest) -> memoryview:
+        return memoryview(array.array("H", range(6))).cast("B").cast("H", (3, 2))
+
+
+@pytest.mark.parametrize("client_transaction_id", [1, 2**33 + 5, -1])
+def test_imagebytes_header_fits_any_client_transaction_id(client_transaction_id):
+    description = Description(
+        ServerName="test",
+        Manufacturer="test",
+        ManufacturerVersion="1",
+        Location="here",
+    )
+    app = AlpacaServer(description, [_Camera("camera")]).create_app(8000)
+
+    status, body = asyncio.run(
+        request(
+            app,
+            "GET",
+            "/api/v1/camera/0/imagearray",
+            {"ClientTransactionID": client_transaction_id},
+            headers=[("accept", "application/imagebytes")],
+        )
+    )
+
+    assert status == 200
+    header = _header.unpack_from(body)
+    assert header[1] == 0
+    assert header[2] == client_transaction_id & 0xFFFFFFFF
+    assert header[8:10] == (3, 2)
@@ -0,0 +1,98 @@
+import asyncio
+import re
+from typing import Any, Dict, List, Tuple
+
+import pytest
+from fastapi import FastAPI
+from starlette.routing import Route
+from starlette.types import ASGIApp
+
+from python_alpaca_server.api.method_table import _MethodTable
+from python_alpaca_server.app import AlpacaServer, Description
+from python_alpaca_server.simulators import simulated_devices
+from tests.client import request
+
+PARAMS = {
+    "ClientID": 1,
+    "ClientTransactionID": 1,
+    "Action": "a",
+    "Parameters": "p",
+    "Connected": "true",
+    "Position": 10,
+    "Azimuth": 10,
+    "Brightness": 1,
+    "Id": 0,
+    "Value": 1,
+    "State": "true",
+    "Name": "n",
+    "Reverse": "false",
+    "TempComp": 0,
+}
+
+# Parts of a response that differ between any two requests.
+_varying = re.compile(rb'"ServerTransactionID":\d+|"TimeStamp","Value":"[^"]*"')
+
+
+def _create_app(single_route: bool) -> FastAPI:
+    description = Description(
+        ServerName="test",
+        Manufacturer="test",
+        ManufacturerVersion="1",
+        Location="here",
+    )
+    server = AlpacaServer(description, simulated_devices(1), single_route=single_route)
+
+    return server.create_app(8000)
+
+
+def _requests() -> List[Tuple[str, str]]:
+    """Every method of every method table, plus ones no table serves."""
+    requests: List[Tuple[str, str]] = []
+
+    for route in _create_app(True).routes:
+        if not isinstance(route, Route) or not isinstance(route.endpoint, _MethodTable):
+            continue
+
+        url_device_type = route.endpoint.url_device_type.value
+        for url_method in sorted(route.endpoint.routes.keys() | {"unknown"}):
+            for device_number in ("0", "1", "abc"):
+                path = f"/api/v1/{url_device_type}/{device_number}/{url_method}"
+                for http_verb in ("GET", "PUT", "POST"):
+                    requests.append((http_verb, path))
+
+    requests.append(("GET", "/api/v1/telescope/0/connected"))
+    requests.append(("GET", "/api/v1/unknown/0/connected"))
+
+    return requests
+
+
+async def _responses(
+    app: ASGIApp,
+    requests: List[Tuple[str, str]],
+    params: Dict[str, Any],
+    form: Dict[str, Any],
+) -> List[Tuple[int, bytes]]:
+    responses = []
+    for http_verb, path in requests:
+        status, body = await request(app, http_verb, path, params=params, form=form)
+        responses.append((status, _varying.sub(b"", body)))
+
+    return responses
+
+
+@pytest.mark.parametrize(
+    "params,form",
+    [({}, {}), (PARAMS, {}), ({}, PARAMS), (PARAMS, PARAMS)],
+    ids=["none", "query", "form", "both"],
+)
+def test_single_route_matches_per_endpoint_routes(params, form):
+    requests = _requests()
+
+    async def compare() -> None:
+        per_endpoint = await _responses(_create_app(False), requests, params, form)
+        single_route = await _responses(_create_app(True), requests, params, form)
+
+        for r, expected, actual in zip(requests, per_endpoint, single_route):
+            assert actual == expected, r
+
+    asyncio.run(compare())
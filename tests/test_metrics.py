@@ -0,0 +1,20 @@
+from python_alpaca_server.metrics import _endpoint_labels
+
+
+def test_device_number_label_is_normalized():
+    for device_number in ("0", "00", "000"):
+        path = f"/api/v1/focuser/{device_number}/position"
+        assert _endpoint_labels(path, 200) == ("focuser", "0", "position")
+
+
+def test_unmatched_paths_share_a_label():
+    assert _endpoint_labels("/api/v1/focuser/7/position", 404) == (
+        "",
+        "",
+        "unmatched",
+    )
+    assert _endpoint_labels("/api/v1/focuser/x/position", 400) == (
+        "",
+        "",
+        "unmatched",
+    )
@@ -0,0 +1,48 @@
+import asyncio
+
+import pytest
+
+from python_alpaca_server.app import AlpacaServer, Description
+from python_alpaca_server.multiprocess import DeviceClient, DeviceOwner
+from python_alpaca_server.request import CommonRequest
+from python_alpaca_server.simulators import simulated_devices
+
+AUTHKEY = b"k" * 32
+
+
+def _server() -> AlpacaServer:
+    description = Description(
+        ServerName="test",
+        Manufacturer="test",
+        ManufacturerVersion="1",
+        Location="here",
+    )
+
+    return AlpacaServer(description, simulated_devices(1))
+
+
+async def _call(authkey: bytes) -> str:
+    server = _server()
+    ipc_server = await asyncio.start_server(
+        DeviceOwner(server, AUTHKEY).handle, "127.0.0.1", 0
+    )
+    address = ipc_server.sockets[0].getsockname()[:2]
+
+    try:
+        client = DeviceClient(address, authkey)
+        return await asyncio.wait_for(
+            client.call(0, "get_name", CommonRequest()), timeout=5
+        )
+    finally:
+        ipc_server.close()
+        await ipc_server.wait_closed()
+        server.dispatcher.shutdown()
+
+
+def test_owner_runs_calls_signed_with_its_key():
+    assert asyncio.run(_call(AUTHKEY)) == "simulated"
+
+
+def test_owner_closes_connections_with_another_key():
+    with pytest.raises(ConnectionError):
+        asyncio.run(_call(b"x" * 32))
@@ -0,0 +1,184 @@
+import asyncio
+import threading
+import time
+
+from python_alpaca_server.device import DeviceType, OperationHandle
+from python_alpaca_server.devices.covercalibrator import CoverCalibrator, CoverState
+from python_alpaca_server.devices.focuser import Focuser
+from python_alpaca_server.devices.rotator import AsyncRotator
+from python_alpaca_server.dispatch import DeviceDispatcher
+from python_alpaca_server.errors import DriverError
+from python_alpaca_server.operations import progress
+from python_alpaca_server.request import (
+    CommonRequest,
+    PutBrightnessRequest,
+    PutPositionFloatRequest,
+    PutPositionRequest,
+)
+from python_alpaca_server.simulators import simulated_class
+
+
+class _CoverCalibrator(simulated_class(CoverCalibrator)):
+    def get_coverstate(self, req: CommonRequest) -> CoverState:
+        return CoverState.Closed
+
+    def put_opencover(self, req: CommonRequest) -> None:
+        self.start_operation(asyncio.sleep(10))
+
+    def put_calibratoron(self, req: PutBrightnessRequest) -> None:
+        self.start_operation(asyncio.sleep(10))
+
+
+def _run(test, device):
+    async def run():
+        dispatcher = DeviceDispatcher()
+        try:
+            return await test(dispatcher, device)
+        finally:
+            dispatcher.shutdown()
+
+    return asyncio.run(run())
+
+
+def test_only_the_stop_for_a_motion_cancels_it():
+    async def test(dispatcher, device):
+        req = CommonRequest()
+        states = []
+
+        await dispatcher.call(device.put_opencover, req)
+        states.append(await dispatcher.call(device.get_coverstate, req))
+
+        await dispatcher.call(device.put_calibratoroff, req)
+        states.append(await dispatcher.call(device.get_coverstate, req))
+
+        await dispatcher.call(device.put_haltcover, req)
+        states.append(await dispatcher.call(device.get_coverstate, req))
+
+        return states
+
+    assert _run(test, _CoverCalibrator("cover")) == [
+        CoverState.Moving,
+        CoverState.Moving,
+        CoverState.Closed,
+    ]
+
+
+class _AsyncRotator(simulated_class(AsyncRotator)):
+    async def put_move(self, req: PutPositionFloatRequest) -> None:
+        self.start_operation(asyncio.sleep(10), {"get_position": 1.0})
+        await asyncio.sleep(0.1)
+
+    async def put_moveabsolute(self, req: PutPositionFloatRequest) -> None:
+        await asyncio.sleep(0.02)
+        self.start_operation(asyncio.sleep(10), {"get_position": 2.0})
+        raise DriverError(req, "rotator stalled")
+
+
+def test_overlapping_puts_keep_their_own_operations():
+    async def test(dispatcher, device):
+        req = PutPositionFloatRequest(Position=10)
+
+        move = asyncio.ensure_future(dispatcher.call(device.put_move, req))
+        try:
+            await dispatcher.call(device.put_moveabsolute, req)
+        except DriverError:
+            pass
+        await move
+
+        return await dispatcher.call(device.get_position, CommonRequest())
+
+    # The failed moveabsolute drops only the operation it started.
+    assert _run(test, _AsyncRotator("rotator")) == 1.0
+
+
+# How long one exchange with the focuser controller takes.
+STEP = 0.02
+
+
+class _Focuser(simulated_class(Focuser)):
+    def __init__(self, unique_id: str):
+        super().__init__(unique_id)
+        self.exchanging = threading.Lock()
+        self.overlapped = False
+        self.moving = threading.Event()
+        self.stopped = threading.Event()
+
+    def _exchange(self) -> None:
+        held = self.exchanging.acquire(blocking=False)
+        self.overlapped = self.overlapped or not held
+        time.sleep(STEP)
+        if held:
+            self.exchanging.release()
+
+    def _move(self, handle: OperationHandle) -> None:
+        self.moving.set()
+        while not handle.cancelled.is_set():
+            with handle.hold():
+                self._exchange()
+        time.sleep(0.05)
+        self.stopped.set()
+
+    def put_move(self, req: PutPositionRequest) -> None:
+        handle = self.start_operation(lambda: self._move(handle))
+
+    def get_ismoving(self, req: CommonRequest) -> bool:
+        return False
+
+    def get_position(self, req: CommonRequest) -> int:
+        self._exchange()
+        return 1
+
+
+def test_blocking_operations_hold_the_device_a_step_at_a_time():
+    async def test(dispatcher, device):
+        req = CommonRequest()
+        loop = asyncio.get_running_loop()
+
+        await dispatcher.call(device.put_move, PutPositionRequest(Position=5))
+        await loop.run_in_executor(None, device.moving.wait, 5)
+
+        latencies = []
+        for _ in range(5):
+            start = time.perf_counter()
+            await asyncio.wait_for(dispatcher.call(device.get_position, req), 1)
+            latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.wait_for(dispatcher.call(device.put_halt, req), 1)
+        latencies.append(time.perf_counter() - start)
+
+        await loop.run_in_executor(None, device.stopped.wait, 5)
+        return latencies
+
+    device = _Focuser("focuser")
+    latencies = _run(test, device)
+
+    # Each call waits for the step in progress and its own, not the move.
+    assert max(latencies) < STEP * 4
+    assert not device.overlapped
+
+
+def test_cancelled_blocking_operations_are_reported_until_they_return():
+    async def test(dispatcher, device):
+        req = CommonRequest()
+        loop = asyncio.get_running_loop()
+
+        await dispatcher.call(device.put_move, PutPositionRequest(Position=5))
+        await loop.run_in_executor(None, device.moving.wait, 5)
+
+        dispatcher.operations.cancel(device, "put_halt")
+        moving = await dispatcher.call(device.get_ismoving, req)
+        await loop.run_in_executor(None, device.stopped.wait, 5)
+        await asyncio.sleep(0.01)
+
+        return moving, await dispatcher.call(device.get_ismoving, req)
+
+    assert _run(test, _Focuser("focuser")) == (True, False)
+
+
+def test_only_listed_operations_report_progress():
+    assert progress(DeviceType.Telescope, "put_pulseguide") == {
+        "get_ispulseguiding": True
+    }
+    assert progress(DeviceType.Camera, "put_pulseguide") == {"get_ispulseguiding": True}
+    assert progress(DeviceType.Camera, "put_cooleron") == {}
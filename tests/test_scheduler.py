@@ -0,0 +1,94 @@
+import asyncio
+import time
+
+from python_alpaca_server.devices.focuser import Focuser
+from python_alpaca_server.dispatch import DeviceDispatcher
+from python_alpaca_server.request import CommonRequest
+from python_alpaca_server.scheduler import CommandQueue, Priority
+from python_alpaca_server.simulators import simulated_class
+
+
+def test_waiting_calls_run_by_priority_and_none_fail():
+    async def run():
+        queue = CommandQueue()
+        order = []
+
+        async def call(priority: Priority, name: str) -> None:
+            await queue.acquire(priority)
+            order.append(name)
+            queue.release()
+
+        await queue.acquire(Priority.READ)
+        calls = [
+            asyncio.ensure_future(call(Priority.READ, "get_position")),
+            asyncio.ensure_future(call(Priority.WRITE, "put_connected")),
+            asyncio.ensure_future(call(Priority.STOP, "put_halt")),
+            asyncio.ensure_future(call(Priority.WRITE, "put_move")),
+        ]
+        await asyncio.sleep(0)
+        queue.release()
+
+        await asyncio.gather(*calls)
+        return order
+
+    assert asyncio.run(run()) == [
+        "put_halt",
+        "put_connected",
+        "put_move",
+        "get_position",
+    ]
+
+
+# How long one query of the focuser controller takes.
+QUERY = 0.01
+
+
+class _Request(CommonRequest):
+    # Gives each read its own arguments, so the queue cannot share them.
+    Index: int
+
+
+class _Focuser(simulated_class(Focuser)):
+    def __init__(self, unique_id: str):
+        super().__init__(unique_id)
+        self.calls = 0
+
+    def get_position(self, req: CommonRequest) -> int:
+        self.calls += 1
+        time.sleep(QUERY)
+        return 1000
+
+    def put_halt(self, req: CommonRequest) -> None:
+        self.calls += 1
+        time.sleep(QUERY)
+
+
+def test_a_halt_does_not_wait_behind_queued_reads():
+    async def run():
+        dispatcher = DeviceDispatcher()
+        device = _Focuser("focuser")
+        try:
+            reads = [
+                asyncio.ensure_future(
+                    dispatcher.call(device.get_position, _Request(Index=i))
+                )
+                for i in range(101)
+            ]
+            # Let the first read take the device and the rest queue behind it.
+            await asyncio.sleep(QUERY / 2)
+
+            start = time.perf_counter()
+            await dispatcher.call(device.put_halt, CommonRequest())
+            halted = time.perf_counter() - start
+            calls = device.calls
+
+            await asyncio.gather(*reads)
+            return halted, calls
+        finally:
+            dispatcher.shutdown()
+
+    halted, calls = asyncio.run(run())
+
+    # The halt waits for the read in progress, not the 100 queued behind it.
+    assert halted < QUERY * 5
+    assert calls < 5